@@ -0,0 +1 @@
+"""Benchmarks for OMDB API Python Wrapper."""
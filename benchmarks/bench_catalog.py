@@ -0,0 +1,75 @@
+"""Local catalog: ingest throughput and lookup latency.
+
+Writes an NDJSON dump of synthetic records, streams it into a fresh catalog and
+times ID lookups, title lookups and searches answered locally.
+
+Usage:
+    python -m benchmarks.bench_catalog [--records N] [--queries N]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from omdb_api.catalog import Catalog
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+# Title words follow a Zipf-like distribution over a fixed vocabulary, like real titles
+VOCABULARY = [f"word{n}" for n in range(5000)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def _write_dump(path, n, rng):
+    with open(path, "w", encoding="utf-8") as stream:
+        for i in range(n):
+            record = dict(EXAMPLE)
+            record["imdbID"] = f"tt{i:07d}"
+            record["Title"] = " ".join(rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(1, 4)))
+            record["Year"] = str(1950 + i % 75)
+            record["imdbVotes"] = f"{rng.randrange(1, 2000000):,}"
+            stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def _time(label, queries, fn):
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {elapsed / len(queries) * 1e6:9.1f} us/query")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=5000)
+    options = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        dump = os.path.join(directory, "dump.ndjson")
+        _write_dump(dump, options.records, rng)
+        catalog = Catalog(os.path.join(directory, "catalog.sqlite3"))
+
+        start = time.perf_counter()
+        stored = catalog.ingest(dump)
+        elapsed = time.perf_counter() - start
+        print(f"ingest         {stored} records in {elapsed:6.2f} s  ({stored / elapsed:8.0f} records/s)")
+
+        ids = [f"tt{rng.randrange(options.records):07d}" for _ in range(options.queries)]
+        titles = [catalog.get(movie_id=movie_id)["Title"] for movie_id in ids]
+        _time("get by id", ids, lambda movie_id: catalog.answer({"i": movie_id}))
+        _time("get by title", titles, lambda title: catalog.answer({"t": title}))
+        _time("search 1 word", [title.split()[0] for title in titles],
+              lambda query: catalog.answer({"s": query, "type": "movie"}))
+        _time("search 2 words", [" ".join(title.split()[:2]) for title in titles],
+              lambda query: catalog.answer({"s": query, "type": "movie"}))
+        catalog.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""Cold versus warm batch runs sharing an on-disk cache.
+
+Every run builds a fresh client and cache handle on the same directory, the way
+separate CLI invocations or worker processes would.
+
+Usage:
+    python -m benchmarks.bench_disk_cache [--ids N] [--runs N] [--latency SECONDS]
+"""
+
+import argparse
+import tempfile
+import time
+
+from benchmarks.stub_server import StubServer
+from omdb_api.cache import SqliteCache
+from omdb_api.client import OmdbClient
+
+
+def _batch_run(url, cache_dir, ids):
+    cache = SqliteCache(cache_dir)
+    start = time.perf_counter()
+    with OmdbClient(base_url=url, cache=cache) as client:
+        for movie_id in ids:
+            client.request({"i": movie_id, "r": "json", "plot": "short", "apikey": "bench"})
+    elapsed = time.perf_counter() - start
+    cache.close()
+    return elapsed, cache.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="simulated upstream latency per request (seconds)")
+    options = parser.parse_args(argv)
+
+    ids = [f"tt{n:07d}" for n in range(options.ids)]
+    with StubServer(latency=options.latency) as stub, tempfile.TemporaryDirectory() as cache_dir:
+        for run in range(options.runs):
+            before = stub.request_count
+            elapsed, stats = _batch_run(stub.url, cache_dir, ids)
+            label = "cold" if run == 0 else "warm"
+            print(f"run {run + 1} ({label}): {elapsed:7.3f} s  {elapsed / len(ids) * 1e6:9.1f} us/lookup  "
+                  f"upstream={stub.request_count - before}  hits={stats['hits']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
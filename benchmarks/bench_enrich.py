@@ -0,0 +1,45 @@
+"""Normalization throughput: one process versus the enrich process pool.
+
+Usage:
+    python -m benchmarks.bench_enrich [--records N] [--chunk-size N] [--workers 1,2,4]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from omdb_api.enrich import enrich_records, normalize_chunk
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+
+
+def _records(count):
+    # Generated lazily, like a backfill streaming from the network or a dump
+    for n in range(count):
+        yield dict(EXAMPLE, imdbID=f"tt{n:07d}", imdbVotes=f"{n:,}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", default="1,2,4")
+    options = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = len(normalize_chunk(_records(options.records)))
+    serial = time.perf_counter() - start
+    print(f"{'serial':<10} {rows / serial:10.0f} records/s")
+
+    for workers in (int(value) for value in options.workers.split(",")):
+        start = time.perf_counter()
+        rows = sum(len(batch) for batch in enrich_records(_records(options.records), max_workers=workers,
+                                                          chunk_size=options.chunk_size))
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>2} workers {rows / elapsed:10.0f} records/s  {serial / elapsed:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
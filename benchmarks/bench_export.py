@@ -0,0 +1,57 @@
+"""Columnar export: scalar versus vectorized parsing, and write throughput per format.
+
+Usage:
+    python -m benchmarks.bench_export [--records N] [--batch-size N]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from omdb_api import export
+from omdb_api.models import parse_float, parse_int, parse_year
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+SCALAR_PARSERS = {export.YEAR: parse_year, export.INTEGER: parse_int, export.FLOAT: parse_float}
+
+
+def _records(count):
+    for n in range(count):
+        yield dict(EXAMPLE, imdbID=f"tt{n:07d}", imdbVotes=f"{n:,}", Year=str(1900 + n % 125))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=export.DEFAULT_BATCH_SIZE)
+    options = parser.parse_args(argv)
+
+    records = list(_records(options.records))
+    export.parse_numeric(["1"], export.INTEGER)  # import NumPy outside the measurements
+    for field, kind in export.NUMERIC_FIELDS.items():
+        values = [record[field] for record in records]
+        start = time.perf_counter()
+        [SCALAR_PARSERS[kind](value) for value in values]
+        scalar = time.perf_counter() - start
+        start = time.perf_counter()
+        export.parse_numeric(values, kind)
+        vector = time.perf_counter() - start
+        print(f"{field:<11} scalar={scalar:6.3f} s  vectorized={vector:6.3f} s  {scalar / vector:5.2f}x")
+
+    formats = ["npz"] + (["parquet", "arrow"] if export._has_pyarrow() else [])
+    with tempfile.TemporaryDirectory() as directory:
+        for name in formats:
+            path = os.path.join(directory, f"movies.{name}")
+            start = time.perf_counter()
+            export.export_records(records, path, batch_size=options.batch_size)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path) / len(records)
+            print(f"{name:<8} {len(records) / elapsed:10.0f} records/s  {size:6.0f} bytes/record")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+"""Import-time budget for ``import omdb_api``.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+reports the module's cumulative import time (median of the runs) and any heavy
+dependency it pulled in. Exits with status 1 when the time exceeds the budget
+or a heavy dependency is imported eagerly, so it can gate CI.
+
+Usage:
+    python -m benchmarks.bench_import [--module omdb_api] [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+DEFAULT_BUDGET_MS = 20.0
+
+# Dependencies that must only be imported on first use
+HEAVY_MODULES = ("requests", "urllib3", "dotenv", "asyncio", "aiohttp", "sqlite3", "concurrent.futures")
+
+
+def _run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def import_time_us(module="omdb_api"):
+    """Return the cumulative import time of ``module`` in microseconds, measured in a fresh interpreter."""
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def heavy_imports(module="omdb_api"):
+    """Return the :data:`HEAVY_MODULES` loaded as a side effect of importing ``module``."""
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    return _run(code).stdout.split()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="omdb_api")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    options = parser.parse_args(argv)
+
+    elapsed_ms = statistics.median(import_time_us(options.module) for _ in range(options.runs)) / 1000
+    heavy = heavy_imports(options.module)
+    print(f"import {options.module}: {elapsed_ms:.2f} ms (budget {options.budget_ms:.2f} ms)")
+    if heavy:
+        print(f"eagerly imported: {', '.join(heavy)}")
+
+    if elapsed_ms > options.budget_ms or heavy:
+        print("FAIL: import-time budget exceeded")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""JSON decoding cost per response: response.json() versus the decoding backends.
+
+Decodes realistic payloads (a full-plot record and a 10-hit search page) with
+``requests``' own ``response.json()``, with every installed backend straight
+from the body bytes, and with the incremental search parser.
+
+Usage:
+    python -m benchmarks.bench_json [--decodes N]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import requests
+
+from omdb_api import decoding
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+
+
+def _payloads():
+    record = dict(EXAMPLE, Plot=EXAMPLE["Plot"] * 8)
+    page = {
+        "Search": [
+            {"Title": f"{EXAMPLE['Title']} {n}", "Year": EXAMPLE["Year"], "imdbID": f"tt{n:07d}",
+             "Type": "movie", "Poster": EXAMPLE["Poster"]}
+            for n in range(10)
+        ],
+        "totalResults": "4213",
+        "Response": "True",
+    }
+    return {"full record": json.dumps(record).encode(), "search page": json.dumps(page).encode()}
+
+
+def _response(body):
+    response = requests.models.Response()
+    response._content = body
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def _measure(decode, body, decodes):
+    start = time.perf_counter()
+    for _ in range(decodes):
+        decode(body)
+    return (time.perf_counter() - start) / decodes * 1e6
+
+
+def _incremental(body):
+    # Chunked like response.iter_content(1024)
+    return list(decoding.iter_search_entries(body[i:i + 1024] for i in range(0, len(body), 1024)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decodes", type=int, default=20000)
+    options = parser.parse_args(argv)
+
+    installed = []
+    for name in decoding.BACKENDS:
+        try:
+            installed.append((name, decoding._import_backend(name)))
+        except ImportError:
+            print(f"{name}: not installed")
+
+    for label, body in _payloads().items():
+        print(f"{label} ({len(body)} bytes)")
+        baseline = _measure(lambda data: _response(data).json(), body, options.decodes)
+        print(f"  {'response.json()':<18} {baseline:8.2f} us")
+        for name, loads in installed:
+            elapsed = _measure(loads, body, options.decodes)
+            print(f"  {name + ' (bytes)':<18} {elapsed:8.2f} us  {baseline / elapsed:5.2f}x")
+        if label == "search page":
+            elapsed = _measure(_incremental, body, options.decodes)
+            print(f"  {'incremental':<18} {elapsed:8.2f} us  {baseline / elapsed:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
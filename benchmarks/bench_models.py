@@ -0,0 +1,57 @@
+"""Memory per record: raw OMDB dicts versus slotted models.
+
+Usage:
+    python -m benchmarks.bench_models [--records N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from omdb_api.models import Movie
+
+EXAMPLE = (Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text()
+
+
+def _payload(n):
+    # A distinct payload per record, as separate responses would be
+    record = json.loads(EXAMPLE)
+    record["imdbID"] = f"tt{n:07d}"
+    record["imdbVotes"] = f"{n:,}"
+    return json.dumps(record)
+
+
+def _measure(label, build, payloads):
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [build(json.loads(payload)) for payload in payloads]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<8} {size / len(records):8.0f} bytes/record  build={elapsed:6.3f} s")
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50000)
+    options = parser.parse_args(argv)
+
+    payloads = [_payload(n) for n in range(options.records)]
+    _measure("dict", lambda data: data, payloads)
+    movies = _measure("Movie", Movie, payloads)
+
+    start = time.perf_counter()
+    total = sum(movie.imdb_votes for movie in movies)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    assert sum(movie.imdb_votes for movie in movies) == total
+    cached = time.perf_counter() - start
+    print(f"imdb_votes first access={first:6.3f} s  cached={cached:6.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
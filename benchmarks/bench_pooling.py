@@ -0,0 +1,56 @@
+"""Per-call latency with and without connection pooling.
+
+Usage:
+    python -m benchmarks.bench_pooling [--calls N] [--connect-delay SECONDS]
+"""
+
+import argparse
+import statistics
+import time
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from omdb_api.client import OmdbClient
+
+
+def _measure(fetch, calls):
+    latencies = []
+    for n in range(calls):
+        start = time.perf_counter()
+        fetch({"i": f"tt{n:07d}", "r": "json", "apikey": "bench"})
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label, latencies):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{label:<12} p50={p50:7.3f} ms  p99={p99:7.3f} ms  total={sum(latencies):6.3f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--connect-delay", type=float, default=0.002,
+                        help="simulated handshake cost per new connection (seconds)")
+    options = parser.parse_args(argv)
+
+    with StubServer(connect_delay=options.connect_delay) as stub:
+        unpooled = _measure(lambda params: requests.get(stub.url, params=params).json(), options.calls)
+        connections = stub.connection_count
+        _report("unpooled", unpooled)
+        print(f"{'':<12} connections opened: {connections}")
+
+        with OmdbClient(base_url=stub.url) as client:
+            pooled = _measure(client.request, options.calls)
+        _report("pooled", pooled)
+        print(f"{'':<12} connections opened: {stub.connection_count - connections}")
+
+    print(f"speedup: {statistics.median(unpooled) / statistics.median(pooled):.2f}x (median)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""Load test of the caching proxy: a fleet of workers against upstream directly and through omdb-proxy.
+
+Every worker has its own client, as separate services would. The workers
+look up a small set of hot titles (and a tail of cold ones) once straight
+against the stub upstream and once through a proxy in front of it.
+
+Usage:
+    python -m benchmarks.bench_proxy [--workers N] [--requests N] [--titles N] [--latency SECONDS]
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from benchmarks.stub_server import StubServer
+from omdb_api.client import OmdbClient
+from omdb_api.proxy import ProxyServer, build_client
+
+
+def _fleet(url, workers, requests, titles, seed):
+    """Run ``workers`` threads of ``requests`` lookups each and return every latency."""
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(workers)
+
+    def worker(n):
+        rng = random.Random(seed + n)
+        own = []
+        with OmdbClient(base_url=url) as client:
+            barrier.wait()
+            for _ in range(requests):
+                # Four lookups in five go to the first tenth of the titles
+                hot = rng.random() < 0.8
+                title = rng.randrange(max(1, titles // 10)) if hot else rng.randrange(titles)
+                start = time.perf_counter()
+                client.request({"i": f"tt{title:07d}", "r": "json", "apikey": "worker"})
+                own.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def _report(label, latencies, elapsed, upstream):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{label:<8} p50={p50:7.3f} ms  p99={p99:7.3f} ms  "
+          f"throughput={len(latencies) / elapsed:8.1f} req/s  upstream={upstream:6d}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50, help="lookups per worker")
+    parser.add_argument("--titles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="simulated upstream latency per request (seconds)")
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(argv)
+    args = (options.workers, options.requests, options.titles, options.seed)
+
+    with StubServer(latency=options.latency) as stub:
+        start = time.perf_counter()
+        direct = _fleet(stub.url, *args)
+        _report("direct", direct, time.perf_counter() - start, stub.request_count)
+
+        before = stub.request_count
+        client = build_client(upstream=stub.url, pool_maxsize=options.workers)
+        with ProxyServer(client, api_key="bench", port=0) as proxy:
+            start = time.perf_counter()
+            proxied = _fleet(proxy.url, *args)
+            _report("proxy", proxied, time.perf_counter() - start, stub.request_count - before)
+        print(f"{'':<8} cache hits={client.cache.hits}  coalesced={client.single_flight.shared}")
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Upstream calls saved by request coalescing under a thundering herd.
+
+A herd of threads (or coroutines) asks for the same few titles at the same
+moment, once without and once with single-flight deduplication.
+
+Usage:
+    python -m benchmarks.bench_singleflight [--callers N] [--titles N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from benchmarks.stub_server import StubServer
+from omdb_api.client import OmdbClient
+from omdb_api.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _thread_herd(client, callers, titles):
+    barrier = threading.Barrier(callers)
+
+    def worker(n):
+        barrier.wait()
+        client.request({"t": f"Trending {n % titles}", "r": "json", "apikey": "bench"})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(callers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _async_herd(url, callers, titles, single_flight):
+    from omdb_api.async_client import AsyncOmdbClient
+
+    async def run():
+        async with AsyncOmdbClient(base_url=url, max_in_flight=callers, single_flight=single_flight) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                client.request({"t": f"Trending {n % titles}", "r": "json", "apikey": "bench"})
+                for n in range(callers)
+            ))
+            return time.perf_counter() - start
+
+    return asyncio.run(run())
+
+
+def _report(label, stub, before, elapsed, callers):
+    upstream = stub.request_count - before
+    print(f"{label:<24} upstream={upstream:5d}  saved={callers - upstream:5d}  elapsed={elapsed:6.3f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--titles", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="simulated upstream latency per request (seconds)")
+    options = parser.parse_args(argv)
+    callers, titles = options.callers, options.titles
+
+    with StubServer(latency=options.latency) as stub:
+        for label, single_flight in (("threads", None), ("threads + single-flight", SingleFlight())):
+            with OmdbClient(base_url=stub.url, pool_maxsize=callers, single_flight=single_flight) as client:
+                before = stub.request_count
+                _report(label, stub, before, _thread_herd(client, callers, titles), callers)
+
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            print("asyncio                  skipped: aiohttp is not installed")
+            return 0
+        for label, single_flight in (("asyncio", None), ("asyncio + single-flight", AsyncSingleFlight())):
+            before = stub.request_count
+            _report(label, stub, before, _async_herd(stub.url, callers, titles, single_flight), callers)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""End-to-end benchmark suite with stored baselines.
+
+Runs the real request path against a local OMDB stub and measures single-lookup
+latency, bulk ID throughput, paginated search and CLI end-to-end time. Results
+can be saved as a baseline and later runs checked against it; ``--check`` exits
+with status 1 when a metric regressed by more than ``--tolerance``, so the
+suite can gate CI.
+
+Usage:
+    python -m benchmarks.bench_suite [--scenario NAME ...] [--latency SECONDS] [--error-rate RATE]
+                                     [--plot-size CHARS] [--save-baseline] [--check] [--tolerance 0.5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubServer, make_responder
+from omdb_api import movie_search
+from omdb_api.bulk import get_many, iter_search
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.retry import RetryPolicy
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "suite.json"
+DEFAULT_TOLERANCE = 0.5
+
+# Runs a CLI command with BASE_URL pointed at the stub given as first argument
+_CLI = "import sys; from omdb_api import movie_search as m; m.BASE_URL = sys.argv[1]; sys.exit(m.main(sys.argv[2:]))"
+
+
+def _metric(value, unit, better="lower"):
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[max(0, int(round(q * len(values))) - 1)]
+
+
+def _client(stub, options, **kwargs):
+    retry = RetryPolicy(max_retries=5, backoff_factor=0.001, max_backoff=0.01) if options.error_rate else None
+    return OmdbClient(base_url=stub.url, retry=retry, **kwargs)
+
+
+def bench_single(stub, options):
+    """Latency of sequential get_movie_by_id_or_title calls through the shared client."""
+    latencies = []
+    previous = set_default_client(_client(stub, options))
+    try:
+        with patch.object(movie_search, "BASE_URL", stub.url):
+            for n in range(options.calls):
+                start = time.perf_counter()
+                movie_search.get_movie_by_id_or_title(movie_id=f"tt{n:07d}", plot="full")
+                latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        set_default_client(previous).close()
+    return {
+        "single.p50_ms": _metric(statistics.median(latencies), "ms"),
+        "single.p99_ms": _metric(_percentile(latencies, 0.99), "ms"),
+    }
+
+
+def bench_bulk(stub, options):
+    """Throughput of get_many over a batch of IDs."""
+    ids = [f"tt{n:07d}" for n in range(options.ids)]
+    with _client(stub, options, pool_maxsize=options.workers) as client:
+        start = time.perf_counter()
+        failed = sum(item.error is not None for item in get_many(ids, max_workers=options.workers, client=client))
+        elapsed = time.perf_counter() - start
+    if failed:
+        print(f"bulk: {failed} lookups failed", file=sys.stderr)
+    return {"bulk.ids_per_s": _metric(len(ids) / elapsed, "ids/s", better="higher")}
+
+
+def bench_paginated(stub, options):
+    """Time to walk every page of a search with iter_search."""
+    with _client(stub, options) as client:
+        start = time.perf_counter()
+        hits = sum(1 for _ in iter_search("Bench", client=client))
+        elapsed = time.perf_counter() - start
+    return {
+        "paginated.total_s": _metric(elapsed, "s"),
+        "paginated.hits_per_s": _metric(hits / elapsed, "hits/s", better="higher"),
+    }
+
+
+def bench_cli(stub, options):
+    """Wall time of CLI invocations in fresh interpreters, import and startup included."""
+    env = dict(os.environ, OMDB_API_KEY="bench")
+    commands = {
+        "cli.lookup_ms": ["--id", "tt0133093"],
+        "cli.all_pages_ms": ["--search", "Bench", "--page", "all", "--format", "ndjson"],
+    }
+    results = {}
+    for name, arguments in commands.items():
+        timings = []
+        for _ in range(options.cli_runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", _CLI, stub.url, *arguments], cwd=ROOT, env=env,
+                           stdout=subprocess.DEVNULL, check=True)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = _metric(statistics.median(timings), "ms")
+    return results
+
+
+SCENARIOS = {
+    "single": bench_single,
+    "bulk": bench_bulk,
+    "paginated": bench_paginated,
+    "cli": bench_cli,
+}
+
+
+def run(options):
+    """Run the selected scenarios against one stub server and return their metrics."""
+    responder = make_responder(total_results=options.total_results, plot_size=options.plot_size)
+    results = {}
+    with StubServer(responder, latency=options.latency, error_rate=options.error_rate, seed=0) as stub, \
+            patch.object(movie_search, "OMDB_API_KEY", "bench"):
+        for name in options.scenario:
+            results.update(SCENARIOS[name](stub, options))
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Return the metrics of ``results`` that regressed against ``baseline``.
+
+    Args:
+        results (dict): Metrics from :func:`run`.
+        baseline (dict): Metrics of an earlier run.
+        tolerance (float): Allowed relative slowdown, e.g. 0.5 for 50%.
+
+    Returns:
+        list: ``(name, baseline value, current value)`` for every regressed
+        metric present in both runs.
+    """
+    regressions = []
+    for name, metric in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None or not reference["value"]:
+            continue
+        if metric["better"] == "higher":
+            regressed = metric["value"] < reference["value"] * (1 - tolerance)
+        else:
+            regressed = metric["value"] > reference["value"] * (1 + tolerance)
+        if regressed:
+            regressions.append((name, reference["value"], metric["value"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run; repeat for several (default: all)")
+    parser.add_argument("--latency", type=float, default=0.002, help="stub latency per request (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub requests failing with 503")
+    parser.add_argument("--plot-size", type=int, default=1000, help="characters in every record's Plot")
+    parser.add_argument("--total-results", type=int, default=500, help="hits of the paginated search")
+    parser.add_argument("--calls", type=int, default=300, help="single lookups")
+    parser.add_argument("--ids", type=int, default=2000, help="IDs in the bulk batch")
+    parser.add_argument("--workers", type=int, default=16, help="bulk worker threads")
+    parser.add_argument("--cli-runs", type=int, default=5, help="runs per CLI command")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression against --baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    options = parser.parse_args(argv)
+    options.scenario = options.scenario or list(SCENARIOS)
+
+    results = run(options)
+    baseline = json.loads(options.baseline.read_text()) if options.baseline.exists() else {}
+    for name, metric in results.items():
+        reference = baseline.get(name)
+        change = f"  ({metric['value'] / reference['value'] - 1:+.0%} vs baseline)" if reference else ""
+        print(f"{name:<22} {metric['value']:>12.3f} {metric['unit']}{change}")
+
+    if options.save_baseline:
+        options.baseline.parent.mkdir(parents=True, exist_ok=True)
+        options.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {options.baseline}")
+    if options.check:
+        regressions = compare(results, baseline, options.tolerance)
+        for name, reference, value in regressions:
+            print(f"REGRESSION {name}: {reference} -> {value}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
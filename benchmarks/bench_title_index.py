@@ -0,0 +1,84 @@
+"""Title index query latency at scale.
+
+Builds a :class:`~omdb_api.title_index.TitleIndex` over synthetic titles drawn
+from a Zipf-like vocabulary and times exact, prefix, misspelled and filtered
+queries taken from indexed titles.
+
+Usage:
+    python -m benchmarks.bench_title_index [--titles N] [--queries N]
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import time
+
+from omdb_api.title_index import TitleIndex
+
+VOCABULARY_SIZE = 50000
+TYPES = ("movie", "movie", "movie", "series", "episode")
+
+
+def _vocabulary(rng):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+
+def _titles(rng, n, vocabulary):
+    cumulative = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(vocabulary))))
+    for i in range(n):
+        yield {
+            "Title": " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=rng.randint(1, 5))),
+            "Year": str(1920 + i % 105),
+            "imdbID": f"tt{i:08d}",
+            "Type": TYPES[i % len(TYPES)],
+            "Poster": "N/A",
+            "imdbVotes": str(rng.randrange(0, 2000000)),
+        }
+
+
+def _typo(word, rng):
+    position = rng.randrange(len(word))
+    return word[:position] + rng.choice("aeiou") + word[position + 1:]
+
+
+def _time(label, queries, search):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{label:<18} median={statistics.median(timings) * 1e3:8.3f} ms  p99={p99 * 1e3:8.3f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--titles", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=500)
+    options = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    vocabulary = _vocabulary(rng)
+    titles = list(_titles(rng, options.titles, vocabulary))
+    index = TitleIndex()
+    start = time.perf_counter()
+    index.add_many(titles)
+    print(f"indexed {len(index)} titles in {time.perf_counter() - start:6.2f} s")
+
+    samples = [rng.choice(titles)["Title"].split() for _ in range(options.queries)]
+    _time("exact words", [" ".join(words) for words in samples], index.search)
+    _time("prefix", [" ".join(words[:-1] + [words[-1][:3]]) for words in samples], index.search)
+    _time("misspelled", [" ".join(_typo(word, rng) for word in words) for words in samples], index.search)
+    _time("filtered", [" ".join(words) for words in samples],
+          lambda query: index.search(query, year=1999, media_type="movie"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
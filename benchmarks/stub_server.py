@@ -0,0 +1,258 @@
+"""Local OMDB-compatible stub HTTP server for benchmarks and tests.
+
+Run it standalone to point other tools at it::
+
+    python -m benchmarks.stub_server --port 8080 --latency 0.02 --error-rate 0.01 --total-results 250
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def default_responder(query):
+    """Build an OMDB-like payload for a parsed query string.
+
+    Args:
+        query (dict): Query parameters, each mapped to its first value.
+
+    Returns:
+        dict: A movie record for ``i``/``t`` lookups or a search page for ``s``.
+    """
+    if "s" in query:
+        return {
+            "Search": [
+                {
+                    "Title": f"{query['s']} {n}",
+                    "Year": "1999",
+                    "imdbID": f"tt{n:07d}",
+                    "Type": "movie",
+                    "Poster": "N/A",
+                }
+                for n in range(10)
+            ],
+            "totalResults": "10",
+            "Response": "True",
+        }
+    return {
+        "Title": query.get("t", "Stub Movie"),
+        "Year": query.get("y", "1999"),
+        "imdbID": query.get("i", "tt0000001"),
+        "Type": query.get("type", "movie"),
+        "Response": "True",
+    }
+
+
+def make_responder(total_results=10, plot_size=0):
+    """Build a responder serving paginated searches and records of a chosen size.
+
+    Args:
+        total_results (int): Hits a search reports in ``totalResults``, served
+            ten per page; pages past the end answer "Movie not found!".
+        plot_size (int): Characters in the ``Plot`` of every record, to model
+            full-plot payloads.
+
+    Returns:
+        callable: A responder for :class:`StubServer`.
+    """
+    plot = ("Lorem ipsum dolor sit amet. " * (plot_size // 28 + 1))[:plot_size]
+
+    def responder(query):
+        if "s" in query:
+            first = (int(query.get("page", 1)) - 1) * 10
+            if first >= total_results:
+                return {"Response": "False", "Error": "Movie not found!"}
+            return {
+                "Search": [
+                    {
+                        "Title": f"{query['s']} {n}",
+                        "Year": str(1950 + n % 70),
+                        "imdbID": f"tt{n:07d}",
+                        "Type": "movie",
+                        "Poster": "N/A",
+                    }
+                    for n in range(first, min(total_results, first + 10))
+                ],
+                "totalResults": str(total_results),
+                "Response": "True",
+            }
+        record = default_responder(query)
+        record.update({
+            "Rated": "R",
+            "Runtime": "136 min",
+            "Genre": "Action, Sci-Fi",
+            "Director": "Lana Wachowski, Lilly Wachowski",
+            "Actors": "Keanu Reeves, Laurence Fishburne, Carrie-Anne Moss",
+            "Plot": plot,
+            "Ratings": [{"Source": "Internet Movie Database", "Value": "8.7/10"}],
+            "imdbRating": "8.7",
+            "imdbVotes": "2,000,000",
+        })
+        return record
+
+    return responder
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        stub = self.server.stub
+        with stub.lock:
+            stub.connection_count += 1
+        if stub.connect_delay:
+            # Simulates the cost of a TCP/TLS handshake on every new connection
+            time.sleep(stub.connect_delay)
+
+    def do_GET(self):
+        stub = self.server.stub
+        with stub.lock:
+            stub.request_count += 1
+            failed = stub.error_rate and stub.random.random() < stub.error_rate
+            if failed:
+                stub.error_count += 1
+        if stub.latency:
+            time.sleep(stub.latency)
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        if failed:
+            payload = (503, {"Response": "False", "Error": "Service Unavailable"})
+        else:
+            payload = stub.responder(query)
+        status, headers = 200, {}
+        if isinstance(payload, tuple):
+            status, payload, headers = (payload + ({},))[:3]
+        body = json.dumps(payload).encode("utf-8")
+        headers = dict(headers)
+        with stub.lock:
+            stub.last_headers = dict(self.headers)
+        if stub.cache_control:
+            headers.setdefault("Cache-Control", stub.cache_control)
+        if stub.validators and status == 200:
+            headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            headers["Last-Modified"] = stub.last_modified
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match == headers["ETag"] or (
+                    if_none_match is None and self.headers.get("If-Modified-Since") == stub.last_modified):
+                status, body = 304, b""
+                with stub.lock:
+                    stub.not_modified_count += 1
+        if stub.compress and body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """OMDB stub served from a background thread on an ephemeral local port.
+
+    Args:
+        responder (Optional[callable]): Maps a query dict to a JSON payload, or to
+            a ``(status, payload)`` or ``(status, payload, headers)`` tuple.
+        connect_delay (float): Seconds slept when a new connection is accepted.
+        latency (float): Seconds slept before answering each request.
+        error_rate (float): Fraction of requests answered with a 503 instead of
+            asking the responder.
+        seed (Optional[int]): Seed of the random source deciding which requests fail.
+        port (int): Port to listen on; 0 picks a free ephemeral port.
+        cache_control (Optional[str]): ``Cache-Control`` header sent with every response.
+        validators (bool): Send ``ETag`` and ``Last-Modified`` and answer matching
+            conditional requests with ``304 Not Modified``.
+        compress (bool): Gzip bodies when the request accepts gzip.
+
+    Example:
+        >>> with StubServer() as stub:
+        ...     client = OmdbClient(base_url=stub.url)
+    """
+
+    def __init__(self, responder=None, connect_delay=0.0, latency=0.0, error_rate=0.0, seed=None, port=0,
+                 cache_control=None, validators=False, compress=False):
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.responder = responder or default_responder
+        self.connect_delay = connect_delay
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.port = port
+        self.cache_control = cache_control
+        self.validators = validators
+        self.compress = compress
+        self.last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.last_headers = {}
+        self.not_modified_count = 0
+        self.request_count = 0
+        self.error_count = 0
+        self.connection_count = 0
+        self.lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """str: Base URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local OMDB stub until interrupted.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--total-results", type=int, default=10, help="hits per search, ten per page")
+    parser.add_argument("--plot-size", type=int, default=0, help="characters in every record's Plot")
+    options = parser.parse_args(argv)
+
+    responder = make_responder(total_results=options.total_results, plot_size=options.plot_size)
+    with StubServer(responder, latency=options.latency, error_rate=options.error_rate, port=options.port) as stub:
+        print(f"OMDB stub listening on {stub.url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,11 +2,70 @@
 
 This package provides functions to search for movies and retrieve detailed
 information from the Open Movie Database (OMDB) API.
+
+Public names are imported from their submodules on first access, so
+``import omdb_api`` stays cheap for CLI invocations and short-lived workers.
 """
 
 __version__ = "1.0.0"
 __author__ = "OMDB API Wrapper Contributors"
 
-from .movie_search import get_movie_by_id_or_title, search_movies
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "AsyncOmdbClient": "async_client",
+    "AsyncSingleFlight": "singleflight",
+    "BulkResult": "bulk",
+    "Catalog": "catalog",
+    "CircuitBreaker": "retry",
+    "CircuitOpenError": "retry",
+    "ColumnBatch": "enrich",
+    "ColumnarExporter": "export",
+    "HttpCache": "httpcache",
+    "Instrumentation": "instrumentation",
+    "KeyPool": "keypool",
+    "MetricsCollector": "instrumentation",
+    "Movie": "models",
+    "OmdbClient": "client",
+    "ProxyServer": "proxy",
+    "QuotaExceededError": "ratelimit",
+    "RateLimiter": "ratelimit",
+    "RefreshScheduler": "refresh",
+    "RetryPolicy": "retry",
+    "SearchHit": "models",
+    "SingleFlight": "singleflight",
+    "SpanExporter": "instrumentation",
+    "SqliteCache": "cache",
+    "TTLCache": "cache",
+    "TitleIndex": "title_index",
+    "enrich_records": "enrich",
+    "export_records": "export",
+    "get_api_key": "movie_search",
+    "get_default_client": "client",
+    "get_many": "bulk",
+    "get_series_tree": "series",
+    "iter_episodes": "series",
+    "iter_search": "bulk",
+    "iter_search_pages": "bulk",
+    "prometheus_text": "instrumentation",
+    "get_movie_by_id_or_title": "movie_search",
+    "search_hits": "models",
+    "search_movies": "movie_search",
+    "set_default_client": "client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["get_movie_by_id_or_title", "search_movies"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
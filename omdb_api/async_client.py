@@ -0,0 +1,245 @@
+"""Asyncio client for the OMDB API.
+
+:class:`AsyncOmdbClient` mirrors the blocking lookup functions for code running
+on an event loop. Requests share one pooled ``aiohttp`` connector and the number
+of requests in flight is bounded, so large fan-outs do not need a thread pool.
+
+Requires the optional ``aiohttp`` dependency (``pip install omdb-api-wrapper[async]``).
+"""
+
+import asyncio
+import time
+
+from . import movie_search
+from .cache import make_cache_key
+from .client import _UpstreamAttempts
+from .decoding import loads
+from .instrumentation import SOURCE_CACHE, SOURCE_CATALOG, SOURCE_COALESCED, RequestEvent
+from .movie_search import _build_movie_params, _build_search_params
+from .retry import DEFAULT_RETRY_STATUSES
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiohttp = None
+
+DEFAULT_MAX_IN_FLIGHT = 10
+DEFAULT_TIMEOUT = 30.0
+
+
+class AsyncOmdbClient(_UpstreamAttempts):
+    """Async OMDB client backed by a pooled ``aiohttp`` session.
+
+    Args:
+        base_url (Optional[str]): OMDB endpoint. Defaults to
+            :data:`omdb_api.movie_search.BASE_URL` at request time.
+        max_in_flight (int): Maximum number of concurrent requests.
+        keep_alive (bool): Reuse connections between requests.
+        timeout (Optional[float]): Total per-request timeout in seconds. None waits forever.
+        cache (Optional[TTLCache]): Response cache consulted before the network.
+        rate_limiter (Optional[RateLimiter]): Limiter every upstream request waits on.
+        retry (Optional[RetryPolicy]): Retries connection errors, timeouts and
+            retryable statuses (5xx/429 by default). None sends each request once.
+        circuit_breaker (Optional[CircuitBreaker]): Fails fast while upstream is unhealthy.
+        single_flight (Optional[AsyncSingleFlight]): Coalesces identical concurrent
+            requests into one upstream call.
+        catalog (Optional[Catalog|TitleIndex]): Local catalog or title index
+            answering known titles before the cache and the network.
+        instrumentation (Optional[Instrumentation]): Hooks receiving a
+            :class:`~omdb_api.instrumentation.RequestEvent` after every request.
+        decoder (Optional[callable]): Decodes response body bytes. Defaults to
+            :func:`omdb_api.decoding.loads` (orjson when installed).
+        key_pool (Optional[KeyPool]): API keys spread across upstream attempts.
+
+    Example:
+        >>> async with AsyncOmdbClient(max_in_flight=20) as client:
+        ...     movies = await client.gather_ids(["tt0133093", "tt0234215"])
+    """
+
+    def __init__(self, base_url=None, max_in_flight=DEFAULT_MAX_IN_FLIGHT, keep_alive=True, timeout=DEFAULT_TIMEOUT,
+                 cache=None, rate_limiter=None, retry=None, circuit_breaker=None,
+                 single_flight=None, catalog=None, instrumentation=None, decoder=None,
+                 key_pool=None):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AsyncOmdbClient: pip install omdb-api-wrapper[async]")
+        if int(max_in_flight) < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        self.base_url = base_url
+        self.max_in_flight = int(max_in_flight)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+        self.catalog = catalog
+        self.instrumentation = instrumentation
+        self.decoder = decoder
+        self.key_pool = key_pool
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self):
+        # aiohttp sessions must be created inside the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_in_flight, force_close=not self.keep_alive)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._session
+
+    async def request(self, params):
+        """Send a GET request to OMDB and return the decoded JSON body.
+
+        Args:
+            params (dict): Query parameters, including ``apikey``.
+
+        Returns:
+            dict: Parsed JSON response from OMDB, possibly served from :attr:`catalog` or :attr:`cache`.
+        """
+        if self.instrumentation is None or not self.instrumentation.hooks:
+            return await self._request(params, None)
+
+        event = RequestEvent(params)
+        try:
+            result = await self._request(params, event)
+        except BaseException as e:
+            event.finish(error=e)
+            self.instrumentation.emit(event)
+            raise
+        event.finish(result)
+        self.instrumentation.emit(event)
+        return result
+
+    async def _request(self, params, event):
+        if self.catalog is not None:
+            result = self.catalog.answer(params)
+            if result is not None:
+                if event is not None:
+                    event.source = SOURCE_CATALOG
+                return result
+        if self.cache is None and self.single_flight is None:
+            return await self._send(params, event)
+
+        key = make_cache_key(params)
+        if self.cache is not None:
+            result = self.cache.get(key)
+            if result is not None:
+                if event is not None:
+                    event.source = SOURCE_CACHE
+                return result
+        if self.single_flight is None:
+            return await self._fetch_and_store(key, params, event)
+        if event is not None:
+            event.source = SOURCE_COALESCED
+        return await self.single_flight.do(key, lambda: self._fetch_and_store(key, params, event))
+
+    async def _fetch_and_store(self, key, params, event=None):
+        result = await self._send(params, event)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
+
+    async def _send(self, params, event=None):
+        session = self._get_session()
+        retry_statuses = DEFAULT_RETRY_STATUSES if self.retry is None else self.retry.retry_statuses
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                if event is None:
+                    await self.rate_limiter.acquire_async()
+                else:
+                    waited = time.perf_counter()
+                    await self.rate_limiter.acquire_async()
+                    event.wait = (event.wait or 0.0) + time.perf_counter() - waited
+            params, api_key, trial, sent = self._begin_attempt(params, event)
+
+            try:
+                async with self._semaphore:
+                    async with session.get(self.base_url or movie_search.BASE_URL, params=params) as response:
+                        status = response.status
+                        retry_after = response.headers.get("Retry-After")
+                        if event is not None:
+                            event.status = status
+                        if status not in retry_statuses:
+                            result = await self._read(response, event)
+                        elif not self._can_retry(attempt):
+                            trial = False
+                            self._record_outcome(success=False)
+                            response.raise_for_status()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self._fail_attempt(api_key)
+                if not self._can_retry(attempt):
+                    raise
+                retry_after = None
+            except BaseException:
+                self._abort_attempt(api_key, trial)
+                raise
+            else:
+                if status not in retry_statuses:
+                    self._record_outcome(success=True)
+                    if self._key_rejected(api_key, sent, result):
+                        # OMDB rejected the key, which is now ejected: try the next one right away
+                        continue
+                    return result
+                self._fail_attempt(api_key)
+
+            await asyncio.sleep(self.retry.backoff(attempt, retry_after))
+            self.retry.record_retry()
+            attempt += 1
+
+    async def _read(self, response, event):
+        decode = self.decoder or loads
+        if event is None:
+            return decode(await response.read())
+        started = time.perf_counter()
+        body = await response.read()
+        downloaded = time.perf_counter()
+        result = decode(body)
+        event.download = downloaded - started
+        event.parse = time.perf_counter() - downloaded
+        event.bytes = len(body)
+        return result
+
+    async def get(self, title=None, movie_id=None, year=None, plot="short", media_type=None):
+        """Async counterpart of :func:`omdb_api.movie_search.get_movie_by_id_or_title`."""
+        params = _build_movie_params(title=title, movie_id=movie_id, year=year, plot=plot, media_type=media_type,
+                                     client=self)
+        return await self.request(params)
+
+    async def search(self, search_query, year=None, media_type=None, page=1):
+        """Async counterpart of :func:`omdb_api.movie_search.search_movies`."""
+        params = _build_search_params(search_query, year=year, media_type=media_type, page=page, client=self)
+        return await self.request(params)
+
+    async def gather_ids(self, ids, plot="short", return_exceptions=False):
+        """Fetch many IMDb IDs concurrently.
+
+        Args:
+            ids (Iterable[str]): IMDb IDs to resolve.
+            plot (str): Return short or full plot. Options: 'short' (default), 'full'.
+            return_exceptions (bool): Return failures in place of their result
+                instead of raising the first one.
+
+        Returns:
+            list: Results in the same order as ``ids``.
+        """
+        # Validate everything up front so a bad ID fails before any request is sent
+        params = [_build_movie_params(movie_id=movie_id, plot=plot, client=self) for movie_id in ids]
+        return await asyncio.gather(*(self.request(p) for p in params), return_exceptions=return_exceptions)
+
+    async def close(self):
+        """Close the session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,162 @@
+"""Batch resolution of IDs and titles for the ``omdb-search --batch`` mode.
+
+Queries are read from a file or stdin, resolved concurrently through the shared
+client, and written as NDJSON, one object per query::
+
+    {"query": {"movie_id": "tt0133093"}, "result": {...}}
+    {"query": {"title": "Heat", "year": "1995"}, "error": "Read timed out."}
+
+When the output is a file it doubles as a checkpoint: a rerun skips every query
+that already has a result in it, so a killed run resumes where it stopped.
+Answers rejecting the API key (invalid key, daily limit reached) are written
+as errors, so a run that ran out of quota resumes from the first rejection.
+"""
+
+import csv
+import json
+import os
+import re
+
+from .bulk import DEFAULT_MAX_WORKERS, _fan_out
+from .keypool import REJECTIONS
+from .movie_search import _build_movie_params, _fetch
+
+_IMDB_ID = re.compile(r"^tt\d+$")
+
+# CSV header names accepted for each lookup argument
+_CSV_COLUMNS = {
+    "movie_id": ("imdbid", "imdb_id", "id", "movie_id"),
+    "title": ("title",),
+    "year": ("year",),
+    "media_type": ("type", "media_type"),
+    "plot": ("plot",),
+}
+
+
+def parse_lines(stream):
+    """Yield one query per non-blank line: an IMDb ID (``tt...``) or a title.
+
+    Lines starting with ``#`` are ignored.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if _IMDB_ID.match(line):
+            yield {"movie_id": line}
+        else:
+            yield {"title": line}
+
+
+def parse_csv(stream):
+    """Yield one query per CSV row.
+
+    The header row names the columns, case-insensitively: ``imdbID`` (or ``id``),
+    ``title``, ``year``, ``type`` and ``plot``. Empty cells are left out.
+    """
+    reader = csv.DictReader(stream)
+    columns = {}
+    for name in reader.fieldnames or ():
+        for argument, aliases in _CSV_COLUMNS.items():
+            if name.strip().lower() in aliases:
+                columns[name] = argument
+    for row in reader:
+        query = {columns[name]: value.strip() for name, value in row.items()
+                 if name in columns and value and value.strip()}
+        if query:
+            yield query
+
+
+def query_key(query):
+    """Return a stable string identifying ``query`` in a checkpoint."""
+    return json.dumps(query, sort_keys=True, separators=(",", ":"))
+
+
+def load_checkpoint(path):
+    """Return the keys of queries already resolved in an NDJSON output file.
+
+    Records with an ``error``, results rejecting the API key and lines cut
+    short by a killed run are ignored, so those queries are tried again.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as stream:
+        for line in stream:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "result" in record and "query" in record \
+                    and not _rejected(record["result"]):
+                done.add(query_key(record["query"]))
+    return done
+
+
+def _rejected(result):
+    """Return whether ``result`` is OMDB refusing the API key rather than answering the query."""
+    return isinstance(result, dict) and result.get("Response") == "False" and result.get("Error") in REJECTIONS
+
+
+def open_checkpoint(path):
+    """Open an NDJSON output file for appending.
+
+    Returns:
+        tuple: The open text stream and the :func:`load_checkpoint` keys it
+        already holds.
+    """
+    done = load_checkpoint(path)
+    needs_newline = False
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, "rb") as stream:
+            stream.seek(-1, os.SEEK_END)
+            needs_newline = stream.read(1) != b"\n"
+    out = open(path, "a", encoding="utf-8")
+    if needs_newline:
+        # Terminate a line cut short by a killed run before appending
+        out.write("\n")
+    return out, done
+
+
+def resolve(query, client=None):
+    """Resolve one query and return its NDJSON record as a dict."""
+    try:
+        params = _build_movie_params(client=client, **query)
+        result = _fetch(params, client)
+    except Exception as e:
+        return {"query": query, "error": str(e)}
+    if _rejected(result):
+        return {"query": query, "error": result["Error"]}
+    return {"query": query, "result": result}
+
+
+def run_batch(queries, out, max_workers=DEFAULT_MAX_WORKERS, ordered=True, skip=frozenset(), client=None):
+    """Resolve ``queries`` concurrently and write one NDJSON line per result.
+
+    Args:
+        queries (Iterable[dict]): Keyword arguments for
+            :func:`~omdb_api.movie_search.get_movie_by_id_or_title`.
+        out (TextIO): Stream the NDJSON lines are written to. Flushed after every
+            line so the output is a usable checkpoint at all times.
+        max_workers (int): Number of concurrent lookups.
+        ordered (bool): Write in input order. When False, write in completion order.
+        skip (Container[str]): :func:`query_key` values to leave out (already resolved).
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Returns:
+        tuple: ``(resolved, failed)`` counts.
+    """
+    if int(max_workers) < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    pending = (query for query in queries if query_key(query) not in skip)
+    resolved = failed = 0
+    for record in _fan_out(pending, lambda query: resolve(query, client), int(max_workers), ordered,
+                           thread_name_prefix="omdb-batch"):
+        out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        out.flush()
+        if "error" in record:
+            failed += 1
+        else:
+            resolved += 1
+    return resolved, failed
@@ -0,0 +1,233 @@
+"""Bulk lookups fanned out over a thread pool.
+
+:func:`get_many` resolves large batches of IMDb IDs concurrently through one
+pooled client and yields results as they complete. :func:`iter_search` and
+:func:`iter_search_pages` walk every page of a search, prefetching upcoming
+pages in the background. Only a bounded window of requests is queued at a time,
+so memory stays flat for arbitrarily long inputs.
+"""
+
+import collections
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .movie_search import _build_movie_params, _build_search_params, _fetch
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PREFETCH = 4
+SEARCH_PAGE_SIZE = 10
+MAX_SEARCH_PAGES = 100
+
+BulkResult = collections.namedtuple("BulkResult", ["index", "movie_id", "result", "error"])
+BulkResult.__doc__ = """Outcome of one lookup in a bulk request.
+
+Attributes:
+    index (int): Position of the ID in the input.
+    movie_id (str): The IMDb ID as given.
+    result (Optional[dict]): Parsed OMDB response, or None if the lookup failed.
+    error (Optional[Exception]): The exception raised by the lookup, if any.
+"""
+
+
+def _resolve(index, movie_id, plot, client):
+    try:
+        params = _build_movie_params(movie_id=movie_id, plot=plot, client=client)
+        return BulkResult(index, movie_id, _fetch(params, client), None)
+    except Exception as e:
+        return BulkResult(index, movie_id, None, e)
+
+
+def get_many(ids, max_workers=DEFAULT_MAX_WORKERS, ordered=True, plot="short", client=None):
+    """Resolve many IMDb IDs concurrently.
+
+    Every ID produces exactly one :class:`BulkResult`; a failed lookup carries its
+    exception in ``error`` instead of aborting the batch. ``ids`` is consumed
+    lazily and at most ``2 * max_workers`` lookups are pending at any time.
+    Closing the generator early cancels lookups that have not started.
+
+    For best throughput, give the client a connection pool at least
+    ``max_workers`` wide (``OmdbClient(pool_maxsize=max_workers)``).
+
+    Args:
+        ids (Iterable[str]): IMDb IDs to resolve.
+        max_workers (int): Number of worker threads.
+        ordered (bool): Yield results in input order. When False, results are
+            yielded as soon as they complete.
+        plot (str): Return short or full plot. Options: 'short' (default), 'full'.
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Yields:
+        BulkResult: One result per input ID.
+
+    Example:
+        >>> for item in get_many(ids, max_workers=16, ordered=False):
+        ...     if item.error is None:
+        ...         print(item.result["Title"])
+    """
+    if int(max_workers) < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    def resolve(item):
+        index, movie_id = item
+        return _resolve(index, movie_id, plot, client)
+
+    return _fan_out(enumerate(ids), resolve, int(max_workers), ordered)
+
+
+def _fan_out(items, fn, max_workers, ordered, thread_name_prefix="omdb-bulk", executor=None):
+    """Yield ``fn(item)`` for every item, running up to ``max_workers`` calls at once.
+
+    ``items`` is consumed lazily and at most ``2 * max_workers`` calls are
+    pending; closing the generator cancels the calls that have not started. An
+    exception raised by ``fn`` is re-raised when its result is reached, which
+    closes the generator. Calls run on a new thread pool unless ``executor`` is
+    given; either way the executor is shut down when the generator finishes.
+    """
+    window = 2 * max_workers
+    items = iter(items)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    def submit_next():
+        for item in items:
+            return executor.submit(fn, item)
+        return None
+
+    pending = collections.deque() if ordered else set()
+    try:
+        while True:
+            while len(pending) < window:
+                future = submit_next()
+                if future is None:
+                    break
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+
+            if not pending:
+                return
+
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def iter_search_pages(search_query, year=None, media_type=None, max_results=None, prefetch=DEFAULT_PREFETCH,
+                      client=None):
+    """Lazily yield every page response of a search.
+
+    Page 1 is fetched first to read ``totalResults``; the remaining pages (OMDB
+    serves at most 100) are then fetched concurrently, keeping up to
+    ``prefetch`` pages in flight ahead of the consumer. Pages are yielded in
+    order. A first page with ``"Response": "False"`` is yielded as is, so the
+    caller can report its ``Error``; a later page without results ends the
+    iteration. Closing the generator early cancels pages that have not been
+    requested yet.
+
+    Args:
+        search_query (str): Movie title to search for (required).
+        year (Optional[int|str]): Year of release (optional).
+        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
+        max_results (Optional[int]): Only fetch the pages needed for this many entries.
+        prefetch (int): Number of pages fetched ahead concurrently.
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Yields:
+        dict: Parsed JSON response for each page.
+
+    Raises:
+        ValueError: If search_query is empty or invalid.
+        RuntimeError: If OMDB_API_KEY is not set.
+    """
+    if int(prefetch) < 1:
+        raise ValueError("prefetch must be a positive integer")
+    if max_results is not None and int(max_results) < 0:
+        raise ValueError("max_results must not be negative")
+
+    params = _build_search_params(search_query, year=year, media_type=media_type, page=1, client=client)
+    if max_results is not None and int(max_results) == 0:
+        return
+
+    first = _fetch(params, client)
+    yield first
+    if first.get("Response") != "True":
+        return
+
+    try:
+        total = int(first.get("totalResults", 0))
+    except (TypeError, ValueError):
+        total = 0
+    if max_results is not None:
+        total = min(total, int(max_results))
+    last_page = min(MAX_SEARCH_PAGES, -(-total // SEARCH_PAGE_SIZE))
+
+    def fetch_page(page):
+        return _fetch(dict(params, page=str(page)), client)
+
+    pages = iter(range(2, last_page + 1))
+    pending = collections.deque()
+    executor = ThreadPoolExecutor(max_workers=int(prefetch), thread_name_prefix="omdb-search")
+    try:
+        while True:
+            while len(pending) < int(prefetch):
+                page = next(pages, None)
+                if page is None:
+                    break
+                pending.append(executor.submit(fetch_page, page))
+
+            if not pending:
+                return
+            result = pending.popleft().result()
+            if result.get("Response") != "True":
+                return
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def iter_search(search_query, year=None, media_type=None, max_results=None, prefetch=DEFAULT_PREFETCH,
+                client=None):
+    """Lazily yield every ``Search`` entry of a query across all result pages.
+
+    Pages are fetched as described in :func:`iter_search_pages` and their
+    entries are yielded in page order. Iteration ends at the first page without
+    results, and closing the generator early stops further requests.
+
+    Args:
+        search_query (str): Movie title to search for (required).
+        year (Optional[int|str]): Year of release (optional).
+        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
+        max_results (Optional[int]): Stop after this many entries.
+        prefetch (int): Number of pages fetched ahead concurrently.
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Yields:
+        dict: Individual ``Search`` entries.
+
+    Raises:
+        ValueError: If search_query is empty or invalid.
+        RuntimeError: If OMDB_API_KEY is not set.
+    """
+    remaining = None if max_results is None else int(max_results)
+    pages = iter_search_pages(search_query, year=year, media_type=media_type, max_results=max_results,
+                              prefetch=prefetch, client=client)
+    try:
+        for page in pages:
+            for entry in page.get("Search", []):
+                yield entry
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+    finally:
+        pages.close()
@@ -0,0 +1,309 @@
+"""Response caches for OMDB lookups.
+
+Responses are keyed on the normalized query parameters (without ``apikey``).
+:class:`TTLCache` keeps them in a bounded in-process LRU and :class:`SqliteCache`
+persists them on disk so they are shared across processes and CLI runs. Both
+give every entry a time to live; negative results (``"Response": "False"``) use
+their own, usually shorter, time to live. Both store responses serialized, so
+every hit returns a fresh copy that the caller is free to modify.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .decoding import loads
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 3600.0
+DEFAULT_NEGATIVE_TTL = 300.0
+DEFAULT_CACHE_FILENAME = "omdb-cache.sqlite3"
+
+
+def make_cache_key(params):
+    """Build a hashable cache key from OMDB query parameters.
+
+    Args:
+        params (dict): Query parameters as built by the lookup functions.
+
+    Returns:
+        tuple: Sorted ``(name, value)`` pairs, excluding ``apikey``.
+    """
+    return tuple(sorted((name, str(value)) for name, value in params.items() if name != "apikey"))
+
+
+def is_negative(response):
+    """Return True if an OMDB response reports a failed lookup."""
+    return isinstance(response, dict) and response.get("Response") == "False"
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry.
+
+    Values are kept as JSON bytes and decoded on every hit, so a caller
+    modifying its result cannot corrupt the entry seen by others.
+
+    Args:
+        max_entries (int): Maximum number of entries before the least recently
+            used one is evicted.
+        ttl (float): Seconds a successful response stays fresh.
+        negative_ttl (float): Seconds a ``"Response": "False"`` result stays fresh.
+        clock (callable): Monotonic time source, mainly useful in tests.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, negative_ttl=DEFAULT_NEGATIVE_TTL,
+                 clock=time.monotonic):
+        if int(max_entries) < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if ttl <= 0 or negative_ttl < 0:
+            raise ValueError("ttl must be positive and negative_ttl must not be negative")
+
+        self.max_entries = int(max_entries)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the fresh value stored under ``key``, or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            data = None
+            if entry is not None:
+                expires_at, data = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                else:
+                    del self._entries[key]
+                    self.expirations += 1
+                    data = None
+            if data is None:
+                self.misses += 1
+                return default
+        # Decoded outside the lock, into a copy owned by the caller
+        return loads(data)
+
+    def set(self, key, value):
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        ttl = self.negative_ttl if is_negative(value) else self.ttl
+        if ttl <= 0:
+            return
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def expires_in(self, key):
+        """Return the seconds ``key`` stays fresh, or None if it is missing or expired.
+
+        Unlike :meth:`get`, this touches neither the counters nor the LRU order.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            remaining = None if entry is None else entry[0] - self._clock()
+        return remaining if remaining is not None and remaining > 0 else None
+
+    def delete(self, key):
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions``, ``expirations`` and current ``size``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteCache:
+    """Persistent response cache stored in a SQLite database.
+
+    The database runs in WAL mode, so several threads and processes can read and
+    write the same cache directory concurrently. Entries expire on wall-clock time
+    and the table is compacted back under ``max_entries`` every
+    ``compact_interval`` writes, dropping expired rows first and then the entries
+    closest to expiry.
+
+    Args:
+        directory (str): Directory holding the cache database. Created if missing.
+        ttl (float): Seconds a successful response stays fresh.
+        negative_ttl (float): Seconds a ``"Response": "False"`` result stays fresh.
+        max_entries (int): Number of rows kept after compaction.
+        compact_interval (int): Writes between two compaction passes.
+        filename (str): Database file name inside ``directory``.
+        clock (callable): Wall-clock time source, mainly useful in tests.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_TTL, negative_ttl=DEFAULT_NEGATIVE_TTL, max_entries=100000,
+                 compact_interval=1000, filename=DEFAULT_CACHE_FILENAME, clock=time.time):
+        if int(max_entries) < 1 or int(compact_interval) < 1:
+            raise ValueError("max_entries and compact_interval must be positive integers")
+        if ttl <= 0 or negative_ttl < 0:
+            raise ValueError("ttl must be positive and negative_ttl must not be negative")
+
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, filename)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = int(max_entries)
+        self.compact_interval = int(compact_interval)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def _connect(self):
+        # Connections are per thread and per process; a forked worker must not
+        # reuse its parent's handle.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _encode_key(key):
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key, default=None):
+        """Return the fresh value stored under ``key``, or ``default``."""
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (self._encode_key(key),)
+        ).fetchone()
+        with self._lock:
+            if row is not None and row[1] > self._clock():
+                self.hits += 1
+                return json.loads(row[0])
+            if row is not None:
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Store ``value`` under ``key`` and compact the table periodically."""
+        ttl = self.negative_ttl if is_negative(value) else self.ttl
+        if ttl <= 0:
+            return
+        self._connect().execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (self._encode_key(key), json.dumps(value, separators=(",", ":")), self._clock() + ttl),
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.compact_interval == 0
+        if due:
+            self.compact()
+
+    def expires_in(self, key):
+        """Return the seconds ``key`` stays fresh, or None if it is missing or expired.
+
+        Unlike :meth:`get`, this does not touch the counters.
+        """
+        row = self._connect().execute(
+            "SELECT expires_at FROM responses WHERE key = ?", (self._encode_key(key),)
+        ).fetchone()
+        remaining = None if row is None else row[0] - self._clock()
+        return remaining if remaining is not None and remaining > 0 else None
+
+    def delete(self, key):
+        """Remove ``key`` from the cache if present."""
+        self._connect().execute("DELETE FROM responses WHERE key = ?", (self._encode_key(key),))
+
+    def clear(self):
+        """Remove every entry. Counters are kept."""
+        self._connect().execute("DELETE FROM responses")
+
+    def compact(self):
+        """Drop expired rows, then trim the table to ``max_entries``.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            expired = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)).rowcount
+            evicted = conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY expires_at "
+                "LIMIT max(0, (SELECT COUNT(*) FROM responses) - ?))",
+                (self.max_entries,),
+            ).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.expirations += expired
+            self.evictions += evicted
+        return expired + evicted
+
+    def stats(self):
+        """Return the cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions`` and ``expirations`` seen by
+            this process, and the current ``size`` of the shared table.
+        """
+        size = len(self)
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": size,
+            }
+
+    def close(self):
+        """Close the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
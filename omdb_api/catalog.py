@@ -0,0 +1,350 @@
+"""Local catalog of OMDB records answering lookups without the network.
+
+A :class:`Catalog` is a SQLite database built from NDJSON dumps of records
+fetched earlier, for example the output of ``omdb-search --batch``. Dumps are
+ingested line by line, so they never need to fit in memory. Records are indexed
+by ``imdbID``, by normalized title and year, by type, and by title word, and
+the catalog answers ``i=``/``t=`` lookups and ``s=`` searches in the same
+shape OMDB uses.
+
+Passed to :class:`~omdb_api.client.OmdbClient` as ``catalog``, it is consulted
+before the cache and the network; only queries it cannot answer go upstream::
+
+    catalog = Catalog("omdb-catalog.sqlite3")
+    catalog.ingest("movies.ndjson")
+    set_default_client(OmdbClient(catalog=catalog))
+
+Searches are answered from the catalog's own records, so a search that matches
+at least one local title returns only local matches. Lookups return the record
+as it was ingested, whatever ``plot`` length it was fetched with.
+"""
+
+import json
+import os
+import re
+import threading
+import unicodedata
+
+from .models import parse_int, parse_year
+
+SEARCH_PAGE_SIZE = 10
+INGEST_CHUNK_SIZE = 1000
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS records ("
+    "imdb_id TEXT PRIMARY KEY, title TEXT, title_key TEXT NOT NULL, year TEXT, year_start INTEGER, "
+    "type TEXT, poster TEXT, votes INTEGER NOT NULL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS records_title ON records (title_key, year_start)",
+    "CREATE INDEX IF NOT EXISTS records_type ON records (type, year_start)",
+    # Postings carry the filter and ranking columns so searches never touch records until the page is known
+    "CREATE TABLE IF NOT EXISTS title_words ("
+    "word TEXT NOT NULL, imdb_id TEXT NOT NULL, type TEXT, year_start INTEGER, votes INTEGER NOT NULL, "
+    "PRIMARY KEY (word, imdb_id)) WITHOUT ROWID",
+)
+
+
+def normalize_title(title):
+    """Normalize a title for matching: case-folded, accents and punctuation removed.
+
+    Example:
+        >>> normalize_title("Amélie: Le Fabuleux Destin")
+        'amelie le fabuleux destin'
+    """
+    text = unicodedata.normalize("NFKD", str(title)).casefold()
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def _records_from_line(line):
+    """Return the OMDB records held by one NDJSON line.
+
+    Plain records and ``--batch`` output lines (``{"query": ..., "result": ...}``)
+    are accepted. Blank lines, unparsable lines and ``"Response": "False"``
+    results yield nothing.
+    """
+    line = line.strip()
+    if not line:
+        return ()
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return ()
+    if isinstance(record, dict) and "query" in record:
+        record = record.get("result")
+    if not isinstance(record, dict) or record.get("Response") == "False" or not record.get("imdbID"):
+        return ()
+    return (record,)
+
+
+class Catalog:
+    """On-disk index of OMDB records.
+
+    Safe to share between threads; each thread and process opens its own
+    connection to the database.
+
+    Args:
+        path (str): SQLite database file. Created if missing.
+        answer_searches (bool): Let :meth:`answer` serve ``s=`` searches. When
+            False only ``i=``/``t=`` lookups are answered locally.
+    """
+
+    def __init__(self, path, answer_searches=True):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.answer_searches = answer_searches
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def _connect(self):
+        # Connections are per thread and per process; a forked worker must not
+        # reuse its parent's handle.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # Ingestion
+
+    def add_many(self, records):
+        """Insert or replace full OMDB records in one transaction.
+
+        Args:
+            records (Iterable[dict]): Records as returned by ``i=``/``t=`` lookups.
+                Records without an ``imdbID`` are skipped.
+
+        Returns:
+            int: Number of records stored.
+        """
+        rows = []
+        words = []
+        for record in records:
+            imdb_id = record.get("imdbID")
+            if not imdb_id:
+                continue
+            title = record.get("Title") or ""
+            title_key = normalize_title(title)
+            kind = record.get("Type")
+            year_start = parse_year(record.get("Year"))
+            votes = parse_int(record.get("imdbVotes")) or 0
+            rows.append((
+                imdb_id, title, title_key, record.get("Year"), year_start, kind, record.get("Poster"), votes,
+                json.dumps(record, separators=(",", ":")),
+            ))
+            words.extend((word, imdb_id, kind, year_start, votes) for word in set(title_key.split()))
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Drop the words of replaced records so a changed title is not still found by its old words
+            stale = []
+            for start in range(0, len(rows), 500):
+                ids = [row[0] for row in rows[start:start + 500]]
+                stale.extend(
+                    (word, imdb_id)
+                    for imdb_id, title_key in conn.execute(
+                        f"SELECT imdb_id, title_key FROM records WHERE imdb_id IN ({', '.join('?' * len(ids))})",
+                        ids,
+                    )
+                    for word in title_key.split()
+                )
+            conn.executemany("DELETE FROM title_words WHERE word = ? AND imdb_id = ?", stale)
+            conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("INSERT OR REPLACE INTO title_words VALUES (?, ?, ?, ?, ?)", words)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def ingest(self, source, chunk_size=INGEST_CHUNK_SIZE):
+        """Stream an NDJSON dump into the catalog.
+
+        Args:
+            source (str|Iterable[str]): Path of the dump, or an open text stream
+                or other iterable of lines.
+            chunk_size (int): Records written per transaction.
+
+        Returns:
+            int: Number of records stored.
+        """
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as stream:
+                return self.ingest(stream, chunk_size=chunk_size)
+
+        stored = 0
+        chunk = []
+        for line in source:
+            chunk.extend(_records_from_line(line))
+            if len(chunk) >= int(chunk_size):
+                stored += self.add_many(chunk)
+                chunk = []
+        return stored + self.add_many(chunk)
+
+    # Queries
+
+    def get(self, title=None, movie_id=None, year=None, media_type=None):
+        """Look up one record like :func:`~omdb_api.movie_search.get_movie_by_id_or_title`.
+
+        A title lookup returns the best match with that normalized title, the
+        one with the most IMDb votes.
+
+        Returns:
+            Optional[dict]: The record, or None if the catalog has no match.
+        """
+        conn = self._connect()
+        if movie_id:
+            row = conn.execute("SELECT data, year_start, type FROM records WHERE imdb_id = ?",
+                               (str(movie_id).strip(),)).fetchone()
+            if row is None or not self._matches(row[1], row[2], year, media_type):
+                return None
+            return json.loads(row[0])
+        if not title:
+            return None
+
+        sql = "SELECT data FROM records WHERE title_key = ?"
+        args = [normalize_title(title)]
+        sql, args = self._filter(sql, args, year, media_type)
+        row = conn.execute(sql + " ORDER BY votes DESC, imdb_id LIMIT 1", args).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def search(self, search_query, year=None, media_type=None, page=1):
+        """Search titles like :func:`~omdb_api.movie_search.search_movies`.
+
+        A title matches when it contains every word of ``search_query``. Matches
+        are ordered by IMDb votes and paginated ten per page.
+
+        Returns:
+            Optional[dict]: A search response (``Search``, ``totalResults``,
+            ``"Response": "True"``), or None if no local title matches.
+        """
+        # Longest word first: it is usually the rarest, so its postings are the shortest walk
+        query_words = sorted(set(normalize_title(search_query or "").split()), key=lambda word: (-len(word), word))
+        if not query_words:
+            return None
+
+        # Walk the first word's postings and probe the others by primary key; CROSS JOIN
+        # keeps that join order. Only the page's hits are then read from records.
+        joins = "".join(
+            f" CROSS JOIN title_words w{n} ON w{n}.word = ? AND w{n}.imdb_id = w0.imdb_id"
+            for n in range(1, len(query_words))
+        )
+        sql, args = self._filter(f"FROM title_words w0{joins} WHERE w0.word = ?",
+                                 query_words[1:] + query_words[:1], year, media_type, table="w0.")
+        conn = self._connect()
+        total = conn.execute("SELECT COUNT(*) " + sql, args).fetchone()[0]
+        if not total:
+            return None
+        offset = (int(page or 1) - 1) * SEARCH_PAGE_SIZE
+        ids = [row[0] for row in conn.execute(
+            "SELECT w0.imdb_id " + sql + " ORDER BY w0.votes DESC, w0.imdb_id LIMIT ? OFFSET ?",
+            args + [SEARCH_PAGE_SIZE, offset],
+        )]
+        if not ids:
+            return None
+        placeholders = ", ".join("?" * len(ids))
+        hits = {
+            imdb_id: {"Title": title, "Year": year_text, "imdbID": imdb_id, "Type": kind, "Poster": poster}
+            for title, year_text, imdb_id, kind, poster in conn.execute(
+                f"SELECT title, year, imdb_id, type, poster FROM records WHERE imdb_id IN ({placeholders})", ids
+            )
+        }
+        return {
+            "Search": [hits[imdb_id] for imdb_id in ids],
+            "totalResults": str(total),
+            "Response": "True",
+        }
+
+    @staticmethod
+    def _filter(sql, args, year, media_type, table=""):
+        year = parse_year(str(year).strip()) if year is not None and str(year).strip() else None
+        if year is not None:
+            sql += f" AND {table}year_start = ?"
+            args.append(year)
+        if media_type:
+            sql += f" AND {table}type = ?"
+            args.append(str(media_type).strip().lower())
+        return sql, args
+
+    @staticmethod
+    def _matches(year_start, kind, year, media_type):
+        if year is not None and str(year).strip() and year_start != parse_year(str(year).strip()):
+            return False
+        return not media_type or kind == str(media_type).strip().lower()
+
+    def entries(self):
+        """Yield every record as a ``Search`` entry with its ``imdbVotes``.
+
+        Useful to build a :class:`~omdb_api.title_index.TitleIndex` over the catalog.
+        """
+        rows = self._connect().execute("SELECT title, year, imdb_id, type, poster, votes FROM records")
+        for title, year, imdb_id, kind, poster, votes in rows:
+            yield {"Title": title, "Year": year, "imdbID": imdb_id, "Type": kind, "Poster": poster,
+                   "imdbVotes": str(votes)}
+
+    def answer(self, params):
+        """Answer an OMDB query from the catalog.
+
+        Args:
+            params (dict): Query parameters as sent to OMDB (``i``, ``t`` or ``s``,
+                plus ``y``, ``type`` and ``page``).
+
+        Returns:
+            Optional[dict]: The response OMDB would give, or None on a miss.
+            Season and episode lookups (``Season``/``Episode``) always miss,
+            since the catalog only holds title records.
+        """
+        if "Season" in params or "Episode" in params:
+            result = None
+        elif "i" in params or "t" in params:
+            result = self.get(title=params.get("t"), movie_id=params.get("i"), year=params.get("y"),
+                              media_type=params.get("type"))
+        elif "s" in params and self.answer_searches:
+            result = self.search(params["s"], year=params.get("y"), media_type=params.get("type"),
+                                 page=params.get("page", 1))
+        else:
+            result = None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def stats(self):
+        """Return the catalog counters.
+
+        Returns:
+            dict: ``hits`` and ``misses`` of :meth:`answer` in this process, and
+            the ``size`` of the catalog.
+        """
+        size = len(self)
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def close(self):
+        """Close the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM records").fetchone()[0]
@@ -0,0 +1,414 @@
+"""Pooled HTTP client for the OMDB API.
+
+The module level functions in :mod:`omdb_api.movie_search` delegate to a shared
+:class:`OmdbClient` so that consecutive lookups reuse keep-alive connections
+instead of opening a new TCP (and TLS) connection for every call.
+
+``requests`` is imported when the first session is created rather than at
+import time, so importing the package stays cheap for short-lived processes.
+"""
+
+import threading
+import time
+
+from .cache import make_cache_key
+from .decoding import decode_response
+from .instrumentation import (SOURCE_CACHE, SOURCE_CATALOG, SOURCE_COALESCED, SOURCE_HTTP_CACHE, SOURCE_UPSTREAM,
+                              RequestEvent)
+from .retry import DEFAULT_RETRY_STATUSES
+
+DEFAULT_BASE_URL = "http://www.omdbapi.com/"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = (3.05, 30)
+
+
+def __getattr__(name):
+    # Expose ``omdb_api.client.requests`` without importing it up front
+    if name == "requests":
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def omdb_error(result):
+    """Return the ``Error`` message of a ``"Response": "False"`` result, or None."""
+    if isinstance(result, dict) and result.get("Response") == "False":
+        return result.get("Error")
+    return None
+
+
+class _UpstreamAttempts:
+    """Retry, circuit breaker and key pool bookkeeping of upstream attempts.
+
+    Shared by :class:`OmdbClient` and :class:`~omdb_api.async_client.AsyncOmdbClient`,
+    whose ``_send`` loops only differ in how they wait and do I/O. Expects
+    ``retry``, ``circuit_breaker`` and ``key_pool`` attributes.
+    """
+
+    def _begin_attempt(self, params, event):
+        """Take a pooled key and the circuit breaker's permission for one attempt.
+
+        Returns:
+            tuple: ``(params, api_key, trial, sent)``: the parameters carrying
+            the pooled key, the key (None without a pool), whether this attempt
+            is the half-open trial, and the ``time.perf_counter()`` send time.
+        """
+        api_key = None
+        if self.key_pool is not None:
+            api_key = self.key_pool.acquire()
+            params = dict(params, apikey=api_key)
+        # Checked last, so a half-open trial is only taken for a request that will be sent
+        trial = self._before_call(api_key)
+        if event is not None:
+            event.source = SOURCE_UPSTREAM
+            event.attempts += 1
+        return params, api_key, trial, time.perf_counter()
+
+    def _before_call(self, api_key):
+        if self.circuit_breaker is None:
+            return False
+        try:
+            return self.circuit_breaker.before_call()
+        except BaseException:
+            self._release_key(api_key)
+            raise
+
+    def _release_key(self, api_key):
+        if api_key is not None:
+            self.key_pool.release(api_key)
+
+    def _abort_attempt(self, api_key, trial):
+        """Undo :meth:`_begin_attempt` for an attempt interrupted by an unexpected exception."""
+        self._release_key(api_key)
+        if trial:
+            self.circuit_breaker.release_trial()
+
+    def _fail_attempt(self, api_key):
+        """Record an attempt that failed in transport or with a retryable status."""
+        self._release_key(api_key)
+        self._record_outcome(success=False)
+
+    def _key_rejected(self, api_key, sent, result):
+        """Return the key of an answered attempt and whether OMDB rejected it, so the next key is tried."""
+        return api_key is not None and self.key_pool.release(api_key, time.perf_counter() - sent, omdb_error(result))
+
+    def _record_outcome(self, success):
+        if self.circuit_breaker is not None:
+            if success:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+
+    def _can_retry(self, attempt):
+        if self.retry is None:
+            return False
+        if attempt >= self.retry.max_retries:
+            self.retry.record_exhausted()
+            return False
+        return True
+
+
+class OmdbClient(_UpstreamAttempts):
+    """Reusable OMDB client backed by a pooled ``requests.Session``.
+
+    Args:
+        base_url (str): OMDB endpoint used when no URL is given per request.
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of idle connections kept per host.
+        keep_alive (bool): Reuse connections between requests. When False every
+            request asks the server to close its connection.
+        timeout (Optional[float|tuple]): Per-request timeout in seconds, either a
+            single value or a ``(connect, read)`` tuple. None waits forever.
+            Defaults to :data:`DEFAULT_TIMEOUT`.
+        cache (Optional[TTLCache]): Response cache consulted before the network.
+        rate_limiter (Optional[RateLimiter]): Limiter every upstream request waits on.
+            Cache hits do not consume tokens.
+        retry (Optional[RetryPolicy]): Retries connection errors, timeouts and
+            retryable statuses (5xx/429 by default). None sends each request once.
+        circuit_breaker (Optional[CircuitBreaker]): Fails fast while upstream is unhealthy.
+        single_flight (Optional[SingleFlight]): Coalesces identical concurrent
+            requests into one upstream call.
+        catalog (Optional[Catalog|TitleIndex]): Local catalog or title index
+            answering known titles before the cache and the network.
+        instrumentation (Optional[Instrumentation]): Hooks receiving a
+            :class:`~omdb_api.instrumentation.RequestEvent` after every request.
+        decoder (Optional[callable]): Decodes response body bytes. Defaults to
+            :func:`omdb_api.decoding.loads` (orjson when installed).
+        http_cache (Optional[HttpCache]): Honors ``Cache-Control``/``Expires``
+            and revalidates stale responses with ``ETag``/``Last-Modified``.
+            Fresh entries do not consume rate limiter tokens.
+        key_pool (Optional[KeyPool]): API keys spread across upstream attempts,
+            replacing the ``apikey`` of every request. A key OMDB rejects is
+            ejected and the request retried with another key.
+    """
+
+    def __init__(
+        self,
+        base_url=DEFAULT_BASE_URL,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        keep_alive=True,
+        timeout=DEFAULT_TIMEOUT,
+        cache=None,
+        rate_limiter=None,
+        retry=None,
+        circuit_breaker=None,
+        single_flight=None,
+        catalog=None,
+        instrumentation=None,
+        decoder=None,
+        http_cache=None,
+        key_pool=None,
+    ):
+        if int(pool_connections) < 1 or int(pool_maxsize) < 1:
+            raise ValueError("pool_connections and pool_maxsize must be positive integers")
+
+        self.base_url = base_url
+        self.pool_connections = int(pool_connections)
+        self.pool_maxsize = int(pool_maxsize)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+        self.catalog = catalog
+        self.instrumentation = instrumentation
+        self.decoder = decoder
+        self.http_cache = http_cache
+        self.key_pool = key_pool
+        # Set by RefreshScheduler.start() to record which cached queries are hot
+        self.refresher = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """requests.Session: The pooled session, created on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        session = requests.Session()
+        # Ask for every encoding urllib3 can decode: gzip and deflate, plus br when brotli is installed
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def request(self, params, base_url=None, timeout=None, started=None):
+        """Send a GET request to OMDB and return the decoded JSON body.
+
+        Args:
+            params (dict): Query parameters, including ``apikey``.
+            base_url (Optional[str]): Endpoint overriding :attr:`base_url`.
+            timeout (Optional[float|tuple]): Timeout overriding :attr:`timeout`.
+            started (Optional[float]): ``time.perf_counter()`` reading taken
+                before ``params`` were validated, reported to
+                :attr:`instrumentation` as validation time.
+
+        Returns:
+            dict: Parsed JSON response from OMDB, possibly served from :attr:`catalog` or :attr:`cache`.
+        """
+        if self.instrumentation is None or not self.instrumentation.hooks:
+            return self._request(params, base_url, timeout, None)
+
+        event = RequestEvent(params, started)
+        try:
+            result = self._request(params, base_url, timeout, event)
+        except BaseException as e:
+            event.finish(error=e)
+            self.instrumentation.emit(event)
+            raise
+        event.finish(result)
+        self.instrumentation.emit(event)
+        return result
+
+    def _request(self, params, base_url, timeout, event):
+        if self.catalog is not None:
+            result = self.catalog.answer(params)
+            if result is not None:
+                if event is not None:
+                    event.source = SOURCE_CATALOG
+                return result
+        if self.cache is None and self.single_flight is None:
+            return self._send(params, base_url, timeout, event)
+
+        key = make_cache_key(params)
+        if self.refresher is not None:
+            self.refresher.record(key, params, base_url)
+        if self.cache is not None:
+            result = self.cache.get(key)
+            if result is not None:
+                if event is not None:
+                    event.source = SOURCE_CACHE
+                return result
+        if self.single_flight is None:
+            return self._fetch_and_store(key, params, base_url, timeout, event)
+        if event is not None:
+            # Only the leader's call reaches _send, which marks the event as upstream
+            event.source = SOURCE_COALESCED
+        return self.single_flight.do(key, lambda: self._fetch_and_store(key, params, base_url, timeout, event))
+
+    def refresh(self, params, base_url=None, timeout=None):
+        """Fetch ``params`` upstream and replace the cached response.
+
+        The cache is not read, so a fresh entry is replaced too. Identical
+        concurrent requests are still coalesced with the refresh, and it waits
+        on the rate limiter like any upstream request.
+
+        Args:
+            params (dict): Query parameters, including ``apikey``.
+            base_url (Optional[str]): Endpoint overriding :attr:`base_url`.
+            timeout (Optional[float|tuple]): Timeout overriding :attr:`timeout`.
+
+        Returns:
+            dict: Parsed JSON response from OMDB.
+        """
+        key = make_cache_key(params)
+        if self.single_flight is None:
+            return self._fetch_and_store(key, params, base_url, timeout)
+        return self.single_flight.do(key, lambda: self._fetch_and_store(key, params, base_url, timeout))
+
+    def _fetch_and_store(self, key, params, base_url, timeout, event=None):
+        result = self._send(params, base_url, timeout, event)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
+
+    def _send(self, params, base_url, timeout, event=None):
+        import requests
+
+        http_cache = self.http_cache
+        kwargs = {}
+        if http_cache is not None:
+            http_key = make_cache_key(params)
+            entry, fresh = http_cache.lookup(http_key)
+            if fresh:
+                if event is not None:
+                    event.source = SOURCE_HTTP_CACHE
+                return entry["result"]
+            kwargs["headers"] = http_cache.request_headers(entry)
+        if event is not None:
+            # Return once the headers arrive, so reading the body times the download
+            kwargs["stream"] = True
+
+        retry_statuses = DEFAULT_RETRY_STATUSES if self.retry is None else self.retry.retry_statuses
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                if event is None:
+                    self.rate_limiter.acquire()
+                else:
+                    waited = time.perf_counter()
+                    self.rate_limiter.acquire()
+                    event.wait = (event.wait or 0.0) + time.perf_counter() - waited
+            params, api_key, trial, sent = self._begin_attempt(params, event)
+
+            retry_after = None
+            try:
+                response = self.session.get(
+                    base_url or self.base_url,
+                    params=params,
+                    timeout=self.timeout if timeout is None else timeout,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._fail_attempt(api_key)
+                if not self._can_retry(attempt):
+                    raise
+            except BaseException:
+                self._abort_attempt(api_key, trial)
+                raise
+            else:
+                if event is not None:
+                    event.status = response.status_code
+                if response.status_code not in retry_statuses:
+                    self._record_outcome(success=True)
+                    try:
+                        if http_cache is not None:
+                            result = http_cache.complete(http_key, entry, response,
+                                                         lambda: self._decode(response, event))
+                        else:
+                            result = self._decode(response, event)
+                    except BaseException:
+                        self._release_key(api_key)
+                        raise
+                    finally:
+                        response.close()
+                    if self._key_rejected(api_key, sent, result):
+                        # OMDB rejected the key, which is now ejected: try the next one right away
+                        continue
+                    return result
+                self._fail_attempt(api_key)
+                if not self._can_retry(attempt):
+                    # Read a streamed body before closing, so the error's response stays usable
+                    response.content
+                    response.close()
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            time.sleep(self.retry.backoff(attempt, retry_after))
+            self.retry.record_retry()
+            attempt += 1
+
+    def _decode(self, response, event):
+        if event is None:
+            return decode_response(response, self.decoder)
+        return event.read(response, self.decoder)
+
+    def close(self):
+        """Close the session and release pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """Return the shared client used by the module level lookup functions."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = OmdbClient()
+    return _default_client
+
+
+def set_default_client(client):
+    """Replace the shared client and return the previous one.
+
+    Args:
+        client (Optional[OmdbClient]): New shared client. None resets to a lazily
+            created client with default settings.
+
+    Returns:
+        Optional[OmdbClient]: The client that was previously installed.
+    """
+    global _default_client
+    with _default_client_lock:
+        previous, _default_client = _default_client, client
+    return previous
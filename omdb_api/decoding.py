@@ -0,0 +1,200 @@
+"""JSON decoding of OMDB responses.
+
+Responses are decoded straight from the raw body bytes, skipping the text
+decoding and charset detection of ``response.json()``. The backend is chosen on
+first use: ``orjson`` when installed (``pip install omdb-api-wrapper[fast]``),
+then ``ujson``, then the standard library. :func:`set_backend` forces one.
+
+:class:`SearchStreamParser` parses a search response incrementally, so the
+``Search`` entries of a streamed body can be handled one by one as the bytes
+arrive::
+
+    response = session.get(url, params=params, stream=True)
+    for entry in iter_search_entries(response.iter_content(chunk_size=4096)):
+        print(entry["Title"])
+"""
+
+import codecs
+import json
+import re
+
+# Backends in order of preference
+BACKENDS = ("orjson", "ujson", "json")
+
+_backend = None  # (name, loads) once resolved
+
+
+def _import_backend(name):
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "ujson":
+        import ujson
+        return ujson.loads
+    raise ValueError(f"backend must be one of: {', '.join(BACKENDS)}")
+
+
+def set_backend(name=None):
+    """Select the JSON backend used by :func:`loads`.
+
+    Args:
+        name (Optional[str]): 'orjson', 'ujson' or 'json'. None picks the first
+            installed backend in :data:`BACKENDS` order.
+
+    Returns:
+        str: Name of the selected backend.
+
+    Raises:
+        ValueError: If the name is unknown.
+        RuntimeError: If the requested backend is not installed.
+    """
+    global _backend
+    if name is None:
+        for candidate in BACKENDS:
+            try:
+                _backend = (candidate, _import_backend(candidate))
+                return candidate
+            except ImportError:
+                continue
+    try:
+        _backend = (name, _import_backend(name))
+    except ImportError:
+        raise RuntimeError(f"{name} is not installed")
+    return name
+
+
+def get_backend():
+    """Return the name of the JSON backend, selecting the default one on first call."""
+    if _backend is None:
+        set_backend()
+    return _backend[0]
+
+
+def loads(data):
+    """Decode a JSON document from ``bytes`` or ``str`` with the selected backend."""
+    if _backend is None:
+        set_backend()
+    return _backend[1](data)
+
+
+def decode_response(response, decoder=None):
+    """Decode the JSON body of a ``requests`` response from its raw bytes.
+
+    Args:
+        response (requests.Response): A response whose body has not been consumed as a stream.
+        decoder (Optional[callable]): Maps the body bytes to a Python object.
+            Defaults to :func:`loads`.
+
+    Returns:
+        The decoded body.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    return (decoder or loads)(response.content)
+
+
+_SEARCH_KEY = re.compile(r'"Search"\s*:\s*\[')
+_SEPARATORS = re.compile(r"[\s,]*")
+
+_BEFORE, _IN_ARRAY, _AFTER = range(3)
+
+
+class SearchStreamParser:
+    """Incremental parser for OMDB search responses.
+
+    :meth:`feed` takes the body in chunks of bytes and returns the ``Search``
+    entries completed by each chunk. :meth:`close` returns the rest of the
+    response (``totalResults``, ``Response``, ``Error``). Only the entry being
+    parsed is buffered, so memory does not grow with the number of entries.
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._head = ""
+        self._tail = []
+        self._state = _BEFORE
+
+    def feed(self, data):
+        """Parse the next chunk of the body.
+
+        Args:
+            data (bytes): The next bytes of the response body.
+
+        Returns:
+            list: ``Search`` entries completed by this chunk, in order.
+        """
+        self._buffer += self._text.decode(data)
+        entries = []
+        if self._state == _BEFORE:
+            match = _SEARCH_KEY.search(self._buffer)
+            if match is None:
+                return entries
+            self._head = self._buffer[:match.start()]
+            self._buffer = self._buffer[match.end():]
+            self._state = _IN_ARRAY
+
+        if self._state == _IN_ARRAY:
+            buffer, position = self._buffer, 0
+            while True:
+                position = _SEPARATORS.match(buffer, position).end()
+                if position == len(buffer):
+                    break
+                if buffer[position] == "]":
+                    self._state = _AFTER
+                    position += 1
+                    break
+                try:
+                    entry, position = self._json.raw_decode(buffer, position)
+                except ValueError:
+                    # The entry continues in a later chunk
+                    break
+                entries.append(entry)
+            self._buffer = buffer[position:]
+
+        if self._state == _AFTER:
+            self._tail.append(self._buffer)
+            self._buffer = ""
+        return entries
+
+    def close(self):
+        """Finish parsing and return the response without its ``Search`` array.
+
+        Returns:
+            dict: The remaining top-level fields, e.g. ``totalResults`` and
+            ``Response``, or the whole response if it had no ``Search`` array.
+
+        Raises:
+            ValueError: If the body was truncated or is not valid JSON.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        if self._state == _BEFORE:
+            return json.loads(self._buffer)
+        if self._state == _IN_ARRAY:
+            raise ValueError("search response ended inside the Search array")
+        envelope = json.loads(self._head + '"Search":[]' + "".join(self._tail) + self._buffer)
+        del envelope["Search"]
+        return envelope
+
+
+def iter_search_entries(chunks):
+    """Yield the ``Search`` entries of a search response body given as chunks of bytes.
+
+    Args:
+        chunks (Iterable[bytes]): The body, e.g. ``response.iter_content(4096)``.
+
+    Yields:
+        dict: Each ``Search`` entry as soon as it is complete.
+
+    Returns:
+        dict: The rest of the response (see :meth:`SearchStreamParser.close`),
+        as the generator's return value.
+    """
+    parser = SearchStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    return parser.close()
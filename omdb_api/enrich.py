@@ -0,0 +1,284 @@
+"""Normalization of fetched records into typed, columnar batches.
+
+:func:`enrich_records` turns a stream of raw OMDB records, e.g. the results of
+:func:`~omdb_api.movie_search.get_movie_by_id_or_title` or
+:func:`~omdb_api.bulk.get_many`, into :class:`ColumnBatch` objects: ``Genre``,
+``Actors`` and the other list fields are split, ``Ratings`` become one 0-100
+score per source, ``Runtime``, ``imdbVotes`` and the other numbers are parsed,
+and records are deduplicated by ``imdbID``.
+
+Normalization is CPU bound, so records are cut into chunks that are normalized
+on a process pool. Only a bounded window of chunks is in flight and the input is
+read only as fast as batches are consumed, so memory stays flat for inputs of
+any size. Each batch holds one column per field of :data:`SCHEMA`; numbers and
+dates are stored in :mod:`array` typed arrays with a validity mask, which are
+compact to send between processes and ready to be written out.
+
+Example:
+    >>> ids = (line.strip() for line in open("ids.txt"))
+    >>> records = (item.result for item in get_many(ids) if item.error is None)
+    >>> for batch in enrich_records(records, max_workers=4):
+    ...     print(len(batch), sum(batch["runtime_minutes"].to_list(0)))
+"""
+
+import datetime
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .bulk import _fan_out
+from .models import NOT_AVAILABLE, parse_date, parse_float, parse_int, parse_list, parse_score, parse_year
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Column kinds
+STRING, INTEGER, FLOAT, DATE, STRING_LIST = "str", "int", "float", "date", "list"
+
+# Output columns: (name, kind, OMDB field, parser)
+SCHEMA = (
+    ("imdb_id", STRING, "imdbID", None),
+    ("title", STRING, "Title", None),
+    ("type", STRING, "Type", None),
+    ("year", INTEGER, "Year", parse_year),
+    ("rated", STRING, "Rated", None),
+    ("released", DATE, "Released", parse_date),
+    ("runtime_minutes", INTEGER, "Runtime", parse_int),
+    ("genres", STRING_LIST, "Genre", parse_list),
+    ("directors", STRING_LIST, "Director", parse_list),
+    ("writers", STRING_LIST, "Writer", parse_list),
+    ("actors", STRING_LIST, "Actors", parse_list),
+    ("languages", STRING_LIST, "Language", parse_list),
+    ("countries", STRING_LIST, "Country", parse_list),
+    ("metascore", INTEGER, "Metascore", parse_int),
+    ("imdb_rating", FLOAT, "imdbRating", parse_float),
+    ("imdb_votes", INTEGER, "imdbVotes", parse_int),
+    ("box_office", INTEGER, "BoxOffice", parse_int),
+    ("total_seasons", INTEGER, "totalSeasons", parse_int),
+    ("rating_imdb", FLOAT, None, None),
+    ("rating_rotten_tomatoes", FLOAT, None, None),
+    ("rating_metacritic", FLOAT, None, None),
+)
+
+# Ratings source -> column with its 0-100 score
+RATING_COLUMNS = {
+    "Internet Movie Database": "rating_imdb",
+    "Rotten Tomatoes": "rating_rotten_tomatoes",
+    "Metacritic": "rating_metacritic",
+}
+
+_EPOCH = datetime.date(1970, 1, 1)
+_TYPECODES = {INTEGER: "q", DATE: "q", FLOAT: "d"}
+
+
+def normalize(record):
+    """Normalize one raw OMDB record.
+
+    Args:
+        record (dict): A full record as returned by an ``i=`` or ``t=`` lookup.
+
+    Returns:
+        dict: One typed value per :data:`SCHEMA` column: ``str``, ``int``,
+        ``float`` and ``datetime.date`` values or None when missing, and tuples
+        for list columns.
+    """
+    values = {}
+    for name, kind, field, parser in SCHEMA:
+        if field is None:
+            continue
+        raw = record.get(field)
+        if parser is not None:
+            values[name] = parser(raw)
+        else:
+            values[name] = None if raw is None or raw == NOT_AVAILABLE else raw
+    for column in RATING_COLUMNS.values():
+        values[column] = None
+    for entry in record.get("Ratings") or ():
+        column = RATING_COLUMNS.get(entry.get("Source"))
+        if column is not None:
+            values[column] = parse_score(entry.get("Value"))
+    return values
+
+
+class Column:
+    """One column of a :class:`ColumnBatch`.
+
+    Storage depends on ``kind``:
+
+    * ``str``: ``values`` is a list of strings, None where missing.
+    * ``int``, ``date``, ``float``: ``values`` is an ``array('q')`` (dates as
+      days since 1970-01-01) or ``array('d')``, and ``valid`` a ``bytearray``
+      with 0 where the value is missing (its slot then holds 0).
+    * ``list``: ``values`` is the flat list of every item, and ``offsets`` an
+      ``array('q')`` where row ``i`` spans ``values[offsets[i]:offsets[i + 1]]``.
+
+    Attributes:
+        name (str): Column name.
+        kind (str): One of ``str``, ``int``, ``float``, ``date``, ``list``.
+        values: Column data, see above.
+        valid (Optional[bytearray]): Validity mask of numeric and date columns.
+        offsets (Optional[array]): Row offsets of list columns.
+    """
+
+    __slots__ = ("name", "kind", "values", "valid", "offsets")
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.valid = None
+        self.offsets = None
+        if kind in _TYPECODES:
+            self.values = array(_TYPECODES[kind])
+            self.valid = bytearray()
+        else:
+            self.values = []
+            if kind == STRING_LIST:
+                self.offsets = array("q", [0])
+
+    def append(self, value):
+        """Append one value, as produced by :func:`normalize`."""
+        if self.kind == STRING:
+            self.values.append(value)
+        elif self.kind == STRING_LIST:
+            self.values.extend(value)
+            self.offsets.append(len(self.values))
+        elif value is None:
+            self.values.append(0)
+            self.valid.append(0)
+        else:
+            self.values.append((value - _EPOCH).days if self.kind == DATE else value)
+            self.valid.append(1)
+
+    def __len__(self):
+        if self.kind == STRING_LIST:
+            return len(self.offsets) - 1
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if self.kind == STRING:
+            return self.values[index]
+        if self.kind == STRING_LIST:
+            return tuple(self.values[self.offsets[index]:self.offsets[index + 1]])
+        if not self.valid[index]:
+            return None
+        value = self.values[index]
+        return _EPOCH + datetime.timedelta(days=value) if self.kind == DATE else value
+
+    def to_list(self, missing=None):
+        """Return the column as a list of Python values, with ``missing`` for missing values."""
+        values = (self[index] for index in range(len(self)))
+        if missing is None:
+            return list(values)
+        return [missing if value is None else value for value in values]
+
+    def __repr__(self):
+        return f"Column(name={self.name!r}, kind={self.kind!r}, length={len(self)})"
+
+
+class ColumnBatch:
+    """A batch of normalized records stored column by column.
+
+    Columns follow :data:`SCHEMA` and are reached by name, ``batch["year"]``.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns=None):
+        self.columns = columns or {name: Column(name, kind) for name, kind, _, _ in SCHEMA}
+
+    def append(self, values):
+        """Append one record normalized by :func:`normalize`."""
+        for name, column in self.columns.items():
+            column.append(values[name])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.columns["imdb_id"])
+
+    def rows(self):
+        """Yield every record as a dict of Python values, like :func:`normalize` returns."""
+        columns = list(self.columns.values())
+        for index in range(len(self)):
+            yield {column.name: column[index] for column in columns}
+
+    def to_pydict(self):
+        """Return ``{column name: list of Python values}``."""
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def __repr__(self):
+        return f"ColumnBatch(rows={len(self)}, columns={len(self.columns)})"
+
+
+def normalize_chunk(records):
+    """Normalize a list of raw records into one :class:`ColumnBatch`."""
+    batch = ColumnBatch()
+    for record in records:
+        batch.append(normalize(record))
+    return batch
+
+
+def _chunks(records, chunk_size, dedupe):
+    seen = set() if dedupe else None
+    chunk = []
+    for record in records:
+        # Accept BulkResult items from get_many as well as plain dicts
+        record = getattr(record, "result", record)
+        if not record or record.get("Response") == "False":
+            continue
+        if seen is not None:
+            imdb_id = record.get("imdbID")
+            if imdb_id in seen:
+                continue
+            if imdb_id is not None:
+                seen.add(imdb_id)
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def enrich_records(records, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True, dedupe=True):
+    """Normalize a stream of raw OMDB records on a process pool.
+
+    ``records`` is consumed lazily in chunks of ``chunk_size``; at most
+    ``2 * max_workers`` chunks are being normalized at a time and no more are
+    read until the consumer takes the finished batches, so memory is bounded
+    by the window whatever the input size. Error responses (``"Response":
+    "False"``) and None results are skipped. The worker processes start on
+    the first ``next()`` and stop when the generator finishes; closing it
+    early cancels chunks that have not started.
+
+    Args:
+        records (Iterable[dict|BulkResult]): Raw records, or the items yielded by
+            :func:`~omdb_api.bulk.get_many` (failed lookups are skipped).
+        max_workers (Optional[int]): Worker processes. Defaults to the CPU count.
+        chunk_size (int): Records per chunk, and so per batch.
+        ordered (bool): Yield batches in input order. When False, batches are
+            yielded as soon as they are normalized.
+        dedupe (bool): Drop records whose ``imdbID`` was already seen. The set of
+            seen IDs is kept in the calling process.
+
+    Yields:
+        ColumnBatch: Normalized records, at most ``chunk_size`` per batch.
+
+    Raises:
+        ValueError: If max_workers or chunk_size is not a positive integer.
+    """
+    max_workers = (os.cpu_count() or 1) if max_workers is None else int(max_workers)
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+    if int(chunk_size) < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    return _enrich(_chunks(records, int(chunk_size), dedupe), max_workers, ordered)
+
+
+def _enrich(chunks, max_workers, ordered):
+    # A generator, so the pool only exists while the caller iterates
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from _fan_out(chunks, normalize_chunk, max_workers, ordered, executor=executor)
@@ -1,12 +1,29 @@
-import requests
 import os
 import sys
-from dotenv import load_dotenv
 
-load_dotenv()
-OMDB_API_KEY = os.getenv("OMDB_API_KEY")
 BASE_URL = "http://www.omdbapi.com/"
 
+_dotenv_loaded = False
+
+
+def __getattr__(name):
+    # Import requests on first use rather than at import time
+    if name == "requests":
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _api_key():
+    """Return OMDB_API_KEY from the environment, loading ``.env`` on the first call."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+    return os.getenv("OMDB_API_KEY")
+
 
 def get_movie_data(title, year=None):
     """Fetch movie data from OMDB API by title and optional year.
@@ -27,15 +44,18 @@ def get_movie_data(title, year=None):
         if year == "":
             year = None
 
-    if not OMDB_API_KEY:
+    api_key = _api_key()
+    if not api_key:
         raise RuntimeError("OMDB_API_KEY not set in environment")
     params = {
         "t": title,
         "y": year,
         "r": "json",
         "plot": "short",
-        "apikey": OMDB_API_KEY
+        "apikey": api_key
     }
+    import requests
+
     response = requests.get(BASE_URL, params=params)
     return response.json()
 
@@ -0,0 +1,341 @@
+"""Columnar export of fetched records to Parquet, Arrow IPC or NumPy ``.npz``.
+
+:class:`ColumnarExporter` accumulates the records returned by
+:func:`~omdb_api.movie_search.get_movie_by_id_or_title` and the entries of
+:func:`~omdb_api.movie_search.search_movies` responses in per-field column
+buffers. Every ``batch_size`` records the buffers are converted with
+vectorized NumPy parsing and appended to the output file as one record batch,
+so exports larger than memory work:
+
+* ``Year``, ``Metascore``, ``imdbVotes`` and ``Runtime`` (in minutes) become
+  64-bit integers and ``imdbRating`` a 64-bit float; ``"N/A"`` is missing.
+* Other fields stay strings; ``Ratings`` is written as compact JSON.
+
+Parquet and Arrow IPC need ``pyarrow``; without it, files are written as NumPy
+``.npz`` archives, read back with :func:`iter_npz_batches`. NumPy is required
+in every case (``pip install omdb-api-wrapper[export]``).
+
+Example:
+    >>> with ColumnarExporter("movies.parquet", batch_size=50000) as exporter:
+    ...     for item in get_many(ids):
+    ...         exporter.add(item.result)
+"""
+
+import json
+import os
+import zipfile
+
+from .models import NOT_AVAILABLE, Movie
+
+FORMATS = ("parquet", "arrow", "npz")
+DEFAULT_BATCH_SIZE = 10000
+
+# Exported fields, in column order
+DEFAULT_FIELDS = tuple(field for field in Movie.FIELDS if field != "Response")
+
+# Numeric fields and how they are parsed
+YEAR, INTEGER, FLOAT = "year", "int", "float"
+NUMERIC_FIELDS = {
+    "Year": YEAR,
+    "Runtime": INTEGER,
+    "Metascore": INTEGER,
+    "imdbRating": FLOAT,
+    "imdbVotes": INTEGER,
+}
+
+# Longest digit string that fits an int64
+_MAX_DIGITS = 18
+
+_SUFFIXES = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow", ".npz": "npz"}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("numpy is required for columnar export: pip install omdb-api-wrapper[export]")
+    return numpy
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise RuntimeError("pyarrow is required for Parquet and Arrow export: pip install pyarrow")
+    return pyarrow
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_format(path, format=None):
+    """Pick the output format for ``path``.
+
+    Args:
+        path (str): Output file; its suffix selects the format when ``format`` is None.
+        format (Optional[str]): 'parquet', 'arrow' or 'npz'.
+
+    Returns:
+        str: The format. Unknown suffixes give 'parquet' when pyarrow is
+        installed, 'npz' otherwise.
+
+    Raises:
+        ValueError: If format is not one of :data:`FORMATS`.
+    """
+    if format is None:
+        format = _SUFFIXES.get(os.path.splitext(str(path))[1].lower())
+        if format is None:
+            format = "parquet" if _has_pyarrow() else "npz"
+    if format not in FORMATS:
+        raise ValueError("format must be one of: " + ", ".join(f"'{name}'" for name in FORMATS))
+    return format
+
+
+def _digits(np, text):
+    """Parse a string array of ASCII digits into int64 by arithmetic on the code points."""
+    lengths = np.char.str_len(text)
+    if text.dtype.itemsize > 4 * _MAX_DIGITS:
+        # Longer values cannot be an int64; dropping them bounds the digit matrix
+        text = np.where(lengths > _MAX_DIGITS, "", text).astype(f"U{_MAX_DIGITS}")
+        lengths = np.char.str_len(text)
+    width = max(1, text.dtype.itemsize // 4)
+    codes = np.char.rjust(text, width, "0").view(np.uint32).reshape(len(text), width).astype(np.int64) - 48
+    is_digit = (codes >= 0) & (codes <= 9)
+    valid = is_digit.all(axis=1) & (lengths > 0)
+    numbers = np.where(is_digit, codes, 0) @ (10 ** np.arange(width - 1, -1, -1, dtype=np.int64))
+    numbers[~valid] = 0
+    return numbers, valid
+
+
+def parse_numeric(values, kind):
+    """Parse a column of OMDB strings into numbers, vectorized with NumPy.
+
+    Args:
+        values (Sequence[Optional[str]]): Raw values; None and ``"N/A"`` are missing.
+        kind (str): 'year' (first four digits of ``"2008–2013"``), 'int'
+            (``"1,900,000"``, ``"136 min"``, ``"$13,960,394"``) or 'float' (``"8.7"``).
+
+    Returns:
+        tuple: ``(numbers, valid)`` arrays: int64 numbers (0 where missing) or
+        float64 numbers (NaN where missing), and a boolean validity mask.
+    """
+    np = _numpy()
+    if kind not in (YEAR, INTEGER, FLOAT):
+        raise ValueError(f"unknown numeric kind: {kind}")
+    if not len(values):
+        return np.zeros(0, dtype=np.float64 if kind == FLOAT else np.int64), np.zeros(0, dtype=bool)
+    # None becomes "None", which no kind accepts as a number; years only need their first 4 characters
+    text = np.array(values, dtype="U4" if kind == YEAR else str)
+    if kind == YEAR:
+        numbers, valid = _digits(np, text)
+        valid &= np.char.str_len(text) == 4
+        numbers[~valid] = 0
+        return numbers, valid
+    if kind == INTEGER:
+        text = np.char.partition(text, " ")[:, 0]
+        return _digits(np, np.char.replace(np.char.replace(text, ",", ""), "$", ""))
+
+    whole, _, fraction = np.char.partition(text, ".").T
+    numbers, valid = _digits(np, whole)
+    fraction_numbers, fraction_valid = _digits(np, fraction)
+    fraction_lengths = np.char.str_len(fraction)
+    valid &= (fraction_lengths == 0) | fraction_valid
+    numbers = numbers + fraction_numbers / 10.0 ** fraction_lengths
+    numbers[~valid] = np.nan
+    return numbers, valid
+
+
+def _records(response):
+    """Yield the records carried by one lookup result, search response or model."""
+    response = getattr(response, "result", response)  # BulkResult
+    if response is None:
+        return
+    if hasattr(response, "to_dict"):
+        response = response.to_dict()
+    if response.get("Response") == "False":
+        return
+    if "Search" in response:
+        yield from response["Search"]
+    else:
+        yield response
+
+
+class ColumnarExporter:
+    """Write records to a columnar file in incremental record batches.
+
+    Args:
+        path (str): Output file.
+        format (Optional[str]): 'parquet', 'arrow' or 'npz'; see :func:`resolve_format`.
+        fields (Optional[Sequence[str]]): OMDB fields to export, in column order.
+            Defaults to :data:`DEFAULT_FIELDS`.
+        batch_size (int): Records buffered before a batch is written.
+
+    Raises:
+        ValueError: If format is unknown or batch_size is not a positive integer.
+        RuntimeError: If a required library is not installed.
+    """
+
+    def __init__(self, path, format=None, fields=None, batch_size=DEFAULT_BATCH_SIZE):
+        if int(batch_size) < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.path = path
+        self.format = resolve_format(path, format)
+        self.fields = tuple(fields) if fields is not None else DEFAULT_FIELDS
+        self.batch_size = int(batch_size)
+        self.rows = 0
+        self.batches = 0
+        _numpy()
+        if self.format != "npz":
+            _pyarrow()
+        self._buffers = {field: [] for field in self.fields}
+        self._buffered = 0
+        self._writer = None
+        self._closed = False
+
+    def add(self, response):
+        """Buffer the records of one result.
+
+        Args:
+            response: A full record, a search response (its ``Search`` entries
+                are added), a :class:`~omdb_api.models.Movie` or
+                :class:`~omdb_api.models.SearchHit`, or a
+                :class:`~omdb_api.bulk.BulkResult`. Error responses and None
+                are skipped.
+
+        Returns:
+            int: Number of records added.
+        """
+        if self._closed:
+            raise RuntimeError("exporter is closed")
+        added = 0
+        for record in _records(response):
+            for field, buffer in self._buffers.items():
+                value = record.get(field)
+                if value == NOT_AVAILABLE:
+                    value = None
+                elif value is not None and not isinstance(value, str):
+                    value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+                buffer.append(value)
+            added += 1
+            self._buffered += 1
+            if self._buffered >= self.batch_size:
+                self.flush()
+        return added
+
+    def add_many(self, responses):
+        """Buffer the records of every result; returns the number of records added."""
+        return sum(self.add(response) for response in responses)
+
+    def flush(self):
+        """Write the buffered records as one record batch."""
+        if not self._buffered:
+            return
+        columns = {}
+        for field, buffer in self._buffers.items():
+            kind = NUMERIC_FIELDS.get(field)
+            columns[field] = parse_numeric(buffer, kind) if kind is not None else buffer
+        if self.format == "npz":
+            self._write_npz(columns)
+        else:
+            self._write_arrow(columns)
+        self.rows += self._buffered
+        self.batches += 1
+        self._buffers = {field: [] for field in self.fields}
+        self._buffered = 0
+
+    def _write_arrow(self, columns):
+        pa = _pyarrow()
+        arrays = []
+        for field, column in columns.items():
+            if isinstance(column, tuple):
+                numbers, valid = column
+                arrays.append(pa.array(numbers, mask=~valid))
+            else:
+                arrays.append(pa.array(column, type=pa.string()))
+        batch = pa.RecordBatch.from_arrays(arrays, names=list(columns))
+        if self._writer is None:
+            if self.format == "parquet":
+                import pyarrow.parquet
+
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, batch.schema)
+            else:
+                self._writer = pa.ipc.new_file(self.path, batch.schema)
+        self._writer.write_batch(batch)
+
+    def _write_npz(self, columns):
+        np = _numpy()
+        from numpy.lib import format as npy
+
+        if self._writer is None:
+            self._writer = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+        prefix = f"{self.batches:06d}/"
+        for field, column in columns.items():
+            if isinstance(column, tuple):
+                arrays = {field: column[0], field + ".valid": column[1]}
+            else:
+                arrays = {field: np.array([value or "" for value in column], dtype=str)}
+            for name, array in arrays.items():
+                with self._writer.open(prefix + name + ".npy", "w", force_zip64=True) as f:
+                    npy.write_array(f, array, allow_pickle=False)
+
+    def close(self):
+        """Write the last batch and close the file."""
+        if self._closed:
+            return
+        self.flush()
+        if self._writer is None:
+            # Nothing was added: still write a valid, empty file
+            if self.format == "npz":
+                self._writer = zipfile.ZipFile(self.path, "w")
+            else:
+                self._write_arrow({field: parse_numeric([], NUMERIC_FIELDS[field]) if field in NUMERIC_FIELDS else []
+                                   for field in self.fields})
+        self._writer.close()
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_records(responses, path, format=None, fields=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Export results to ``path`` with a :class:`ColumnarExporter`.
+
+    Returns:
+        int: Number of records written.
+    """
+    with ColumnarExporter(path, format=format, fields=fields, batch_size=batch_size) as exporter:
+        exporter.add_many(responses)
+    return exporter.rows
+
+
+def iter_npz_batches(path):
+    """Yield the record batches of an ``.npz`` export.
+
+    Yields:
+        dict: ``{field: array}`` per batch. Numeric fields are
+        ``numpy.ma.MaskedArray`` masked where missing; string fields use ``""``
+        for missing values.
+    """
+    np = _numpy()
+    with np.load(path, allow_pickle=False) as archive:
+        batches = sorted({name.split("/", 1)[0] for name in archive.files})
+        for batch in batches:
+            prefix = batch + "/"
+            names = [name[len(prefix):] for name in archive.files if name.startswith(prefix)]
+            columns = {}
+            for name in names:
+                if name.endswith(".valid"):
+                    continue
+                values = archive[prefix + name]
+                if name + ".valid" in names:
+                    values = np.ma.masked_array(values, mask=~archive[prefix + name + ".valid"])
+                columns[name] = values
+            yield columns
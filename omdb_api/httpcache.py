@@ -0,0 +1,230 @@
+"""HTTP caching semantics for upstream requests.
+
+:class:`HttpCache` plugs into :class:`~omdb_api.client.OmdbClient` as
+``http_cache``. Unlike the response caches in :mod:`omdb_api.cache`, which keep
+every answer for a fixed time, it follows what the server says:
+
+* ``Cache-Control`` (``max-age``, ``s-maxage``, ``no-cache``, ``no-store``),
+  ``Age`` and ``Expires`` decide how long a response is served without asking,
+* ``ETag`` and ``Last-Modified`` are kept, and a stale entry is revalidated
+  with ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified``
+  answer costs no body,
+* responses must use a ``Content-Encoding`` the client offered (gzip, deflate,
+  and br when a brotli decoder is installed).
+
+Entries are kept in a pluggable store, a :class:`~omdb_api.cache.TTLCache` in
+memory by default or a :class:`~omdb_api.cache.SqliteCache` on disk, whose own
+time to live bounds how long stale entries stay available for revalidation.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from .cache import TTLCache
+
+# How long entries are kept for revalidation after they go stale, by default
+DEFAULT_RETENTION = 86400.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def parse_cache_control(value):
+    """Parse a ``Cache-Control`` header into a dict of lowercase directives.
+
+    Directives without a value map to True, e.g. ``"no-cache, max-age=60"``
+    becomes ``{"no-cache": True, "max-age": "60"}``.
+    """
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') if argument else True
+    return directives
+
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness_lifetime(headers, default=0.0):
+    """Return how many seconds a response stays fresh, or None if it must not be stored.
+
+    Args:
+        headers (Mapping[str, str]): Response headers (case-insensitive mapping).
+        default (float): Lifetime when the response gives no explicit freshness.
+
+    Returns:
+        Optional[float]: Seconds of freshness left, already reduced by ``Age``.
+    """
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    try:
+        age = max(0.0, float(headers.get("Age") or 0))
+    except ValueError:
+        age = 0.0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(0.0, float(directives[name]) - age)
+            except (TypeError, ValueError):
+                return 0.0
+    if "Expires" in headers:
+        expires = _http_date(headers.get("Expires"))
+        if expires is None:
+            # An invalid Expires means already expired
+            return 0.0
+        date = _http_date(headers.get("Date")) or time.time()
+        return max(0.0, expires - date - age)
+    return default
+
+
+def _accepted_encodings():
+    # Offer exactly what urllib3 can decode: gzip and deflate always, br and zstd when installed
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    return ACCEPT_ENCODING
+
+
+class HttpCache:
+    """Cache of upstream responses honoring HTTP freshness and validators.
+
+    Both bundled stores hand out a fresh copy of an entry on every lookup, so
+    callers may modify the responses they get.
+
+    Args:
+        store (Optional[TTLCache|SqliteCache]): Where entries are kept. Defaults
+            to an in-memory :class:`~omdb_api.cache.TTLCache` keeping entries for
+            :data:`DEFAULT_RETENTION` seconds.
+        default_ttl (float): Freshness of responses without ``Cache-Control``
+            or ``Expires``. 0 revalidates them on every use when they carry a
+            validator, and does not store them otherwise.
+        clock (callable): Wall-clock time source, mainly useful in tests.
+    """
+
+    def __init__(self, store=None, default_ttl=0.0, clock=time.time):
+        if default_ttl < 0:
+            raise ValueError("default_ttl must not be negative")
+        if store is None:
+            store = TTLCache(max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_RETENTION)
+        self.store = store
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.compressed = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._accept_encoding = None
+
+    @property
+    def accept_encoding(self):
+        """str: Encodings the client offers upstream, as in ``Accept-Encoding``."""
+        if self._accept_encoding is None:
+            self._accept_encoding = _accepted_encodings()
+        return self._accept_encoding
+
+    def lookup(self, key):
+        """Return ``(entry, fresh)`` for ``key``; ``entry`` is None when nothing is stored."""
+        entry = self.store.get(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None, False
+        fresh = entry["expires_at"] > self._clock()
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            elif entry.get("etag") or entry.get("last_modified"):
+                self.revalidations += 1
+            else:
+                self.misses += 1
+        return entry, fresh
+
+    def request_headers(self, entry):
+        """Return the conditional headers revalidating a stale ``entry``, if it has validators."""
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def complete(self, key, entry, response, decode):
+        """Finish a request: reuse ``entry`` on 304, otherwise decode and store the response.
+
+        Args:
+            key (tuple): Cache key of the request.
+            entry (Optional[dict]): The stale entry that was revalidated, if any.
+            response (requests.Response): The upstream response.
+            decode (callable): Returns the decoded body of ``response``.
+
+        Returns:
+            The decoded (or revalidated) response body.
+
+        Raises:
+            ValueError: If the response uses an encoding that was not offered,
+                or is a 304 to an unconditional request.
+        """
+        encoding = (response.headers.get("Content-Encoding") or "identity").strip().lower()
+        if encoding != "identity":
+            offered = {name.strip() for name in self.accept_encoding.split(",")}
+            if encoding not in offered:
+                raise ValueError(f"unexpected Content-Encoding: {encoding}")
+            with self._lock:
+                self.compressed += 1
+
+        if response.status_code == 304:
+            if entry is None:
+                raise ValueError("304 Not Modified received for an unconditional request")
+            with self._lock:
+                self.not_modified += 1
+            self._store(key, entry["result"], response.headers, entry)
+            return entry["result"]
+
+        result = decode()
+        if response.status_code == 200:
+            self._store(key, result, response.headers)
+        return result
+
+    def _store(self, key, result, headers, previous=None):
+        lifetime = freshness_lifetime(headers, self.default_ttl)
+        if lifetime is None:
+            self.store.delete(key)
+            return
+        etag = headers.get("ETag") or (previous or {}).get("etag")
+        last_modified = headers.get("Last-Modified") or (previous or {}).get("last_modified")
+        if lifetime <= 0 and not (etag or last_modified):
+            # Neither fresh nor revalidatable: keeping it would never save a byte
+            self.store.delete(key)
+            return
+        self.store.set(key, {
+            "result": result,
+            "expires_at": self._clock() + lifetime,
+            "etag": etag,
+            "last_modified": last_modified,
+        })
+
+    def stats(self):
+        """Return the cache counters.
+
+        Returns:
+            dict: ``hits`` (served fresh), ``misses``, ``revalidations`` (stale
+            entries sent conditionally), ``not_modified`` (304 answers) and
+            ``compressed`` responses.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "compressed": self.compressed,
+            }
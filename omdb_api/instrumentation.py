@@ -0,0 +1,400 @@
+"""Request instrumentation: timing hooks, a metrics collector and exporters.
+
+An :class:`Instrumentation` passed to a client as ``instrumentation`` calls its
+hooks with one :class:`RequestEvent` per lookup, after the lookup finished or
+failed. The event records where the answer came from, the status, attempts,
+response size and how long each phase took. Clients skip all of this when no
+instrumentation (or no hook) is configured, so the cost is one attribute check.
+
+:class:`MetricsCollector` is a hook keeping latency histograms per endpoint
+(``t``, ``i``, ``s``); :func:`prometheus_text` renders it in the Prometheus
+text exposition format. :class:`SpanExporter` turns events into
+OpenTelemetry-style span dicts for any sink::
+
+    metrics = MetricsCollector()
+    client = OmdbClient(instrumentation=Instrumentation([metrics]))
+    ...
+    print(prometheus_text(metrics))
+"""
+
+import os
+import threading
+import time
+
+from .decoding import decode_response
+
+# Histogram upper bounds in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Timed phases of a request, in the order they happen
+PHASES = ("validate", "wait", "ttfb", "download", "parse", "total")
+
+SOURCE_CATALOG = "catalog"
+SOURCE_CACHE = "cache"
+SOURCE_COALESCED = "coalesced"
+SOURCE_HTTP_CACHE = "http_cache"
+SOURCE_UPSTREAM = "upstream"
+
+OUTCOME_OK = "ok"
+OUTCOME_NOT_FOUND = "not_found"
+OUTCOME_ERROR = "error"
+
+
+def endpoint_of(params):
+    """Return the OMDB endpoint a query targets: ``'i'``, ``'t'``, ``'s'`` or ``'other'``."""
+    for endpoint in ("i", "t", "s"):
+        if endpoint in params:
+            return endpoint
+    return "other"
+
+
+class RequestEvent:
+    """Measurements of one lookup, passed to every hook.
+
+    Durations are in seconds and None when the phase did not happen (a cache
+    hit has no ``ttfb``):
+
+    * ``validate``: argument validation before the request, when measured,
+    * ``wait``: time spent waiting on the rate limiter,
+    * ``ttfb``: from sending the request until the response headers arrived,
+      including DNS lookup and connection setup when a new connection is opened,
+    * ``download``: reading the response body,
+    * ``parse``: decoding the JSON body,
+    * ``total``: the whole lookup, validation included.
+
+    Attributes:
+        endpoint (str): ``'i'``, ``'t'``, ``'s'`` or ``'other'``.
+        params (dict): Query parameters without ``apikey``.
+        source (Optional[str]): ``'catalog'``, ``'cache'``, ``'coalesced'``,
+            ``'http_cache'`` (a fresh HTTP cache entry) or ``'upstream'``; None
+            if the lookup failed before being answered.
+        outcome (str): ``'ok'``, ``'not_found'`` for ``"Response": "False"``,
+            or ``'error'`` when an exception was raised.
+        status (Optional[int]): HTTP status of the last attempt.
+        attempts (int): Upstream attempts, retries included.
+        bytes (Optional[int]): Size of the response body in bytes.
+        error (Optional[BaseException]): Exception raised by the lookup.
+        start_time_ns (int): Wall-clock start of the lookup, in nanoseconds.
+    """
+
+    __slots__ = ("endpoint", "params", "source", "outcome", "status", "attempts", "bytes", "error",
+                 "start_time_ns", "_started") + PHASES
+
+    def __init__(self, params, started=None):
+        now = time.perf_counter()
+        self._started = now if started is None else started
+        self.start_time_ns = time.time_ns() - int((now - self._started) * 1e9)
+        self.endpoint = endpoint_of(params)
+        self.params = {name: value for name, value in params.items() if name != "apikey"}
+        self.source = None
+        self.outcome = OUTCOME_OK
+        self.status = None
+        self.attempts = 0
+        self.bytes = None
+        self.error = None
+        for phase in PHASES:
+            setattr(self, phase, None)
+        if started is not None:
+            self.validate = now - started
+
+    def read(self, response, decoder=None):
+        """Download and decode a ``requests`` response, timing both phases.
+
+        Args:
+            response (requests.Response): The response to read, sent with
+                ``stream=True`` so its body has not been downloaded yet.
+            decoder (Optional[callable]): Passed to :func:`~omdb_api.decoding.decode_response`.
+
+        Returns:
+            dict: The decoded JSON body.
+        """
+        elapsed = getattr(response, "elapsed", None)
+        ttfb = elapsed.total_seconds() if elapsed is not None else None
+        if isinstance(ttfb, float):
+            self.ttfb = ttfb
+        started = time.perf_counter()
+        body = response.content
+        downloaded = time.perf_counter()
+        result = decode_response(response, decoder)
+        self.download = downloaded - started
+        self.parse = time.perf_counter() - downloaded
+        if isinstance(body, (bytes, bytearray)):
+            self.bytes = len(body)
+        return result
+
+    def finish(self, result=None, error=None):
+        """Record the outcome and the total duration."""
+        self.total = time.perf_counter() - self._started
+        if error is not None:
+            self.error = error
+            self.outcome = OUTCOME_ERROR
+        elif isinstance(result, dict) and result.get("Response") == "False":
+            self.outcome = OUTCOME_NOT_FOUND
+
+    def phases(self):
+        """Return the measured phase durations as a dict, skipping phases that did not happen."""
+        return {phase: getattr(self, phase) for phase in PHASES if getattr(self, phase) is not None}
+
+    def __repr__(self):
+        return f"RequestEvent(endpoint={self.endpoint!r}, source={self.source!r}, outcome={self.outcome!r})"
+
+
+class Instrumentation:
+    """Registry of hooks called with a :class:`RequestEvent` after every lookup.
+
+    A hook is any callable taking the event. Hooks run on the thread that made
+    the lookup and should return quickly; an exception raised by a hook is
+    counted in :attr:`hook_errors` instead of failing the lookup.
+
+    Args:
+        hooks (Iterable[callable]): Initial hooks.
+    """
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self.hook_errors = 0
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """Register ``hook`` and return it, so it can be used as a decorator."""
+        with self._lock:
+            self.hooks = self.hooks + [hook]
+        return hook
+
+    def remove_hook(self, hook):
+        """Unregister ``hook`` if present."""
+        with self._lock:
+            self.hooks = [registered for registered in self.hooks if registered is not hook]
+
+    def emit(self, event):
+        """Call every hook with ``event``."""
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                with self._lock:
+                    self.hook_errors += 1
+
+
+class MetricsCollector:
+    """Hook aggregating request events into per-endpoint metrics.
+
+    Keeps, per endpoint, a histogram of total latency, the summed duration of
+    every phase, the bytes received, and request counts by source and outcome.
+
+    Args:
+        buckets (Iterable[float]): Histogram upper bounds in seconds.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        if not self.buckets:
+            raise ValueError("buckets must not be empty")
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop every recorded measurement."""
+        with self._lock:
+            self._histograms = {}  # endpoint -> [count per bucket..., count above the last bound]
+            self._sums = {}  # endpoint -> total latency
+            self._phases = {}  # (endpoint, phase) -> summed seconds
+            self._bytes = {}  # endpoint -> bytes received
+            self._requests = {}  # (endpoint, source, outcome) -> count
+
+    def __call__(self, event):
+        bucket = _bucket_index(self.buckets, event.total or 0.0)
+        with self._lock:
+            histogram = self._histograms.get(event.endpoint)
+            if histogram is None:
+                histogram = self._histograms[event.endpoint] = [0] * (len(self.buckets) + 1)
+            histogram[bucket] += 1
+            self._sums[event.endpoint] = self._sums.get(event.endpoint, 0.0) + (event.total or 0.0)
+            for phase, seconds in event.phases().items():
+                key = (event.endpoint, phase)
+                self._phases[key] = self._phases.get(key, 0.0) + seconds
+            if event.bytes is not None:
+                self._bytes[event.endpoint] = self._bytes.get(event.endpoint, 0) + event.bytes
+            key = (event.endpoint, event.source or "none", event.outcome)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def count(self, endpoint=None):
+        """Return the number of recorded lookups, for one endpoint or all of them."""
+        with self._lock:
+            if endpoint is not None:
+                return sum(self._histograms.get(endpoint, ()))
+            return sum(sum(histogram) for histogram in self._histograms.values())
+
+    def quantile(self, endpoint, q):
+        """Estimate a latency quantile from the histogram.
+
+        Args:
+            endpoint (str): ``'i'``, ``'t'``, ``'s'`` or ``'other'``.
+            q (float): Quantile between 0 and 1, e.g. 0.99.
+
+        Returns:
+            Optional[float]: Upper bound of the bucket holding the quantile, or
+            None without measurements. Latencies above the last bucket report
+            ``float('inf')``.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        with self._lock:
+            histogram = list(self._histograms.get(endpoint, ()))
+        total = sum(histogram)
+        if not total:
+            return None
+        rank = max(1, q * total)
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), histogram):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self):
+        """Return a copy of every metric.
+
+        Returns:
+            dict: Per endpoint: ``count``, ``sum``, cumulative ``buckets`` as
+            ``(upper bound, count)`` pairs, ``phases`` (summed seconds),
+            ``bytes`` and ``requests`` keyed by ``(source, outcome)``.
+        """
+        with self._lock:
+            snapshot = {}
+            for endpoint, histogram in self._histograms.items():
+                cumulative, running = [], 0
+                for bound, count in zip(self.buckets + (float("inf"),), histogram):
+                    running += count
+                    cumulative.append((bound, running))
+                snapshot[endpoint] = {
+                    "count": running,
+                    "sum": self._sums[endpoint],
+                    "buckets": cumulative,
+                    "phases": {phase: seconds for (name, phase), seconds in self._phases.items() if name == endpoint},
+                    "bytes": self._bytes.get(endpoint, 0),
+                    "requests": {
+                        (source, outcome): count
+                        for (name, source, outcome), count in self._requests.items() if name == endpoint
+                    },
+                }
+            return snapshot
+
+
+def _bucket_index(buckets, value):
+    for index, bound in enumerate(buckets):
+        if value <= bound:
+            return index
+    return len(buckets)
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(collector, namespace="omdb"):
+    """Render a :class:`MetricsCollector` in the Prometheus text exposition format.
+
+    Args:
+        collector (MetricsCollector): Metrics to render.
+        namespace (str): Prefix of every metric name.
+
+    Returns:
+        str: The exposition, ending with a newline.
+    """
+    snapshot = collector.snapshot()
+    endpoints = sorted(snapshot)
+    lines = [
+        f"# HELP {namespace}_request_duration_seconds OMDB lookup latency by endpoint.",
+        f"# TYPE {namespace}_request_duration_seconds histogram",
+    ]
+    for endpoint in endpoints:
+        metrics = snapshot[endpoint]
+        for bound, count in metrics["buckets"]:
+            lines.append(f"{namespace}_request_duration_seconds_bucket"
+                         f"{_labels(endpoint=endpoint, le=_number(bound))} {count}")
+        lines.append(f"{namespace}_request_duration_seconds_sum{_labels(endpoint=endpoint)} {metrics['sum']!r}")
+        lines.append(f"{namespace}_request_duration_seconds_count{_labels(endpoint=endpoint)} {metrics['count']}")
+
+    lines += [
+        f"# HELP {namespace}_requests_total OMDB lookups by endpoint, source and outcome.",
+        f"# TYPE {namespace}_requests_total counter",
+    ]
+    for endpoint in endpoints:
+        for (source, outcome), count in sorted(snapshot[endpoint]["requests"].items()):
+            lines.append(f"{namespace}_requests_total{_labels(endpoint=endpoint, source=source, outcome=outcome)} "
+                         f"{count}")
+
+    lines += [
+        f"# HELP {namespace}_phase_seconds_total Time spent in each phase of OMDB lookups.",
+        f"# TYPE {namespace}_phase_seconds_total counter",
+    ]
+    for endpoint in endpoints:
+        phases = snapshot[endpoint]["phases"]
+        for phase in PHASES:
+            if phase in phases:
+                lines.append(f"{namespace}_phase_seconds_total{_labels(endpoint=endpoint, phase=phase)} "
+                             f"{phases[phase]!r}")
+
+    lines += [
+        f"# HELP {namespace}_response_bytes_total Response bytes received from OMDB.",
+        f"# TYPE {namespace}_response_bytes_total counter",
+    ]
+    for endpoint in endpoints:
+        lines.append(f"{namespace}_response_bytes_total{_labels(endpoint=endpoint)} {snapshot[endpoint]['bytes']}")
+    return "\n".join(lines) + "\n"
+
+
+class SpanExporter:
+    """Hook turning each request event into an OpenTelemetry-style span.
+
+    Spans are plain dicts shaped like the OTLP JSON encoding (``trace_id``,
+    ``span_id``, ``name``, ``kind``, start and end times in Unix nanoseconds,
+    ``attributes``, ``status``), so they can be forwarded to a collector or
+    logged without depending on the OpenTelemetry SDK.
+
+    Args:
+        sink (callable): Called with every span dict, e.g. ``spans.append``.
+        service_name (str): Value of the ``service.name`` resource attribute.
+    """
+
+    def __init__(self, sink, service_name="omdb-api"):
+        self.sink = sink
+        self.service_name = service_name
+
+    def __call__(self, event):
+        attributes = {
+            "omdb.endpoint": event.endpoint,
+            "omdb.source": event.source,
+            "omdb.outcome": event.outcome,
+            "omdb.attempts": event.attempts,
+        }
+        for name, value in event.params.items():
+            attributes[f"omdb.query.{name}"] = value
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.bytes is not None:
+            attributes["http.response.body.size"] = event.bytes
+        for phase, seconds in event.phases().items():
+            attributes[f"omdb.duration.{phase}"] = seconds
+
+        status = {"code": "STATUS_CODE_OK"}
+        if event.error is not None:
+            status = {"code": "STATUS_CODE_ERROR", "message": f"{type(event.error).__name__}: {event.error}"}
+        self.sink({
+            "trace_id": os.urandom(16).hex(),
+            "span_id": os.urandom(8).hex(),
+            "name": f"omdb {event.endpoint}",
+            "kind": "SPAN_KIND_CLIENT",
+            "start_time_unix_nano": event.start_time_ns,
+            "end_time_unix_nano": event.start_time_ns + int((event.total or 0.0) * 1e9),
+            "attributes": attributes,
+            "status": status,
+            "resource": {"service.name": self.service_name},
+        })
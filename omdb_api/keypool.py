@@ -0,0 +1,219 @@
+"""A pool of OMDB API keys balanced by remaining quota and latency.
+
+:class:`KeyPool` plugs into :class:`~omdb_api.client.OmdbClient` as
+``key_pool``. Every upstream attempt takes the key with the best ratio of
+remaining daily quota to recent latency and in-flight requests, so throughput
+is no longer capped by one key. A key OMDB answers with "Invalid API key!" or
+"Request limit reached!" is ejected and the request is retried with another
+key; ejected keys are re-admitted after a cooldown.
+
+Keys come from a list, the environment (``OMDB_API_KEYS``, comma or space
+separated) or a file with one key per line, optionally followed by its daily
+quota::
+
+    # keys.txt
+    abcd1234
+    efgh5678 100000
+
+Per-key counters are available from :meth:`KeyPool.stats`; they contain the
+keys themselves, so treat them as secrets.
+"""
+
+import datetime
+import os
+import threading
+import time
+
+from .ratelimit import QuotaExceededError
+
+DEFAULT_DAILY_QUOTA = 1000  # OMDB free tier
+DEFAULT_COOLDOWN = 600.0
+DEFAULT_LATENCY = 0.1  # assumed for keys without measurements
+LATENCY_SMOOTHING = 0.2
+
+INVALID_KEY_ERROR = "Invalid API key!"
+LIMIT_REACHED_ERROR = "Request limit reached!"
+REJECTIONS = (INVALID_KEY_ERROR, LIMIT_REACHED_ERROR)
+
+
+def _utc_day(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).date().isoformat()
+
+
+class _Key:
+    __slots__ = ("key", "quota", "used", "day", "in_flight", "latency", "ejected_until", "requests", "failures",
+                 "ejections")
+
+    def __init__(self, key, quota, day):
+        self.key = key
+        self.quota = quota
+        self.used = 0
+        self.day = day
+        self.in_flight = 0
+        self.latency = None
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+
+
+class KeyPool:
+    """Thread-safe pool of API keys.
+
+    Args:
+        keys (Iterable[str|tuple]): Keys, or ``(key, daily_quota)`` pairs.
+        daily_quota (Optional[int]): Requests per UTC day for keys without their
+            own quota. None leaves them unlimited.
+        cooldown (float): Seconds an ejected key stays out of rotation.
+        clock (callable): Wall-clock time source, mainly useful in tests.
+    """
+
+    def __init__(self, keys, daily_quota=DEFAULT_DAILY_QUOTA, cooldown=DEFAULT_COOLDOWN, clock=time.time):
+        if cooldown < 0:
+            raise ValueError("cooldown must not be negative")
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._keys = {}
+        today = _utc_day(clock())
+        for entry in keys:
+            key, quota = entry if isinstance(entry, tuple) else (entry, daily_quota)
+            key = key.strip()
+            if key and key not in self._keys:
+                self._keys[key] = _Key(key, None if quota is None else int(quota), today)
+        if not self._keys:
+            raise ValueError("a key pool needs at least one API key")
+
+    @classmethod
+    def from_env(cls, variable="OMDB_API_KEYS", **kwargs):
+        """Build a pool from ``variable``, falling back to ``OMDB_API_KEY``.
+
+        ``.env`` is loaded first, like :func:`~omdb_api.movie_search.get_api_key` does.
+
+        Raises:
+            ValueError: If no key is configured.
+        """
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        value = os.getenv(variable) or os.getenv("OMDB_API_KEY") or ""
+        return cls(value.replace(",", " ").split(), **kwargs)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Build a pool from a file of ``key [daily_quota]`` lines; ``#`` starts a comment."""
+        keys = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.split("#", 1)[0].split()
+                if len(fields) == 1:
+                    keys.append(fields[0])
+                elif len(fields) >= 2:
+                    keys.append((fields[0], int(fields[1])))
+        return cls(keys, **kwargs)
+
+    def _remaining(self, entry, today):
+        if entry.day != today:
+            entry.day = today
+            entry.used = 0
+        if entry.quota is None:
+            return float("inf")
+        return entry.quota - entry.used
+
+    def acquire(self):
+        """Take the best available key for one request.
+
+        Every acquired key must be given back with :meth:`release`.
+
+        Returns:
+            str: The API key to send.
+
+        Raises:
+            QuotaExceededError: If every key is ejected or out of quota.
+        """
+        now = self._clock()
+        today = _utc_day(now)
+        with self._lock:
+            measured = [entry.latency for entry in self._keys.values() if entry.latency is not None]
+            default_latency = sum(measured) / len(measured) if measured else DEFAULT_LATENCY
+            best, best_score = None, None
+            for entry in self._keys.values():
+                remaining = self._remaining(entry, today)
+                if entry.ejected_until > now or remaining <= 0:
+                    continue
+                latency = entry.latency if entry.latency is not None else default_latency
+                # Unlimited keys compare on latency and load alone
+                budget = 1.0 if remaining == float("inf") else remaining
+                score = budget / ((entry.in_flight + 1) * max(latency, 1e-6))
+                if best_score is None or score > best_score:
+                    best, best_score = entry, score
+            if best is None:
+                raise QuotaExceededError("no API key available: every key is ejected or out of quota")
+            best.in_flight += 1
+            best.used += 1
+            best.requests += 1
+            return best.key
+
+    def release(self, key, latency=None, error=None):
+        """Give back a key taken with :meth:`acquire` and record how the request went.
+
+        Args:
+            key (str): The key.
+            latency (Optional[float]): Seconds the request took; None if it failed.
+            error (Optional[str]): OMDB ``Error`` message of the response, if any.
+
+        Returns:
+            bool: True if OMDB rejected the key, which is then ejected; the
+            request should be retried with another key.
+        """
+        with self._lock:
+            entry = self._keys[key]
+            entry.in_flight = max(0, entry.in_flight - 1)
+            if latency is None:
+                entry.failures += 1
+            elif entry.latency is None:
+                entry.latency = latency
+            else:
+                entry.latency += LATENCY_SMOOTHING * (latency - entry.latency)
+            rejected = error in REJECTIONS
+            if rejected:
+                self._eject(entry)
+            return rejected
+
+    def eject(self, key, cooldown=None):
+        """Take ``key`` out of rotation for ``cooldown`` seconds (default :attr:`cooldown`)."""
+        with self._lock:
+            self._eject(self._keys[key], cooldown)
+
+    def _eject(self, entry, cooldown=None):
+        entry.ejected_until = self._clock() + (self.cooldown if cooldown is None else cooldown)
+        entry.ejections += 1
+
+    def stats(self):
+        """Return per-key counters.
+
+        Returns:
+            dict: For each key: ``used_today``, ``remaining_today`` (None when
+            unlimited), ``in_flight``, ``latency`` (smoothed seconds),
+            ``requests``, ``failures``, ``ejections`` and ``available``.
+        """
+        now = self._clock()
+        today = _utc_day(now)
+        with self._lock:
+            stats = {}
+            for key, entry in self._keys.items():
+                remaining = self._remaining(entry, today)
+                stats[key] = {
+                    "used_today": entry.used,
+                    "remaining_today": None if entry.quota is None else max(0, remaining),
+                    "in_flight": entry.in_flight,
+                    "latency": entry.latency,
+                    "requests": entry.requests,
+                    "failures": entry.failures,
+                    "ejections": entry.ejections,
+                    "available": entry.ejected_until <= now and remaining > 0,
+                }
+            return stats
+
+    def __len__(self):
+        return len(self._keys)
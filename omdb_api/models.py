@@ -0,0 +1,354 @@
+"""Compact, typed models for OMDB records.
+
+OMDB returns every field as a string (``"Year": "1999"``, ``"Runtime": "136 min"``)
+and marks missing values with ``"N/A"``. :class:`Movie` and :class:`SearchHit`
+keep the raw strings in a slotted object, which is much smaller than the decoded
+dict, and parse typed values lazily the first time they are read. Both still
+support dict-style access by OMDB field name for existing code.
+
+Example:
+    >>> movie = Movie(get_movie_by_id_or_title(movie_id="tt0133093"))
+    >>> movie.year, movie.imdb_rating, movie.runtime_minutes
+    (1999, 8.7, 136)
+    >>> movie["Title"]
+    'The Matrix'
+"""
+
+import datetime
+import re
+import sys
+
+NOT_AVAILABLE = "N/A"
+
+_MISSING = object()
+_FIRST_NUMBER = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+# Fields with few distinct values are interned so records share one string object
+_INTERNED_FIELDS = frozenset(["Rated", "Type", "Response", "Language", "Country", "Genre"])
+
+
+def _number(value, convert):
+    if value is None or value == NOT_AVAILABLE:
+        return None
+    match = _FIRST_NUMBER.search(value)
+    if match is None:
+        return None
+    try:
+        return convert(match.group().replace(",", ""))
+    except ValueError:
+        return None
+
+
+def parse_int(value):
+    """Parse the first integer in an OMDB string (``"1,900,000"``, ``"136 min"``, ``"$13,960,394"``).
+
+    Returns:
+        Optional[int]: The number, or None for ``"N/A"``, empty or unparsable values.
+    """
+    return _number(value, lambda text: int(float(text)))
+
+
+def parse_float(value):
+    """Parse the first decimal number in an OMDB string (``"8.7"``).
+
+    Returns:
+        Optional[float]: The number, or None for ``"N/A"``, empty or unparsable values.
+    """
+    return _number(value, float)
+
+
+def parse_year(value):
+    """Parse the first year of an OMDB year string (``"1999"``, ``"2008–2013"``).
+
+    Returns:
+        Optional[int]: The year, or None if missing.
+    """
+    if not value or value == NOT_AVAILABLE:
+        return None
+    match = re.match(r"\d{4}", value)
+    return int(match.group()) if match else None
+
+
+def parse_list(value):
+    """Split a comma separated OMDB field (``"Action, Sci-Fi"``) into a tuple."""
+    if not value or value == NOT_AVAILABLE:
+        return ()
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def parse_date(value):
+    """Parse an OMDB date (``"31 Mar 1999"``).
+
+    Returns:
+        Optional[datetime.date]: The date, or None if missing or unparsable.
+    """
+    if not value or value == NOT_AVAILABLE:
+        return None
+    try:
+        return datetime.datetime.strptime(value, "%d %b %Y").date()
+    except ValueError:
+        return None
+
+
+def parse_score(value):
+    """Normalize a rating value (``"8.7/10"``, ``"87%"``, ``"81/100"``) to a 0-100 score.
+
+    Returns:
+        Optional[float]: The score, or None if unparsable.
+    """
+    if not value or value == NOT_AVAILABLE:
+        return None
+    try:
+        if value.endswith("%"):
+            return float(value[:-1])
+        if "/" in value:
+            score, scale = value.split("/", 1)
+            return float(score) * 100.0 / float(scale)
+    except (ValueError, ZeroDivisionError):
+        pass
+    return None
+
+
+def _optional(value):
+    return None if value == NOT_AVAILABLE else value
+
+
+class _Record:
+    """Slotted, read-only view over one OMDB JSON object."""
+
+    __slots__ = ("_values", "_parsed", "_extra")
+
+    FIELDS = ()
+    _INDEX = {}
+
+    def __init__(self, data):
+        values = []
+        for field in self.FIELDS:
+            value = data.get(field)
+            if isinstance(value, str) and (value == NOT_AVAILABLE or field in _INTERNED_FIELDS):
+                value = sys.intern(value)
+            values.append(value)
+        self._values = tuple(values)
+        self._parsed = None
+        extra = {key: value for key, value in data.items() if key not in self._INDEX}
+        self._extra = extra or None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._INDEX = {field: position for position, field in enumerate(cls.FIELDS)}
+
+    def _raw(self, field):
+        return self._values[self._INDEX[field]]
+
+    def _lazy(self, field, parser):
+        """Return ``parser(raw value)``, parsing it on first access only."""
+        position = self._INDEX[field]
+        if self._parsed is None:
+            self._parsed = [_MISSING] * len(self.FIELDS)
+        value = self._parsed[position]
+        if value is _MISSING:
+            value = self._parsed[position] = parser(self._values[position])
+        return value
+
+    # Dict-compatible access by OMDB field name
+
+    def __getitem__(self, key):
+        position = self._INDEX.get(key)
+        if position is not None and self._values[position] is not None:
+            return self._values[position]
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def keys(self):
+        return list(self.to_dict())
+
+    def values(self):
+        return list(self.to_dict().values())
+
+    def items(self):
+        return list(self.to_dict().items())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.to_dict())
+
+    def to_dict(self):
+        """Return the record as the plain dict OMDB sent."""
+        data = {field: value for field, value in zip(self.FIELDS, self._values) if value is not None}
+        if self._extra is not None:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, _Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(imdb_id={self.imdb_id!r}, title={self.title!r}, year={self.year!r})"
+
+    # Fields shared by full records and search hits
+
+    @property
+    def title(self):
+        """str: Title."""
+        return self._raw("Title")
+
+    @property
+    def imdb_id(self):
+        """str: IMDb ID, e.g. ``"tt0133093"``."""
+        return self._raw("imdbID")
+
+    @property
+    def type(self):
+        """str: ``"movie"``, ``"series"`` or ``"episode"``."""
+        return self._raw("Type")
+
+    @property
+    def year(self):
+        """Optional[int]: First year of release."""
+        return self._lazy("Year", parse_year)
+
+    @property
+    def poster(self):
+        """Optional[str]: Poster URL."""
+        return _optional(self._raw("Poster"))
+
+
+class SearchHit(_Record):
+    """One entry of a search response's ``Search`` list."""
+
+    __slots__ = ()
+
+    FIELDS = ("Title", "Year", "imdbID", "Type", "Poster")
+
+
+class Movie(_Record):
+    """A full title record as returned by an ``i=`` or ``t=`` lookup."""
+
+    __slots__ = ()
+
+    FIELDS = (
+        "Title", "Year", "Rated", "Released", "Runtime", "Genre", "Director", "Writer", "Actors", "Plot",
+        "Language", "Country", "Awards", "Poster", "Ratings", "Metascore", "imdbRating", "imdbVotes", "imdbID",
+        "Type", "DVD", "BoxOffice", "Production", "Website", "totalSeasons", "Response",
+    )
+
+    @property
+    def rated(self):
+        """Optional[str]: Certification, e.g. ``"R"``."""
+        return _optional(self._raw("Rated"))
+
+    @property
+    def released(self):
+        """Optional[datetime.date]: Release date."""
+        return self._lazy("Released", parse_date)
+
+    @property
+    def runtime_minutes(self):
+        """Optional[int]: Runtime in minutes."""
+        return self._lazy("Runtime", parse_int)
+
+    @property
+    def genres(self):
+        """tuple: Genres."""
+        return self._lazy("Genre", parse_list)
+
+    @property
+    def directors(self):
+        """tuple: Directors."""
+        return self._lazy("Director", parse_list)
+
+    @property
+    def writers(self):
+        """tuple: Writers."""
+        return self._lazy("Writer", parse_list)
+
+    @property
+    def actors(self):
+        """tuple: Main actors."""
+        return self._lazy("Actors", parse_list)
+
+    @property
+    def plot(self):
+        """Optional[str]: Plot summary."""
+        return _optional(self._raw("Plot"))
+
+    @property
+    def languages(self):
+        """tuple: Languages."""
+        return self._lazy("Language", parse_list)
+
+    @property
+    def countries(self):
+        """tuple: Countries of production."""
+        return self._lazy("Country", parse_list)
+
+    @property
+    def ratings(self):
+        """dict: Score out of 100 per rating source, e.g. ``{"Rotten Tomatoes": 87.0}``."""
+
+        def parse(entries):
+            return {entry.get("Source"): parse_score(entry.get("Value")) for entry in entries or ()}
+
+        return self._lazy("Ratings", parse)
+
+    @property
+    def metascore(self):
+        """Optional[int]: Metacritic score."""
+        return self._lazy("Metascore", parse_int)
+
+    @property
+    def imdb_rating(self):
+        """Optional[float]: IMDb rating out of 10."""
+        return self._lazy("imdbRating", parse_float)
+
+    @property
+    def imdb_votes(self):
+        """Optional[int]: Number of IMDb votes."""
+        return self._lazy("imdbVotes", parse_int)
+
+    @property
+    def box_office(self):
+        """Optional[int]: Box office gross in dollars."""
+        return self._lazy("BoxOffice", parse_int)
+
+    @property
+    def total_seasons(self):
+        """Optional[int]: Number of seasons, for series."""
+        return self._lazy("totalSeasons", parse_int)
+
+
+def search_hits(response):
+    """Wrap the ``Search`` entries of a search response.
+
+    Args:
+        response (dict): Parsed response from :func:`~omdb_api.movie_search.search_movies`.
+
+    Returns:
+        list: One :class:`SearchHit` per entry; empty for ``"Response": "False"``.
+    """
+    return [SearchHit(entry) for entry in response.get("Search", ())]
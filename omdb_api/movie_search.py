@@ -1,42 +1,91 @@
-import requests
 import os
 import sys
-import json
-from dotenv import load_dotenv
+import time
 
-load_dotenv()
-OMDB_API_KEY = os.getenv("OMDB_API_KEY")
+from .cache import SqliteCache
+from .client import DEFAULT_POOL_MAXSIZE, OmdbClient, get_default_client, set_default_client
+from .output import DEFAULT_FORMAT, FORMATS, make_writer, parse_fields, project
+
+# Explicit API key; when None the key is read from the environment on every call
+OMDB_API_KEY = None
 BASE_URL = "http://www.omdbapi.com/"
 
+_dotenv_loaded = False
 
-def get_movie_by_id_or_title(title=None, movie_id=None, year=None, plot="short", media_type=None):
-    """Fetch movie data from OMDB API by ID or title.
 
-    Args:
-        title (Optional[str]): Movie title to search for.
-        movie_id (Optional[str]): A valid IMDb ID (e.g. tt1285016).
-        year (Optional[int|str]): Year of release (optional).
-        plot (str): Return short or full plot. Options: 'short' (default), 'full'.
-        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
+def get_api_key():
+    """Return the OMDB API key to send.
+
+    :data:`OMDB_API_KEY` wins when set. Otherwise the ``OMDB_API_KEY``
+    environment variable is read, after loading ``.env`` on the first call, so
+    a key exported after import is picked up and importing the package never
+    touches the filesystem. Without it, the first key of ``OMDB_API_KEYS``
+    (see :class:`~omdb_api.keypool.KeyPool`) is used.
 
     Returns:
-        dict: Parsed JSON response from OMDB.
+        Optional[str]: The key, or None if it is not configured.
+    """
+    global _dotenv_loaded
+    if OMDB_API_KEY:
+        return OMDB_API_KEY
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+    key = os.getenv("OMDB_API_KEY")
+    if not key:
+        pooled = (os.getenv("OMDB_API_KEYS") or "").replace(",", " ").split()
+        key = pooled[0] if pooled else key
+    return key
+
+
+def _require_api_key(client=None):
+    """Return the API key to send, or None when ``client`` has a key pool that injects one.
+
+    ``client`` defaults to the shared client.
 
     Raises:
-        ValueError: If neither title nor movie_id is provided, or if both are invalid.
-        RuntimeError: If OMDB_API_KEY is not set.
+        RuntimeError: If no key is configured and the client has no key pool.
+    """
+    api_key = get_api_key()
+    if api_key:
+        return api_key
+    if client is None:
+        client = get_default_client()
+    if getattr(client, "key_pool", None) is not None:
+        return None
+    raise RuntimeError("OMDB_API_KEY not set in environment")
+
+
+def _build_movie_params(title=None, movie_id=None, year=None, plot="short", media_type=None, season=None,
+                        episode=None, client=None):
+    """Validate lookup arguments and build the OMDB query for a single title or ID.
+
+    Shared by :func:`get_movie_by_id_or_title` and the other clients so every
+    entry point applies exactly the same validation. ``season`` (and
+    ``episode`` within it) turn a series lookup into a season or episode lookup.
+    ``client`` is the client the query will be sent through (default: the
+    shared client); when it has a key pool, no ``apikey`` is required.
+
+    Returns:
+        dict: Query parameters, including ``apikey`` unless the client's key pool provides it.
+
+    Raises:
+        ValueError: If neither title nor movie_id is provided, or if an argument is invalid.
+        RuntimeError: If OMDB_API_KEY is not set and the client has no key pool.
     """
     if not movie_id and not title:
         raise ValueError("Either 'title' or 'movie_id' must be provided")
 
-    if not OMDB_API_KEY:
-        raise RuntimeError("OMDB_API_KEY not set in environment")
+    api_key = _require_api_key(client)
 
     params = {
         "r": "json",
         "plot": plot,
-        "apikey": OMDB_API_KEY
     }
+    if api_key:
+        params["apikey"] = api_key
 
     # Use ID if provided, otherwise use title
     if movie_id:
@@ -64,25 +113,35 @@ def get_movie_by_id_or_title(title=None, movie_id=None, year=None, plot="short",
         else:
             raise ValueError("media_type must be one of: 'movie', 'series', 'episode'")
 
-    response = requests.get(BASE_URL, params=params)
-    return response.json()
+    if episode is not None and season is None:
+        raise ValueError("episode requires season")
+    for name, value in (("Season", season), ("Episode", episode)):
+        if value is None:
+            continue
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            value = 0
+        if value < 1:
+            raise ValueError(f"{name.lower()} must be a positive integer")
+        params[name] = str(value)
 
+    return params
 
-def search_movies(search_query, year=None, media_type=None, page=1):
-    """Search for movies by title using OMDB API.
 
-    Args:
-        search_query (str): Movie title to search for (required).
-        year (Optional[int|str]): Year of release (optional).
-        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
-        page (int): Page number to return (1-100). Default: 1.
+def _build_search_params(search_query, year=None, media_type=None, page=1, client=None):
+    """Validate search arguments and build the OMDB query for one search page.
+
+    Shared by :func:`search_movies` and the other clients so every entry point
+    applies exactly the same validation. ``client`` works as in
+    :func:`_build_movie_params`.
 
     Returns:
-        dict: Parsed JSON response from OMDB containing search results.
+        dict: Query parameters, including ``apikey`` unless the client's key pool provides it.
 
     Raises:
         ValueError: If search_query is empty or invalid.
-        RuntimeError: If OMDB_API_KEY is not set.
+        RuntimeError: If OMDB_API_KEY is not set and the client has no key pool.
     """
     if not search_query:
         raise ValueError("search_query must be a non-empty string")
@@ -91,14 +150,14 @@ def search_movies(search_query, year=None, media_type=None, page=1):
     if not search_query:
         raise ValueError("search_query must be a non-empty string")
 
-    if not OMDB_API_KEY:
-        raise RuntimeError("OMDB_API_KEY not set in environment")
+    api_key = _require_api_key(client)
 
     params = {
         "s": search_query,
         "r": "json",
-        "apikey": OMDB_API_KEY
     }
+    if api_key:
+        params["apikey"] = api_key
 
     # Add optional parameters
     if year is not None:
@@ -116,30 +175,102 @@ def search_movies(search_query, year=None, media_type=None, page=1):
     if page is not None:
         try:
             page = int(page)
-            if 1 <= page <= 100:
-                params["page"] = str(page)
-            else:
-                raise ValueError("page must be between 1 and 100")
         except (ValueError, TypeError):
             raise ValueError("page must be a valid integer between 1 and 100")
+        if not 1 <= page <= 100:
+            raise ValueError("page must be between 1 and 100")
+        params["page"] = str(page)
+
+    return params
+
+
+def _fetch(params, client=None, started=None):
+    """Send ``params`` through ``client``, or the shared client pointed at :data:`BASE_URL`.
+
+    ``started`` is the ``time.perf_counter()`` reading taken before validation,
+    so instrumentation hooks can report validation time.
+    """
+    if client is None:
+        return get_default_client().request(params, base_url=BASE_URL, started=started)
+    return client.request(params, started=started)
+
+
+def get_movie_by_id_or_title(title=None, movie_id=None, year=None, plot="short", media_type=None):
+    """Fetch movie data from OMDB API by ID or title.
+
+    Args:
+        title (Optional[str]): Movie title to search for.
+        movie_id (Optional[str]): A valid IMDb ID (e.g. tt1285016).
+        year (Optional[int|str]): Year of release (optional).
+        plot (str): Return short or full plot. Options: 'short' (default), 'full'.
+        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
+
+    Returns:
+        dict: Parsed JSON response from OMDB.
+
+    Raises:
+        ValueError: If neither title nor movie_id is provided, or if both are invalid.
+        RuntimeError: If OMDB_API_KEY is not set.
+    """
+    started = time.perf_counter()
+    params = _build_movie_params(title=title, movie_id=movie_id, year=year, plot=plot, media_type=media_type)
+    return _fetch(params, started=started)
 
-    response = requests.get(BASE_URL, params=params)
-    return response.json()
+
+def search_movies(search_query, year=None, media_type=None, page=1):
+    """Search for movies by title using OMDB API.
+
+    Args:
+        search_query (str): Movie title to search for (required).
+        year (Optional[int|str]): Year of release (optional).
+        media_type (Optional[str]): Type of result to return. Options: 'movie', 'series', 'episode'.
+        page (int): Page number to return (1-100). Default: 1.
+
+    Returns:
+        dict: Parsed JSON response from OMDB containing search results.
+
+    Raises:
+        ValueError: If search_query is empty or invalid.
+        RuntimeError: If OMDB_API_KEY is not set.
+    """
+    started = time.perf_counter()
+    params = _build_search_params(search_query, year=year, media_type=media_type, page=page)
+    return _fetch(params, started=started)
 
 
 def main(argv):
     """Main entry point for command-line usage.
 
     Usage:
-        python movie_search.py --search "Movie Title" [--year YEAR] [--type TYPE] [--page PAGE]
+        python movie_search.py --search "Movie Title" [--year YEAR] [--type TYPE] [--page PAGE|all]
         python movie_search.py --id tt1285016 [--year YEAR] [--type TYPE] [--plot full]
         python movie_search.py "Movie Title" [YEAR]  (legacy mode: search by title)
+        python movie_search.py --batch FILE|- [--workers N] [--order input|completion] [--output FILE] [--csv]
+
+    Any mode accepts ``--cache-dir DIR`` to reuse responses cached on disk by
+    earlier runs.
+
+    Lookups and searches accept ``--format json|ndjson|csv|tsv`` (default
+    ``json``) and ``--fields Title,Year,imdbID`` to keep only some fields. In
+    the ``ndjson``, ``csv`` and ``tsv`` formats a search writes one record per
+    ``Search`` hit, and ``--page all`` walks every result page, writing each
+    page's hits as soon as the page arrives.
+
+    Batch mode reads one IMDb ID or title per line (or CSV rows with a header)
+    and writes NDJSON. With ``--output`` the file is appended to and used as a
+    checkpoint, so rerunning a killed batch skips what it already resolved.
     """
     if len(argv) == 0:
         print("Usage:")
-        print("  Search mode: python movie_search.py --search 'Movie Title' [--year YEAR] [--type TYPE] [--page PAGE]")
+        print("  Search mode: python movie_search.py --search 'Movie Title' [--year YEAR] [--type TYPE]"
+              " [--page PAGE|all]")
         print("  ID mode:     python movie_search.py --id tt1285016 [--year YEAR] [--type TYPE] [--plot full]")
         print("  Legacy mode: python movie_search.py 'Movie Title' [YEAR]")
+        print("  Batch mode:  python movie_search.py --batch FILE|- [--workers N] [--order input|completion]"
+              " [--output FILE] [--csv]")
+        print("  Options:     --cache-dir DIR  reuse responses cached on disk")
+        print("               --format json|ndjson|csv|tsv  output format (default json)")
+        print("               --fields Title,Year,imdbID  only output these fields")
         return 1
 
     # Parse arguments
@@ -150,6 +281,14 @@ def main(argv):
         'media_type': None,
         'plot': 'short',
         'page': 1,
+        'cache_dir': None,
+        'batch': None,
+        'workers': 8,
+        'order': 'input',
+        'output': None,
+        'csv': False,
+        'format': DEFAULT_FORMAT,
+        'fields': None,
     }
 
     i = 0
@@ -180,6 +319,36 @@ def main(argv):
             i += 1
             if i < len(argv):
                 args['page'] = argv[i]
+        elif arg in ['--cache-dir']:
+            i += 1
+            if i < len(argv):
+                args['cache_dir'] = argv[i]
+        elif arg in ['--batch', '-b']:
+            i += 1
+            if i < len(argv):
+                args['batch'] = argv[i]
+        elif arg in ['--workers', '-w']:
+            i += 1
+            if i < len(argv):
+                args['workers'] = argv[i]
+        elif arg in ['--order']:
+            i += 1
+            if i < len(argv):
+                args['order'] = argv[i]
+        elif arg in ['--output', '-o']:
+            i += 1
+            if i < len(argv):
+                args['output'] = argv[i]
+        elif arg in ['--csv']:
+            args['csv'] = True
+        elif arg in ['--format', '-f']:
+            i += 1
+            if i < len(argv):
+                args['format'] = argv[i]
+        elif arg in ['--fields']:
+            i += 1
+            if i < len(argv):
+                args['fields'] = argv[i]
         elif arg.startswith('--'):
             print(f"Unknown option: {arg}")
             return 1
@@ -193,6 +362,26 @@ def main(argv):
 
         i += 1
 
+    if args['batch']:
+        return _run_batch(args)
+
+    import sqlite3
+
+    try:
+        if args['format'] not in FORMATS:
+            raise ValueError("--format must be one of: " + ", ".join(f"'{name}'" for name in FORMATS))
+        fields = parse_fields(args['fields']) if args['fields'] is not None else None
+        if args['page'] == 'all' and args['format'] == 'json':
+            raise ValueError("--page all requires --format ndjson, csv or tsv")
+        previous_client = None
+        if args['cache_dir']:
+            previous_client = set_default_client(OmdbClient(cache=SqliteCache(args['cache_dir'])))
+    except (ValueError, OSError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    writer = make_writer(args['format'], sys.stdout, fields=fields)
+
     # Execute the appropriate function
     try:
         if args['movie_id']:
@@ -214,6 +403,9 @@ def main(argv):
                     plot=args['plot'],
                     media_type=args['media_type']
                 )
+            elif args['format'] != 'json':
+                # Stream one record per hit
+                return _write_search_hits(args, writer)
             else:
                 # Use search mode
                 result = search_movies(
@@ -222,11 +414,17 @@ def main(argv):
                     media_type=args['media_type'],
                     page=args['page']
                 )
+                if fields is not None and 'Search' in result:
+                    result = dict(result, Search=[project(entry, fields) for entry in result['Search']])
+                    writer.fields = None
         else:
-            print("Error: No movie title or ID provided")
+            print("Error: No movie title or ID provided", file=sys.stderr)
             return 1
 
-        print(json.dumps(result, indent=2))
+        if result.get('Response') == 'False':
+            # Keep the Error rather than projecting it away
+            writer.fields = None
+        writer.write(result)
         return 0
 
     except (ValueError, RuntimeError) as e:
@@ -235,6 +433,74 @@ def main(argv):
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
+    finally:
+        writer.close()
+        if args['cache_dir']:
+            set_default_client(previous_client).close()
+
+
+def _write_search_hits(args, writer):
+    """Write every ``Search`` hit of a CLI search as its own record, flushing after each page."""
+    from .bulk import iter_search_pages
+
+    if args['page'] == 'all':
+        pages = iter_search_pages(args['search_query'], year=args['year'], media_type=args['media_type'])
+    else:
+        pages = iter([search_movies(search_query=args['search_query'], year=args['year'],
+                                    media_type=args['media_type'], page=args['page'])])
+
+    for page in pages:
+        if page.get('Response') != 'True':
+            print(f"Error: {page.get('Error', 'No results')}", file=sys.stderr)
+            return 1
+        writer.write_many(page.get('Search', ()))
+        writer.flush()
+    return 0
+
+
+def _run_batch(args):
+    """Run ``--batch`` mode from parsed CLI arguments."""
+    import sqlite3
+
+    from .batch import open_checkpoint, parse_csv, parse_lines, run_batch
+
+    try:
+        try:
+            workers = int(args['workers'])
+        except ValueError:
+            raise ValueError("--workers must be a positive integer")
+        if args['order'] not in ['input', 'completion']:
+            raise ValueError("--order must be one of: 'input', 'completion'")
+
+        cache = SqliteCache(args['cache_dir']) if args['cache_dir'] else None
+        client = OmdbClient(pool_maxsize=max(DEFAULT_POOL_MAXSIZE, workers), cache=cache)
+        source = sys.stdin if args['batch'] == '-' else open(args['batch'], encoding="utf-8", newline="")
+        use_csv = args['csv'] or args['batch'].lower().endswith('.csv')
+
+        skip = set()
+        out = sys.stdout
+        if args['output']:
+            out, skip = open_checkpoint(args['output'])
+
+        previous_client = set_default_client(client)
+        try:
+            queries = parse_csv(source) if use_csv else parse_lines(source)
+            resolved, failed = run_batch(queries, out, max_workers=workers,
+                                         ordered=args['order'] == 'input', skip=skip)
+        finally:
+            set_default_client(previous_client)
+            client.close()
+            if source is not sys.stdin:
+                source.close()
+            if out is not sys.stdout:
+                out.close()
+
+        print(f"Resolved {resolved}, failed {failed}, skipped {len(skip)}", file=sys.stderr)
+        return 1 if failed else 0
+
+    except (ValueError, RuntimeError, OSError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""Record writers for the ``omdb-search`` output formats.
+
+Each writer formats records into an in-memory buffer and writes it to the
+output stream in large chunks, so piping into ``jq`` or a loader costs one
+``write`` per chunk instead of one per line. :meth:`RecordWriter.flush` pushes
+the buffer out early, e.g. after each page of search results.
+
+Formats:
+    ``json``: Each record pretty-printed with ``indent=2`` (the historical output).
+    ``ndjson``: One compact JSON object per line.
+    ``csv`` / ``tsv``: A header row, then one row per record. Nested values such
+    as ``Ratings`` are written as compact JSON.
+"""
+
+import csv
+import io
+import json
+
+FORMATS = ("json", "ndjson", "csv", "tsv")
+DEFAULT_FORMAT = "json"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def parse_fields(value):
+    """Split a ``--fields`` value (``"Title,Year,imdbID"``) into a list of field names.
+
+    Raises:
+        ValueError: If no field name is given.
+    """
+    fields = [field.strip() for field in str(value).split(",") if field.strip()]
+    if not fields:
+        raise ValueError("--fields must list at least one field name")
+    return fields
+
+
+def project(record, fields):
+    """Return ``record`` reduced to ``fields``, in that order.
+
+    Fields the record does not have are None. With ``fields`` None the record is
+    returned unchanged.
+    """
+    if fields is None:
+        return record
+    return {field: record.get(field) for field in fields}
+
+
+class RecordWriter:
+    """Base class: buffer formatted records and write them in chunks.
+
+    Args:
+        out (TextIO): Destination stream.
+        fields (Optional[list]): Field projection applied to every record.
+        chunk_size (int): Buffered characters that trigger a write to ``out``.
+    """
+
+    def __init__(self, out, fields=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self.out = out
+        self.fields = fields
+        self.chunk_size = int(chunk_size)
+        self._buffer = io.StringIO()
+
+    def write(self, record):
+        """Format one record into the buffer, writing the buffer out once it is full."""
+        self._format(project(record, self.fields))
+        if self._buffer.tell() >= self.chunk_size:
+            self._drain()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _format(self, record):
+        raise NotImplementedError
+
+    def _drain(self):
+        if self._buffer.tell():
+            self.out.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+    def flush(self):
+        """Write out everything buffered so far and flush ``out``."""
+        self._drain()
+        self.out.flush()
+
+    def close(self):
+        """Flush the writer. ``out`` itself is left open."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JsonWriter(RecordWriter):
+    """Pretty-print each record as indented JSON."""
+
+    def _format(self, record):
+        self._buffer.write(json.dumps(record, indent=2))
+        self._buffer.write("\n")
+
+
+class NdjsonWriter(RecordWriter):
+    """Write each record as one compact JSON line."""
+
+    def _format(self, record):
+        self._buffer.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self._buffer.write("\n")
+
+
+class DelimitedWriter(RecordWriter):
+    """Write records as delimited rows under a header.
+
+    The columns are ``fields`` when given, otherwise the keys of the first record.
+
+    Args:
+        delimiter (str): Column separator, ``","`` for CSV and ``"\\t"`` for TSV.
+    """
+
+    def __init__(self, out, fields=None, chunk_size=DEFAULT_CHUNK_SIZE, delimiter=","):
+        super().__init__(out, fields=fields, chunk_size=chunk_size)
+        self._columns = None
+        self._rows = csv.writer(self._buffer, delimiter=delimiter, lineterminator="\n")
+
+    @staticmethod
+    def _cell(value):
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return value
+
+    def _format(self, record):
+        if self._columns is None:
+            self._columns = list(self.fields if self.fields is not None else record.keys())
+            self._rows.writerow(self._columns)
+        self._rows.writerow([self._cell(record.get(column)) for column in self._columns])
+
+
+def make_writer(fmt, out, fields=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Create the writer for output format ``fmt``.
+
+    Args:
+        fmt (str): One of :data:`FORMATS`.
+        out (TextIO): Destination stream.
+        fields (Optional[list]): Field projection applied to every record.
+        chunk_size (int): Buffered characters that trigger a write to ``out``.
+
+    Returns:
+        RecordWriter: The writer.
+
+    Raises:
+        ValueError: If ``fmt`` is not a known format.
+    """
+    if fmt == "json":
+        return JsonWriter(out, fields=fields, chunk_size=chunk_size)
+    if fmt == "ndjson":
+        return NdjsonWriter(out, fields=fields, chunk_size=chunk_size)
+    if fmt in ("csv", "tsv"):
+        delimiter = "," if fmt == "csv" else "\t"
+        return DelimitedWriter(out, fields=fields, chunk_size=chunk_size, delimiter=delimiter)
+    raise ValueError("--format must be one of: " + ", ".join(f"'{name}'" for name in FORMATS))
@@ -0,0 +1,294 @@
+"""Local caching proxy in front of OMDB for a fleet of workers.
+
+``omdb-proxy`` serves the OMDB query interface (``i``, ``t``, ``s``, ``y``,
+``type``, ``plot``, ``page``, ``Season``, ``Episode``) over local HTTP. Every
+request goes through one shared :class:`~omdb_api.client.OmdbClient`, so all
+workers share its connection pool, response cache, request coalescing, rate
+limiter and API keys. The proxy injects the API key; the one sent by workers is
+ignored, so any placeholder ``OMDB_API_KEY`` will do on their side. Point the
+lookup functions at it with::
+
+    import omdb_api.movie_search as movie_search
+    movie_search.BASE_URL = "http://127.0.0.1:8080/"
+
+``GET /metrics`` serves request metrics in the Prometheus text format and
+``GET /healthz`` answers ``ok``.
+
+Usage:
+    omdb-proxy [--host HOST] [--port PORT] [--upstream URL] [--cache-ttl SECONDS] [--rate RPS] ...
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .cache import SqliteCache, TTLCache
+from .client import DEFAULT_BASE_URL, OmdbClient
+from .instrumentation import Instrumentation, MetricsCollector, prometheus_text
+from .keypool import DEFAULT_DAILY_QUOTA, KeyPool
+from .ratelimit import QuotaExceededError, RateLimiter
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .singleflight import SingleFlight
+
+# Query parameters forwarded upstream; anything else, including apikey, is dropped
+FORWARDED_PARAMS = ("i", "t", "s", "y", "type", "plot", "page", "Season", "Episode")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_ENTRIES = 100000
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def proxy_params(query):
+    """Build the upstream query from a worker's query string.
+
+    Args:
+        query (dict): Query parameters, each mapped to its first value.
+
+    Returns:
+        dict: The forwarded parameters with ``r=json``, without ``apikey``.
+
+    Raises:
+        ValueError: If the query has no ``i``, ``t`` or ``s``, or asks for a format other than JSON.
+    """
+    if query.get("r", "json").lower() != "json":
+        raise ValueError("Only JSON responses are supported.")
+    params = {name: query[name] for name in FORWARDED_PARAMS if query.get(name)}
+    if not any(name in params for name in ("i", "t", "s")):
+        raise ValueError("Something went wrong.")
+    # Always set, so queries with and without r=json share cache entries
+    params["r"] = "json"
+    return params
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        proxy = self.server.proxy
+        url = urlparse(self.path)
+        if url.path == "/healthz":
+            return self._send(200, b"ok\n", "text/plain; charset=utf-8")
+        if url.path == "/metrics":
+            return self._send(200, proxy.metrics_text().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        status, payload = proxy.handle(query)
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8")
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProxyServer:
+    """OMDB proxy served from a background thread.
+
+    Args:
+        client (OmdbClient): Client every request goes through; configure its
+            cache, single_flight, rate_limiter and key_pool to share them.
+        api_key (Optional[str]): Key injected into upstream requests. Not
+            needed when the client has a key pool.
+        host (str): Interface to listen on.
+        port (int): Port to listen on; 0 picks a free ephemeral port.
+        metrics (Optional[MetricsCollector]): Collector served on ``/metrics``.
+            It should also be a hook of the client's instrumentation.
+
+    Example:
+        >>> client = OmdbClient(cache=TTLCache(), single_flight=SingleFlight())
+        >>> with ProxyServer(client, api_key="abcd1234", port=0) as proxy:
+        ...     movie_search.BASE_URL = proxy.url
+    """
+
+    def __init__(self, client, api_key=None, host=DEFAULT_HOST, port=DEFAULT_PORT, metrics=None):
+        if api_key is None and client.key_pool is None:
+            raise ValueError("the proxy needs an api_key or a client with a key_pool")
+        self.client = client
+        self.api_key = api_key
+        self.host = host
+        self.port = port
+        self.metrics = metrics
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """str: Base URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def handle(self, query):
+        """Answer one worker query.
+
+        Args:
+            query (dict): Query parameters, each mapped to its first value.
+
+        Returns:
+            tuple: ``(status, payload)``. Upstream answers, including OMDB
+            errors such as "Movie not found!", are passed through with status
+            200; proxy failures use OMDB-shaped error payloads.
+        """
+        with self._lock:
+            self.requests += 1
+        try:
+            params = proxy_params(query)
+        except ValueError as e:
+            return self._error(400, str(e))
+        if self.api_key is not None:
+            params["apikey"] = self.api_key
+        try:
+            return 200, self.client.request(params)
+        except QuotaExceededError:
+            return self._error(429, "Request limit reached!")
+        except CircuitOpenError:
+            return self._error(503, "Service Unavailable")
+        except Exception as e:
+            return self._error(502, f"Upstream request failed: {type(e).__name__}")
+
+    def _error(self, status, message):
+        with self._lock:
+            self.errors += 1
+        return status, {"Response": "False", "Error": message}
+
+    def metrics_text(self):
+        """Return the ``/metrics`` page: request metrics and proxy, cache and coalescing counters."""
+        lines = []
+        if self.metrics is not None:
+            lines.append(prometheus_text(self.metrics).rstrip("\n"))
+        counters = {"requests": self.requests, "errors": self.errors}
+        cache = self.client.cache
+        if cache is not None:
+            counters.update(cache_hits=cache.hits, cache_misses=cache.misses)
+        if self.client.single_flight is not None:
+            counters.update(coalesced=self.client.single_flight.shared)
+        for name, value in counters.items():
+            lines.append(f"# TYPE omdb_proxy_{name}_total counter")
+            lines.append(f"omdb_proxy_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _ProxyHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.proxy = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="omdb-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def build_client(upstream=DEFAULT_BASE_URL, cache_ttl=DEFAULT_CACHE_TTL, cache_entries=DEFAULT_CACHE_ENTRIES,
+                 cache_dir=None, rate=None, key_pool=None, pool_maxsize=DEFAULT_POOL_MAXSIZE, metrics=None):
+    """Build the shared client of a proxy: cache, coalescing, retries, circuit breaker and optional rate limit.
+
+    Args:
+        upstream (str): OMDB endpoint.
+        cache_ttl (float): Seconds responses are cached.
+        cache_entries (int): Maximum cached responses.
+        cache_dir (Optional[str]): Keep the cache on disk in this directory
+            (:class:`~omdb_api.cache.SqliteCache`) instead of in memory.
+        rate (Optional[float]): Upstream requests per second. None is unlimited.
+        key_pool (Optional[KeyPool]): API keys to spread requests over.
+        pool_maxsize (int): Upstream connections kept open.
+        metrics (Optional[MetricsCollector]): Collector hooked into the client.
+
+    Returns:
+        OmdbClient: The client.
+    """
+    if cache_dir is not None:
+        cache = SqliteCache(cache_dir, ttl=cache_ttl, max_entries=cache_entries)
+    else:
+        cache = TTLCache(max_entries=cache_entries, ttl=cache_ttl)
+    return OmdbClient(
+        base_url=upstream,
+        pool_maxsize=pool_maxsize,
+        cache=cache,
+        rate_limiter=RateLimiter(rate) if rate is not None else None,
+        retry=RetryPolicy(),
+        circuit_breaker=CircuitBreaker(),
+        single_flight=SingleFlight(),
+        instrumentation=Instrumentation([metrics]) if metrics is not None else None,
+        key_pool=key_pool,
+    )
+
+
+def main(argv=None):
+    """Run the proxy until interrupted."""
+    parser = argparse.ArgumentParser(prog="omdb-proxy", description="Serve a caching OMDB proxy until interrupted.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--upstream", default=DEFAULT_BASE_URL, help="OMDB endpoint")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL, help="seconds responses are cached")
+    parser.add_argument("--cache-entries", type=int, default=DEFAULT_CACHE_ENTRIES)
+    parser.add_argument("--cache-dir", help="keep the cache on disk in this directory")
+    parser.add_argument("--rate", type=float, help="upstream requests per second")
+    parser.add_argument("--daily-quota", type=int, default=DEFAULT_DAILY_QUOTA,
+                        help="requests per key per day, unless set in --keys-file")
+    parser.add_argument("--keys-file", help="file of 'key [daily_quota]' lines; default OMDB_API_KEYS/OMDB_API_KEY")
+    parser.add_argument("--pool-maxsize", type=int, default=DEFAULT_POOL_MAXSIZE, help="upstream connections")
+    options = parser.parse_args(argv)
+
+    try:
+        if options.keys_file:
+            key_pool = KeyPool.from_file(options.keys_file, daily_quota=options.daily_quota)
+        else:
+            key_pool = KeyPool.from_env(daily_quota=options.daily_quota)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    metrics = MetricsCollector()
+    try:
+        client = build_client(options.upstream, options.cache_ttl, options.cache_entries, options.cache_dir,
+                              options.rate, key_pool, options.pool_maxsize, metrics)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        proxy = ProxyServer(client, host=options.host, port=options.port, metrics=metrics).start()
+    except (OSError, OverflowError) as e:
+        client.close()
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"OMDB proxy listening on {proxy.url} ({len(key_pool)} API key(s), upstream {options.upstream})")
+    try:
+        proxy._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+    client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+"""Client-side rate limiting and daily quota budgeting for an OMDB API key.
+
+:class:`RateLimiter` is a token bucket combined with a daily request budget. It
+is safe to share between threads and event loops, and when given a
+``state_path`` it keeps its state in a small SQLite database so that a pool of
+worker processes stays under one key's budget together.
+"""
+
+import datetime
+import threading
+import time
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when the daily request budget of an API key is spent."""
+
+
+class RateLimiter:
+    """Token bucket with a daily quota.
+
+    Each upstream request takes one token. Tokens refill continuously at
+    ``rate`` per second up to ``burst``. Callers that find the bucket empty
+    reserve the next token and sleep until it is due, so waiting callers are
+    served in arrival order without polling. The daily quota resets at UTC
+    midnight, matching OMDB's daily limits.
+
+    Args:
+        rate (float): Sustained requests per second.
+        burst (Optional[int]): Bucket size. Defaults to ``max(1, rate)``.
+        daily_quota (Optional[int]): Requests allowed per UTC day. None disables the budget.
+        state_path (Optional[str]): SQLite file shared by cooperating processes.
+            None keeps the state in memory.
+        clock (callable): Wall-clock time source, mainly useful in tests.
+        sleep (callable): Blocking sleep function, mainly useful in tests.
+    """
+
+    def __init__(self, rate, burst=None, daily_quota=None, state_path=None, clock=time.time, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and int(burst) < 1:
+            raise ValueError("burst must be a positive integer")
+        if daily_quota is not None and int(daily_quota) < 0:
+            raise ValueError("daily_quota must not be negative")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, self.rate))
+        self.daily_quota = None if daily_quota is None else int(daily_quota)
+        self.state_path = state_path
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        now = self._clock()
+        self._state = {"tokens": self.burst, "updated_at": now, "day": self._day(now), "used": 0}
+        if state_path is not None:
+            self._init_shared_state()
+
+    @staticmethod
+    def _day(now):
+        return datetime.datetime.fromtimestamp(now, datetime.timezone.utc).strftime("%Y-%m-%d")
+
+    def _connect(self):
+        import sqlite3
+
+        return sqlite3.connect(self.state_path, timeout=30, isolation_level=None)
+
+    def _init_shared_state(self):
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bucket ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), tokens REAL, updated_at REAL, day TEXT, used INTEGER)"
+            )
+            state = self._state
+            conn.execute(
+                "INSERT OR IGNORE INTO bucket VALUES (0, ?, ?, ?, ?)",
+                (state["tokens"], state["updated_at"], state["day"], state["used"]),
+            )
+        finally:
+            conn.close()
+
+    def _take(self, state, now):
+        """Reserve one token from ``state`` and return how long to wait for it."""
+        day = self._day(now)
+        if state["day"] != day:
+            state["day"], state["used"] = day, 0
+        if self.daily_quota is not None and state["used"] >= self.daily_quota:
+            raise QuotaExceededError(f"Daily quota of {self.daily_quota} requests reached")
+
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * self.rate) - 1
+        state["updated_at"] = now
+        state["used"] += 1
+        return 0.0 if state["tokens"] >= 0 else -state["tokens"] / self.rate
+
+    def _reserve(self):
+        with self._lock:
+            now = self._clock()
+            if self.state_path is None:
+                return self._take(self._state, now)
+
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    tokens, updated_at, day, used = conn.execute(
+                        "SELECT tokens, updated_at, day, used FROM bucket WHERE id = 0"
+                    ).fetchone()
+                    state = {"tokens": tokens, "updated_at": updated_at, "day": day, "used": used}
+                    wait = self._take(state, now)
+                    conn.execute(
+                        "UPDATE bucket SET tokens = ?, updated_at = ?, day = ?, used = ? WHERE id = 0",
+                        (state["tokens"], state["updated_at"], state["day"], state["used"]),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
+            self._state = state
+            return wait
+
+    def acquire(self):
+        """Take one token, sleeping until it is available.
+
+        Raises:
+            QuotaExceededError: If the daily quota is spent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self):
+        """Take one token without blocking the event loop.
+
+        With a ``state_path`` the shared-state transaction, which may wait on
+        other processes' locks, runs on the loop's default executor.
+
+        Raises:
+            QuotaExceededError: If the daily quota is spent.
+        """
+        import asyncio
+
+        if self.state_path is None:
+            wait = self._reserve()
+        else:
+            wait = await asyncio.get_running_loop().run_in_executor(None, self._reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self):
+        """Return the limiter state as last seen by this process.
+
+        Returns:
+            dict: ``used_today``, ``remaining_today`` (None without a quota) and ``tokens``.
+        """
+        with self._lock:
+            state = dict(self._state)
+        remaining = None if self.daily_quota is None else max(0, self.daily_quota - state["used"])
+        return {"used_today": state["used"], "remaining_today": remaining, "tokens": max(0.0, state["tokens"])}
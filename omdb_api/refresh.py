@@ -0,0 +1,258 @@
+"""Cache warm-up and background refresh of hot entries.
+
+A :class:`RefreshScheduler` sits between the lookup functions and a client's
+response cache. :meth:`~RefreshScheduler.warm` fills the cache from a list of
+IDs or titles with bounded concurrency, e.g. right after a deploy. Once
+started, the scheduler counts how often every cached query is asked for and,
+every ``interval`` seconds, refetches the most popular ones that are about to
+expire (or already have), so callers keep being served from the cache instead
+of waiting on upstream. Refreshes go through the client, so its rate limiter,
+key pool, retries and request coalescing apply to them as well.
+"""
+
+import threading
+
+from .batch import parse_lines
+from .bulk import DEFAULT_MAX_WORKERS, _fan_out
+from .cache import make_cache_key
+from .client import get_default_client
+from .movie_search import _build_movie_params
+from .ratelimit import QuotaExceededError
+
+DEFAULT_REFRESH_AHEAD = 60.0
+DEFAULT_INTERVAL = 5.0
+DEFAULT_REFRESH_WORKERS = 4
+DEFAULT_MIN_HITS = 2
+DEFAULT_DECAY = 0.5
+DEFAULT_MAX_TRACKED = 10000
+
+# Decayed hit count below which a query is no longer tracked
+_FORGET_BELOW = 0.1
+
+
+class RefreshScheduler:
+    """Warm a client's cache and refresh its hot entries before they expire.
+
+    Every lookup through the client while the scheduler runs adds one hit to
+    its query. Each cycle, queries with at least ``min_hits`` hits whose cached
+    entry expires within ``refresh_ahead`` seconds are refetched, most hits
+    first, then every count is multiplied by ``decay`` so popularity follows
+    recent traffic.
+
+    Args:
+        client (Optional[OmdbClient]): Client whose cache is managed. Defaults
+            to the shared client, so :func:`~omdb_api.movie_search.get_movie_by_id_or_title`
+            and :func:`~omdb_api.movie_search.search_movies` benefit. It must have a cache.
+        refresh_ahead (float): Seconds before expiry at which a hot entry is refreshed.
+        interval (float): Seconds between two refresh cycles.
+        max_workers (int): Refreshes running at once.
+        min_hits (float): Decayed hits a query needs to be refreshed.
+        decay (float): Factor applied to every hit count after each cycle.
+        max_tracked (int): Most popular queries kept track of.
+
+    Example:
+        >>> set_default_client(OmdbClient(cache=TTLCache(ttl=600), rate_limiter=RateLimiter(5)))
+        >>> with RefreshScheduler(refresh_ahead=60) as scheduler:
+        ...     scheduler.warm(["tt0133093", "The Matrix Reloaded"])
+        ...     movie = get_movie_by_id_or_title(movie_id="tt0133093")  # served from the cache
+    """
+
+    def __init__(self, client=None, refresh_ahead=DEFAULT_REFRESH_AHEAD, interval=DEFAULT_INTERVAL,
+                 max_workers=DEFAULT_REFRESH_WORKERS, min_hits=DEFAULT_MIN_HITS, decay=DEFAULT_DECAY,
+                 max_tracked=DEFAULT_MAX_TRACKED):
+        if refresh_ahead < 0 or interval <= 0:
+            raise ValueError("refresh_ahead must not be negative and interval must be positive")
+        if int(max_workers) < 1 or int(max_tracked) < 1:
+            raise ValueError("max_workers and max_tracked must be positive integers")
+        if not 0 <= decay <= 1:
+            raise ValueError("decay must be between 0 and 1")
+
+        self._shared_client = client is None
+        self.client = get_default_client() if client is None else client
+        if self.client.cache is None:
+            raise ValueError("the client needs a cache to warm and refresh")
+        self.refresh_ahead = refresh_ahead
+        self.interval = interval
+        self.max_workers = int(max_workers)
+        self.min_hits = min_hits
+        self.decay = decay
+        self.max_tracked = int(max_tracked)
+        self.warmed = 0
+        self.refreshes = 0
+        self.errors = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, key, params, base_url=None):
+        """Count one lookup of ``params``; called by the client on every cacheable request.
+
+        Args:
+            key (tuple): The query's cache key.
+            params (dict): Query parameters, kept to refetch the query.
+            base_url (Optional[str]): Endpoint the query was sent to.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [0.0, params, base_url]
+            entry[0] += 1
+            entry[1] = params
+            entry[2] = base_url
+
+    def due(self):
+        """Return the queries to refresh now, most hits first.
+
+        Returns:
+            list: ``(params, base_url)`` pairs of the hot queries whose cached
+            entry is missing or expires within ``refresh_ahead`` seconds.
+        """
+        with self._lock:
+            hot = [(hits, key, params, base_url) for key, (hits, params, base_url) in self._entries.items()
+                   if hits >= self.min_hits]
+        hot.sort(key=lambda item: item[0], reverse=True)
+        cache = self.client.cache
+        due = []
+        for _, key, params, base_url in hot:
+            remaining = cache.expires_in(key)
+            if remaining is None or remaining <= self.refresh_ahead:
+                due.append((params, base_url))
+        return due
+
+    def run_once(self):
+        """Run one refresh cycle and decay the hit counts.
+
+        Refreshes stop early once the daily quota is spent.
+
+        Returns:
+            int: Number of entries refreshed.
+        """
+        refreshed = 0
+        results = _fan_out(self.due(), self._refresh, self.max_workers, ordered=False,
+                           thread_name_prefix="omdb-refresh")
+        try:
+            for error in results:
+                if error is None:
+                    refreshed += 1
+                elif isinstance(error, QuotaExceededError):
+                    break
+        finally:
+            results.close()
+        self._decay()
+        return refreshed
+
+    def _refresh(self, item):
+        params, base_url = item
+        try:
+            self.client.refresh(params, base_url=base_url)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            return e
+        with self._lock:
+            self.refreshes += 1
+        return None
+
+    def _decay(self):
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                entry[0] *= self.decay
+                if entry[0] < _FORGET_BELOW:
+                    del self._entries[key]
+            if len(self._entries) > self.max_tracked:
+                ranked = sorted(self._entries.items(), key=lambda item: item[1][0], reverse=True)
+                self._entries = dict(ranked[:self.max_tracked])
+
+    def warm(self, queries, max_workers=DEFAULT_MAX_WORKERS, plot="short"):
+        """Fill the cache from IDs or titles, running up to ``max_workers`` lookups at once.
+
+        Entries that are already cached are not fetched again.
+
+        Args:
+            queries (Iterable[str|dict]): IMDb IDs (``tt...``) or titles, or
+                query dicts as read by :func:`~omdb_api.batch.parse_csv`
+                (``movie_id``, ``title``, ``year``, ``media_type``, ``plot``).
+            max_workers (int): Lookups running at once.
+            plot (str): Plot length of queries that do not set one.
+
+        Returns:
+            tuple: ``(warmed, failed)`` counts.
+        """
+        if int(max_workers) < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        def items():
+            for query in queries:
+                if isinstance(query, str):
+                    yield from parse_lines([query])
+                else:
+                    yield query
+
+        warmed = failed = 0
+        for error in _fan_out(items(), lambda query: self._warm(query, plot), int(max_workers), ordered=False,
+                              thread_name_prefix="omdb-warm"):
+            if error is None:
+                warmed += 1
+            else:
+                failed += 1
+        with self._lock:
+            self.warmed += warmed
+        return warmed, failed
+
+    def _warm(self, query, plot):
+        try:
+            params = _build_movie_params(client=self.client, **dict({"plot": plot}, **query))
+            if self.client.cache.expires_in(make_cache_key(params)) is None:
+                self.client.refresh(params, base_url=self._base_url())
+        except Exception as e:
+            return e
+        return None
+
+    def _base_url(self):
+        if not self._shared_client:
+            return None
+        from . import movie_search
+
+        return movie_search.BASE_URL
+
+    def stats(self):
+        """Return the scheduler counters.
+
+        Returns:
+            dict: ``tracked`` queries, and ``warmed``, ``refreshes`` and ``errors`` counts.
+        """
+        with self._lock:
+            return {
+                "tracked": len(self._entries),
+                "warmed": self.warmed,
+                "refreshes": self.refreshes,
+                "errors": self.errors,
+            }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+    def start(self):
+        """Start recording lookups and refreshing in a background thread."""
+        self.client.refresher = self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="omdb-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background thread and stop recording lookups."""
+        if self.client.refresher is self:
+            self.client.refresher = None
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
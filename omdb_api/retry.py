@@ -0,0 +1,181 @@
+"""Retries with exponential backoff and a circuit breaker for upstream requests.
+
+:class:`RetryPolicy` decides whether and how long to wait before another
+attempt, and :class:`CircuitBreaker` stops sending requests while OMDB is
+unhealthy so an outage does not turn into a retry storm. Both keep counters
+that can be exported for alerting.
+"""
+
+import random
+import threading
+import time
+
+DEFAULT_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    The delay before retry ``n`` (starting at 0) is drawn uniformly from
+    ``[0, min(max_backoff, backoff_factor * 2 ** n)]``. A numeric ``Retry-After``
+    header on a 429/503 response raises the delay to at least that value.
+
+    Args:
+        max_retries (int): Retries after the first attempt.
+        backoff_factor (float): Base delay in seconds.
+        max_backoff (float): Upper bound for a single delay in seconds.
+        jitter (bool): Randomize delays to spread out retrying callers.
+        retry_statuses (Iterable[int]): HTTP statuses that are retried.
+        random (callable): Source of floats in ``[0, 1)``, mainly useful in tests.
+    """
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30.0, jitter=True,
+                 retry_statuses=DEFAULT_RETRY_STATUSES, random=random.random):
+        if int(max_retries) < 0:
+            raise ValueError("max_retries must not be negative")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+
+        self.max_retries = int(max_retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retries = 0
+        self.exhausted = 0
+        self._random = random
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt, retry_after=None):
+        """Return the delay in seconds before retry number ``attempt``."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay *= self._random()
+        if retry_after is not None:
+            try:
+                delay = max(delay, min(self.max_backoff, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def stats(self):
+        """Return the retry counters.
+
+        Returns:
+            dict: ``retries`` sent and calls that ``exhausted`` every retry.
+        """
+        with self._lock:
+            return {"retries": self.retries, "exhausted": self.exhausted}
+
+
+class CircuitBreaker:
+    """Fail fast while the upstream keeps failing.
+
+    After ``failure_threshold`` consecutive failed attempts the breaker opens and
+    every call raises :class:`CircuitOpenError` without touching the network.
+    Once ``reset_timeout`` seconds have passed a single trial request is let
+    through (half-open): success closes the breaker, failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the breaker.
+        reset_timeout (float): Seconds to stay open before a trial request.
+        clock (callable): Monotonic time source, mainly useful in tests.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        if int(failure_threshold) < 1:
+            raise ValueError("failure_threshold must be a positive integer")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+
+        self.failure_threshold = int(failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """str: ``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def before_call(self):
+        """Check that a request may be sent.
+
+        Returns:
+            bool: True if the request is the half-open trial. Its caller must
+            then report an outcome or call :meth:`release_trial`.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or a half-open trial is already running.
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return False
+            if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = STATE_HALF_OPEN
+            if self._state == STATE_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            raise CircuitOpenError("OMDB circuit breaker is open; upstream is failing")
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._state = STATE_CLOSED
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Give up a half-open trial that ended without reaching upstream, letting another one through."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    self.opened += 1
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+
+    def stats(self):
+        """Return the breaker state and counters.
+
+        Returns:
+            dict: ``state``, ``consecutive_failures``, times ``opened`` and calls ``rejected``.
+        """
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self.consecutive_failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,173 @@
+"""Whole-series lookups: a series, its seasons and optionally every episode.
+
+:func:`get_series_tree` reads ``totalSeasons`` from the series record, fetches
+the seasons concurrently and, when asked, the full record of every episode with
+bounded parallelism. :func:`iter_episodes` yields the same episodes lazily, in
+season order, for series too large to hold in memory at once. Every request
+goes through the client, so a configured cache answers repeated lookups.
+"""
+
+from .bulk import DEFAULT_MAX_WORKERS, _fan_out
+from .models import NOT_AVAILABLE, parse_int
+from .movie_search import _build_movie_params, _fetch
+
+# Error of an episode detail the season listing gives neither an IMDb ID nor a number for
+UNIDENTIFIED_EPISODE_ERROR = "Episode has no IMDb ID or episode number!"
+
+
+def _season_numbers(series, seasons):
+    if seasons == "all":
+        total = parse_int(series.get("totalSeasons")) or 0
+        return list(range(1, total + 1))
+    if isinstance(seasons, (int, str)):
+        seasons = [seasons]
+    numbers = []
+    for season in seasons:
+        try:
+            number = int(season)
+        except (ValueError, TypeError):
+            number = 0
+        if number < 1:
+            raise ValueError("seasons must be 'all' or positive season numbers")
+        numbers.append(number)
+    return numbers
+
+
+def _fetch_series(series_id, client):
+    return _fetch(_build_movie_params(movie_id=series_id, client=client), client)
+
+
+def _iter_seasons(series_id, numbers, max_workers, client):
+    """Yield ``(number, season response)`` in season order, fetched concurrently."""
+
+    def fetch(number):
+        return number, _fetch(_build_movie_params(movie_id=series_id, season=number, client=client), client)
+
+    return _fan_out(numbers, fetch, max_workers, ordered=True, thread_name_prefix="omdb-series")
+
+
+def _iter_episode_details(series_id, episodes, plot, max_workers, client):
+    """Yield the full record of each ``(season number, episode entry)`` pair, in order."""
+
+    def fetch(item):
+        number, entry = item
+        imdb_id = entry.get("imdbID")
+        episode = entry.get("Episode")
+        if imdb_id and imdb_id != NOT_AVAILABLE:
+            params = _build_movie_params(movie_id=imdb_id, plot=plot, client=client)
+        elif episode and episode != NOT_AVAILABLE:
+            params = _build_movie_params(movie_id=series_id, plot=plot, season=number, episode=episode,
+                                         client=client)
+        else:
+            # Without an episode number the lookup would return the season listing
+            return number, {"Season": str(number), **entry, "Response": "False", "Error": UNIDENTIFIED_EPISODE_ERROR}
+        return number, _fetch(params, client)
+
+    return _fan_out(episodes, fetch, max_workers, ordered=True, thread_name_prefix="omdb-episodes")
+
+
+def iter_episodes(series_id, seasons="all", plot="short", details=False, max_workers=DEFAULT_MAX_WORKERS,
+                  client=None):
+    """Lazily yield the episodes of a series in season and episode order.
+
+    Seasons are fetched concurrently, a bounded window ahead of the consumer,
+    and nothing is requested until iteration starts. Seasons OMDB cannot find
+    are skipped.
+
+    Args:
+        series_id (str): IMDb ID of the series (e.g., 'tt0903747').
+        seasons (str|int|Iterable[int]): ``'all'`` (default) or the season numbers to fetch.
+        plot (str): Plot length of episode details: 'short' (default) or 'full'.
+        details (bool): Fetch the full record of every episode instead of the
+            compact season entries.
+        max_workers (int): Maximum number of concurrent requests.
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Yields:
+        dict: One episode per entry, with its ``Season`` number added to
+        compact entries. Full records already carry ``Season``; an entry with
+        neither ``imdbID`` nor ``Episode`` is yielded with ``"Response": "False"``
+        and an ``Error`` instead of being looked up.
+
+    Raises:
+        ValueError: If an argument is invalid or, once iteration starts, the
+            series cannot be found.
+    """
+    if int(max_workers) < 1:
+        raise ValueError("max_workers must be a positive integer")
+    return _iter_episodes(series_id, seasons, plot, details, int(max_workers), client)
+
+
+def _iter_episodes(series_id, seasons, plot, details, max_workers, client):
+    series = _fetch_series(series_id, client)
+    if series.get("Response") == "False":
+        raise ValueError(f"Series not found: {series.get('Error', series_id)}")
+
+    seasons = _iter_seasons(series_id, _season_numbers(series, seasons), max_workers, client)
+    episodes = (
+        (number, entry) for number, response in seasons if response.get("Response") != "False"
+        for entry in response.get("Episodes") or ()
+    )
+    if details:
+        for _, record in _iter_episode_details(series_id, episodes, plot, max_workers, client):
+            yield record
+    else:
+        for number, entry in episodes:
+            yield {"Season": str(number), **entry}
+
+
+def get_series_tree(series_id, seasons="all", plot="short", episodes=False, max_workers=DEFAULT_MAX_WORKERS,
+                    client=None):
+    """Fetch a series with all of its seasons, and optionally every episode record.
+
+    Args:
+        series_id (str): IMDb ID of the series (e.g., 'tt0903747').
+        seasons (str|int|Iterable[int]): ``'all'`` (default) reads
+            ``totalSeasons`` from the series record; otherwise the season
+            numbers to fetch.
+        plot (str): Plot length of episode details: 'short' (default) or 'full'.
+        episodes (bool): Replace the compact season entries with the full
+            record of every episode.
+        max_workers (int): Maximum number of concurrent requests.
+        client (Optional[OmdbClient]): Client to use. Defaults to the shared client.
+
+    Returns:
+        dict: The series record with a ``Seasons`` list of
+        ``{"Season": "1", "Episodes": [...]}``, or the OMDB error response if
+        the series cannot be found. A season OMDB cannot return has an
+        ``Error`` instead of ``Episodes``.
+
+    Raises:
+        ValueError: If an argument is invalid.
+
+    Example:
+        >>> tree = get_series_tree("tt0903747")
+        >>> [len(season["Episodes"]) for season in tree["Seasons"]]
+        [7, 13, 13, 13, 16]
+    """
+    if int(max_workers) < 1:
+        raise ValueError("max_workers must be a positive integer")
+    max_workers = int(max_workers)
+    series = _fetch_series(series_id, client)
+    if series.get("Response") == "False":
+        return series
+
+    tree = dict(series)
+    tree["Seasons"] = []
+    by_number = {}
+    for number, response in _iter_seasons(series_id, _season_numbers(series, seasons), max_workers, client):
+        if response.get("Response") == "False":
+            season = {"Season": str(number), "Error": response.get("Error", "Season not found!")}
+        else:
+            season = {"Season": str(number), "Episodes": list(response.get("Episodes") or ())}
+            by_number[number] = season
+        tree["Seasons"].append(season)
+
+    if episodes:
+        entries = ((number, entry) for number, season in by_number.items() for entry in season["Episodes"])
+        details = {number: [] for number in by_number}
+        for number, record in _iter_episode_details(series_id, entries, plot, max_workers, client):
+            details[number].append(record)
+        for number, records in details.items():
+            by_number[number]["Episodes"] = records
+    return tree
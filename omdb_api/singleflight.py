@@ -0,0 +1,137 @@
+"""Request coalescing for duplicate concurrent lookups.
+
+When many callers ask for the same thing at the same moment, only the first
+one (the leader) performs the upstream call; the others wait for it and share
+its result or exception. :class:`SingleFlight` serves threads and
+:class:`AsyncSingleFlight` serves coroutines on one event loop.
+
+Every caller of a coalesced call gets its own deep copy of the result, so
+callers may modify what they are given.
+"""
+
+import copy
+import threading
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "followers")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls with the same key across threads."""
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """Run ``fn()`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        Args:
+            key (Hashable): Identity of the call, e.g. :func:`~omdb_api.cache.make_cache_key`.
+            fn (callable): Performs the call when this caller is the leader.
+
+        Returns:
+            The leader's return value, copied for each caller when it was shared.
+
+        Raises:
+            Exception: Whatever the leader's ``fn()`` raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                call.followers += 1
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        # Followers copy the result while the leader returns, so it gets its own copy as well
+        return copy.deepcopy(call.result) if call.followers else call.result
+
+    def stats(self):
+        """Return the coalescing counters.
+
+        Returns:
+            dict: Upstream ``calls`` made and callers that ``shared`` another call's result.
+        """
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """Deduplicate concurrent coroutine calls with the same key on one event loop."""
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._tasks = {}
+
+    async def do(self, key, fn):
+        """Await ``fn()`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        The call runs as its own task, so cancelling any caller, the leader
+        included, leaves it running for the others.
+
+        Args:
+            key (Hashable): Identity of the call.
+            fn (callable): Returns the awaitable to run when this caller is the leader.
+
+        Returns:
+            The call's result, copied for each caller when it was shared.
+        """
+        import asyncio
+
+        call = self._tasks.get(key)
+        if call is None:
+            task = asyncio.ensure_future(fn())
+            # [task, followers]
+            call = self._tasks[key] = [task, 0]
+            task.add_done_callback(lambda done: self._finish(key, call))
+            self.calls += 1
+        else:
+            call[1] += 1
+            self.shared += 1
+
+        result = await asyncio.shield(call[0])
+        return copy.deepcopy(result) if call[1] else result
+
+    def _finish(self, key, call):
+        if self._tasks.get(key) is call:
+            del self._tasks[key]
+        task = call[0]
+        # Mark the outcome retrieved so a call whose callers were all cancelled does not log a warning
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        """Return the coalescing counters.
+
+        Returns:
+            dict: Upstream ``calls`` made and callers that ``shared`` another call's result.
+        """
+        return {"calls": self.calls, "shared": self.shared}
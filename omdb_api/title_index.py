@@ -0,0 +1,318 @@
+"""In-process full-text and fuzzy index over titles already fetched.
+
+:class:`TitleIndex` keeps an inverted index from title words to documents, with
+every posting list stored as a compact ``array('I')`` of document numbers, plus
+a trigram index over the vocabulary. A query matches documents that contain
+every query word, where a word may also match:
+
+* as a prefix when it is the last word of the query (``"matr"`` -> ``matrix``),
+* fuzzily when it is not in the vocabulary at all (``"matirx"`` -> ``matrix``),
+  using trigram candidates checked by edit distance.
+
+Matches are ranked by IDF-weighted word scores, a bonus for titles the query
+covers completely, and IMDb votes when known. Results use the ``Search`` entry
+shape of :func:`~omdb_api.movie_search.search_movies`. Like
+:class:`~omdb_api.catalog.Catalog`, an index can be passed to a client as
+``catalog`` to answer searches locally::
+
+    index = TitleIndex()
+    index.add_many(catalog.entries())
+    index.search("matirx relodaed")["Search"][0]["Title"]  # 'The Matrix Reloaded'
+"""
+
+import bisect
+import heapq
+import math
+import sys
+import threading
+from array import array
+
+from .catalog import SEARCH_PAGE_SIZE, normalize_title
+from .models import NOT_AVAILABLE, parse_int, parse_year
+
+# Score multipliers for the ways a query word can match a title word
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.8
+FUZZY_WEIGHTS = (1.0, 0.7, 0.5)  # by edit distance
+
+# Limits on how far one query word is expanded
+MAX_PREFIX_TERMS = 16
+MAX_FUZZY_CANDIDATES = 64
+
+_TYPES = (None, "movie", "series", "episode", "game")
+_TYPE_CODES = {kind: code for code, kind in enumerate(_TYPES)}
+
+
+def _trigrams(term):
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance between ``a`` and ``b``, or ``limit + 1`` once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _contains(postings, doc):
+    position = bisect.bisect_left(postings, doc)
+    return position < len(postings) and postings[position] == doc
+
+
+class TitleIndex:
+    """Inverted title index with prefix and fuzzy matching.
+
+    Safe to share between threads: additions are serialized and searches see
+    every document added before they started.
+    """
+
+    def __init__(self):
+        # Per-document columns, indexed by document number
+        self._titles = []
+        self._years = []
+        self._imdb_ids = []
+        self._posters = []
+        self._types = bytearray()
+        self._year_starts = array("H")
+        self._popularity = array("f")
+        self._lengths = bytearray()
+        self._alive = bytearray()
+        self._replaced = 0
+        self._by_id = {}
+        # Vocabulary: term -> term number, postings per term, trigram -> term numbers
+        self._term_ids = {}
+        self._terms = []
+        self._postings = []
+        self._grams = {}
+        self._sorted_terms = None
+        self._lock = threading.Lock()
+
+    # Building
+
+    def add(self, entry):
+        """Index one title.
+
+        A document with the same ``imdbID`` is replaced.
+
+        Args:
+            entry (dict): A ``Search`` entry or a full record. ``imdbVotes``,
+                when present, raises the title's rank.
+
+        Returns:
+            bool: False if the entry has no ``imdbID`` or title.
+        """
+        imdb_id = entry.get("imdbID")
+        words = normalize_title(entry.get("Title") or "").split()
+        if not imdb_id or not words:
+            return False
+        year = entry.get("Year")
+
+        with self._lock:
+            previous = self._by_id.get(imdb_id)
+            if previous is not None:
+                self._alive[previous] = 0
+                self._replaced += 1
+            doc = len(self._titles)
+            self._by_id[imdb_id] = doc
+            self._titles.append(entry.get("Title"))
+            self._years.append(sys.intern(year) if isinstance(year, str) else year)
+            self._imdb_ids.append(imdb_id)
+            poster = entry.get("Poster")
+            self._posters.append(sys.intern(poster) if poster == NOT_AVAILABLE else poster)
+            self._types.append(_TYPE_CODES.get(entry.get("Type"), 0))
+            self._year_starts.append(parse_year(year) or 0)
+            self._popularity.append(0.25 * math.log10(1 + (parse_int(entry.get("imdbVotes")) or 0)))
+            self._lengths.append(min(len(words), 255))
+            self._alive.append(1)
+
+            for word in set(words):
+                term = self._term_ids.get(word)
+                if term is None:
+                    term = self._add_term(word)
+                # Documents are numbered in insertion order, so every posting list stays sorted
+                self._postings[term].append(doc)
+        return True
+
+    def _add_term(self, word):
+        term = len(self._terms)
+        self._term_ids[word] = term
+        self._terms.append(word)
+        self._postings.append(array("I"))
+        for gram in _trigrams(word):
+            self._grams.setdefault(gram, array("I")).append(term)
+        self._sorted_terms = None
+        return term
+
+    def add_many(self, entries):
+        """Index several titles.
+
+        Returns:
+            int: Number of entries indexed.
+        """
+        return sum(1 for entry in entries if self.add(entry))
+
+    def add_response(self, response):
+        """Index the titles of an OMDB response: every hit of a search page, or a full record.
+
+        Returns:
+            int: Number of entries indexed.
+        """
+        if "Search" in response:
+            return self.add_many(response["Search"])
+        if response.get("Response") == "False":
+            return 0
+        return int(self.add(response))
+
+    # Matching
+
+    def _expand(self, word, last):
+        """Return ``(term number, weight)`` pairs a query word matches."""
+        matches = []
+        term = self._term_ids.get(word)
+        if term is not None:
+            matches.append((term, EXACT_WEIGHT))
+        if last and len(word) >= 2:
+            matches.extend((prefixed, PREFIX_WEIGHT) for prefixed in self._prefixed(word) if prefixed != term)
+        if not matches:
+            matches = self._fuzzy(word)
+        return matches
+
+    def _prefixed(self, prefix):
+        with self._lock:
+            if self._sorted_terms is None:
+                self._sorted_terms = sorted(self._terms)
+            terms = self._sorted_terms
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + "\U0010ffff", start)
+        matches = [self._term_ids[terms[i]] for i in range(start, end)]
+        if len(matches) > MAX_PREFIX_TERMS:
+            matches = heapq.nlargest(MAX_PREFIX_TERMS, matches, key=lambda term: len(self._postings[term]))
+        return matches
+
+    def _fuzzy(self, word):
+        grams = _trigrams(word)
+        shared = {}
+        for gram in grams:
+            for term in self._grams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        limit = 1 if len(word) <= 5 else 2
+        matches = []
+        for term in heapq.nlargest(MAX_FUZZY_CANDIDATES, shared, key=shared.get):
+            distance = _edit_distance(word, self._terms[term], limit)
+            if distance <= limit:
+                matches.append((term, FUZZY_WEIGHTS[distance]))
+        return matches
+
+    def search(self, search_query, year=None, media_type=None, page=1, limit=SEARCH_PAGE_SIZE):
+        """Search indexed titles like :func:`~omdb_api.movie_search.search_movies`.
+
+        Args:
+            search_query (str): Words to match, possibly misspelled or unfinished.
+            year (Optional[int|str]): Year of release.
+            media_type (Optional[str]): 'movie', 'series' or 'episode'.
+            page (int): Page of ``limit`` results to return.
+            limit (int): Results per page.
+
+        Returns:
+            Optional[dict]: A search response (``Search``, ``totalResults``,
+            ``"Response": "True"``) with the best matches first, or None if no
+            title matches.
+        """
+        words = normalize_title(search_query or "").split()
+        if not words:
+            return None
+        year = parse_year(str(year).strip()) if year is not None and str(year).strip() else None
+        type_code = None
+        if media_type:
+            type_code = _TYPE_CODES.get(str(media_type).strip().lower(), -1)
+
+        count = len(self._titles)
+        expansions = []
+        for position, word in enumerate(words):
+            matches = self._expand(word, last=position == len(words) - 1)
+            if not matches:
+                return None
+            expansions.append([
+                (self._postings[term], weight * math.log(1 + count / len(self._postings[term])))
+                for term, weight in matches
+            ])
+        # Start from the query word with the fewest candidate documents
+        expansions.sort(key=lambda lists: sum(len(postings) for postings, _ in lists))
+
+        # Lowest weight first, so a document matched several ways keeps its best weight
+        scores = {}
+        for postings, weight in sorted(expansions[0], key=lambda pair: pair[1]):
+            scores.update(dict.fromkeys(postings, weight))
+        if self._replaced:
+            alive = self._alive
+            scores = {doc: score for doc, score in scores.items() if alive[doc]}
+        if year is not None:
+            year_starts = self._year_starts
+            scores = {doc: score for doc, score in scores.items() if year_starts[doc] == year}
+        if type_code is not None:
+            types = self._types
+            scores = {doc: score for doc, score in scores.items() if types[doc] == type_code}
+        for lists in expansions[1:]:
+            narrowed = {}
+            for postings, weight in sorted(lists, key=lambda pair: pair[1]):
+                if len(scores) * 16 < len(postings):
+                    # Few candidates: binary search each one in the long posting list
+                    matched = [doc for doc in scores if _contains(postings, doc)]
+                else:
+                    matched = scores.keys() & postings
+                narrowed.update((doc, scores[doc] + weight) for doc in matched)
+            scores = narrowed
+        if not scores:
+            return None
+
+        lengths, popularity = self._lengths, self._popularity
+        query_length = len(words)
+
+        def rank(doc):
+            extra_words = lengths[doc] - query_length
+            return scores[doc] + (1.0 if extra_words <= 0 else -0.1 * extra_words) + popularity[doc], -doc
+
+        page = max(1, int(page or 1))
+        best = heapq.nlargest(page * limit, scores, key=rank)[(page - 1) * limit:]
+        if not best:
+            return None
+        return {
+            "Search": [
+                {
+                    "Title": self._titles[doc],
+                    "Year": self._years[doc],
+                    "imdbID": self._imdb_ids[doc],
+                    "Type": _TYPES[self._types[doc]],
+                    "Poster": self._posters[doc],
+                }
+                for doc in best
+            ],
+            "totalResults": str(len(scores)),
+            "Response": "True",
+        }
+
+    def answer(self, params):
+        """Answer an ``s=`` OMDB query from the index.
+
+        Args:
+            params (dict): Query parameters as sent to OMDB.
+
+        Returns:
+            Optional[dict]: The search response, or None for other queries and misses.
+        """
+        if "s" not in params:
+            return None
+        return self.search(params["s"], year=params.get("y"), media_type=params.get("type"),
+                           page=params.get("page", 1))
+
+    def __len__(self):
+        return len(self._by_id)
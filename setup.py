@@ -15,7 +15,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/stevenaubertin/omdb-api-python-wrapper",
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -36,10 +36,21 @@ setup(
         "python-dotenv>=1.0.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "export": [
+            "numpy>=1.21.0",
+            "pyarrow>=12.0.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.11.0",
+            "aiohttp>=3.8.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.4.0",
@@ -48,6 +59,7 @@ setup(
     entry_points={
         "console_scripts": [
             "omdb-search=omdb_api.movie_search:main",
+            "omdb-proxy=omdb_api.proxy:main",
         ],
     },
     keywords="omdb api movie imdb search wrapper",
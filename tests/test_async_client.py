@@ -0,0 +1,180 @@
+"""Tests for async_client module."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from benchmarks.stub_server import default_responder  # noqa: E402
+from omdb_api.async_client import AsyncOmdbClient  # noqa: E402
+from omdb_api.cache import TTLCache  # noqa: E402
+from omdb_api.instrumentation import Instrumentation  # noqa: E402
+from omdb_api.retry import CircuitBreaker, RetryPolicy  # noqa: E402
+
+
+class AsyncStub:
+    """aiohttp stub recording requests and peak concurrency."""
+
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.queries = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, request):
+        self.queries.append(dict(request.query))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if len(self.queries) <= self.failures:
+                return web.json_response({"Response": "False"}, status=503)
+            return web.json_response(default_responder(dict(request.query)))
+        finally:
+            self.in_flight -= 1
+
+
+def run_with_stub(stub, scenario):
+    """Run ``scenario(base_url)`` against a local aiohttp stub server."""
+
+    async def runner():
+        app = web.Application()
+        app.router.add_get("/", stub.handle)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url("/")))
+        finally:
+            await server.close()
+
+    return asyncio.run(runner())
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestAsyncOmdbClient:
+    """Tests for AsyncOmdbClient."""
+
+    def test_get_by_id(self):
+        """Test fetching a movie by IMDb ID."""
+        stub = AsyncStub()
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url) as client:
+                return await client.get(movie_id="tt0133093", plot="full")
+
+        result = run_with_stub(stub, scenario)
+
+        assert result["imdbID"] == "tt0133093"
+        assert stub.queries[0]["plot"] == "full"
+        assert stub.queries[0]["apikey"] == "test_key"
+
+    def test_search(self):
+        """Test searching uses the same parameters as search_movies."""
+        stub = AsyncStub()
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url) as client:
+                return await client.search("Batman", year=2008, media_type="MOVIE", page=2)
+
+        result = run_with_stub(stub, scenario)
+
+        assert len(result["Search"]) == 10
+        assert stub.queries[0] == {"s": "Batman", "r": "json", "apikey": "test_key", "y": "2008",
+                                   "type": "movie", "page": "2"}
+
+    def test_validation_is_shared(self):
+        """Test that invalid arguments raise before any request."""
+        client = AsyncOmdbClient(base_url="http://127.0.0.1:9/")
+
+        with pytest.raises(ValueError, match="Either 'title' or 'movie_id' must be provided"):
+            asyncio.run(client.get())
+        with pytest.raises(ValueError, match="page must be a valid integer"):
+            asyncio.run(client.search("Batman", page="x"))
+        with pytest.raises(ValueError, match="movie_id must be a non-empty string"):
+            asyncio.run(client.gather_ids(["tt0133093", " "]))
+
+    def test_gather_ids_bounds_concurrency(self):
+        """Test that gather_ids keeps results ordered and limits requests in flight."""
+        stub = AsyncStub(delay=0.01)
+        ids = [f"tt{n:07d}" for n in range(20)]
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url, max_in_flight=4) as client:
+                return await client.gather_ids(ids)
+
+        results = run_with_stub(stub, scenario)
+
+        assert [r["imdbID"] for r in results] == ids
+        assert 1 < stub.peak_in_flight <= 4
+
+    def test_cache(self):
+        """Test that cached responses are served without a request."""
+        stub = AsyncStub()
+        cache = TTLCache()
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url, cache=cache) as client:
+                await client.get(movie_id="tt0133093")
+                return await client.get(movie_id="tt0133093")
+
+        result = run_with_stub(stub, scenario)
+
+        assert result["imdbID"] == "tt0133093"
+        assert len(stub.queries) == 1
+
+    def test_retries_server_errors(self):
+        """Test that 5xx responses are retried and recorded by the breaker."""
+        stub = AsyncStub(failures=2)
+        policy = RetryPolicy(max_retries=3, backoff_factor=0)
+        breaker = CircuitBreaker(failure_threshold=5)
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url, retry=policy, circuit_breaker=breaker) as client:
+                return await client.get(movie_id="tt0133093")
+
+        result = run_with_stub(stub, scenario)
+
+        assert result["imdbID"] == "tt0133093"
+        assert len(stub.queries) == 3
+        assert policy.stats()["retries"] == 2
+        assert breaker.stats()["state"] == "closed"
+
+    def test_retries_exhausted(self):
+        """Test that the last retryable response raises."""
+        stub = AsyncStub(failures=10)
+        policy = RetryPolicy(max_retries=1, backoff_factor=0)
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url, retry=policy) as client:
+                return await client.get(movie_id="tt0133093")
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            run_with_stub(stub, scenario)
+        assert policy.stats() == {"retries": 1, "exhausted": 1}
+
+    def test_invalid_max_in_flight(self):
+        """Test that ValueError is raised for a non-positive limit."""
+        with pytest.raises(ValueError, match="max_in_flight"):
+            AsyncOmdbClient(max_in_flight=0)
+
+    def test_instrumentation(self):
+        """Test that instrumentation hooks receive upstream and cache events."""
+        stub = AsyncStub()
+        events = []
+
+        async def scenario(url):
+            async with AsyncOmdbClient(base_url=url, cache=TTLCache(),
+                                       instrumentation=Instrumentation([events.append])) as client:
+                await client.get(movie_id="tt0133093")
+                await client.get(movie_id="tt0133093")
+
+        run_with_stub(stub, scenario)
+        assert [event.source for event in events] == ["upstream", "cache"]
+        assert events[0].status == 200
+        assert events[0].bytes > 0
+        assert events[0].parse is not None
@@ -0,0 +1,158 @@
+"""Tests for batch module."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.batch import load_checkpoint, open_checkpoint, parse_csv, parse_lines, query_key, run_batch
+from omdb_api.client import OmdbClient
+from omdb_api.movie_search import main
+
+
+class TestParsing:
+    """Tests for batch input parsing."""
+
+    def test_parse_lines(self):
+        """Test that IDs and titles are told apart and blanks are skipped."""
+        stream = io.StringIO("tt0133093\n\n# comment\n  The Matrix  \n")
+
+        assert list(parse_lines(stream)) == [{"movie_id": "tt0133093"}, {"title": "The Matrix"}]
+
+    def test_parse_csv(self):
+        """Test that CSV headers map to lookup arguments."""
+        stream = io.StringIO("Title,Year,Type,Notes\n\"Crouching Tiger, Hidden Dragon\",2000,movie,x\n"
+                             "Heat,,,\n")
+
+        assert list(parse_csv(stream)) == [
+            {"title": "Crouching Tiger, Hidden Dragon", "year": "2000", "media_type": "movie"},
+            {"title": "Heat"},
+        ]
+
+
+class TestCheckpoint:
+    """Tests for checkpoint handling."""
+
+    def test_load_checkpoint(self, tmp_path):
+        """Test that only successful, complete records count as resolved."""
+        path = tmp_path / "out.ndjson"
+        path.write_text(
+            json.dumps({"query": {"movie_id": "tt1"}, "result": {}}) + "\n"
+            + json.dumps({"query": {"movie_id": "tt2"}, "error": "boom"}) + "\n"
+            + json.dumps({"query": {"movie_id": "tt4"},
+                          "result": {"Response": "False", "Error": "Request limit reached!"}}) + "\n"
+            + '{"query": {"movie_id": "tt3"}, "res'
+        )
+
+        assert load_checkpoint(str(path)) == {query_key({"movie_id": "tt1"})}
+
+    def test_open_checkpoint_terminates_partial_line(self, tmp_path):
+        """Test that appending starts on a fresh line after a killed run."""
+        path = tmp_path / "out.ndjson"
+        path.write_text('{"query": {"movie_id": "tt3"}, "res')
+
+        out, done = open_checkpoint(str(path))
+        out.write("{}\n")
+        out.close()
+
+        assert done == set()
+        assert path.read_text().splitlines()[-1] == "{}"
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestRunBatch:
+    """Tests for run_batch function."""
+
+    def test_results_in_input_order(self):
+        """Test that every query produces one NDJSON line in input order."""
+        queries = [{"movie_id": f"tt{n:07d}"} for n in range(10)] + [{"title": " "}]
+        out = io.StringIO()
+        with StubServer() as stub, OmdbClient(base_url=stub.url) as client:
+            resolved, failed = run_batch(queries, out, max_workers=4, client=client)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert (resolved, failed) == (10, 1)
+        assert [r["query"] for r in records] == queries
+        assert records[0]["result"]["imdbID"] == "tt0000000"
+        assert records[-1]["error"] == "title must be a non-empty string"
+
+    def test_skip(self):
+        """Test that already resolved queries are not fetched again."""
+        queries = [{"movie_id": "tt0000001"}, {"movie_id": "tt0000002"}]
+        out = io.StringIO()
+        with StubServer() as stub, OmdbClient(base_url=stub.url) as client:
+            run_batch(queries, out, skip={query_key(queries[0])}, client=client)
+
+            assert stub.request_count == 1
+        assert json.loads(out.getvalue())["query"] == queries[1]
+
+    def test_invalid_workers(self):
+        """Test that ValueError is raised for a non-positive worker count."""
+        with pytest.raises(ValueError, match="max_workers"):
+            run_batch([], io.StringIO(), max_workers=0)
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestBatchCli:
+    """Tests for the --batch CLI mode."""
+
+    def test_batch_resumes_from_output(self, tmp_path, capsys):
+        """Test that a rerun with --output only fetches unresolved queries."""
+        source = tmp_path / "ids.txt"
+        source.write_text("tt0000001\ntt0000002\n")
+        output = tmp_path / "out.ndjson"
+
+        with StubServer() as stub, patch("omdb_api.movie_search.BASE_URL", stub.url):
+            assert main(["--batch", str(source), "--workers", "2", "--output", str(output)]) == 0
+            source.write_text("tt0000001\ntt0000002\ntt0000003\n")
+            assert main(["--batch", str(source), "--output", str(output), "--order", "completion"]) == 0
+
+            assert stub.request_count == 3
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [r["result"]["imdbID"] for r in records] == ["tt0000001", "tt0000002", "tt0000003"]
+        assert "skipped 2" in capsys.readouterr().err
+
+    def test_batch_resumes_after_quota_exhausted(self, tmp_path, capsys):
+        """Test that lookups rejected for quota are written as errors and retried by the next run."""
+        source = tmp_path / "ids.txt"
+        source.write_text("".join(f"tt{n:07d}\n" for n in range(5)))
+        output = tmp_path / "out.ndjson"
+        quota = [2]
+
+        def responder(query):
+            if quota[0] == 0:
+                return 401, {"Response": "False", "Error": "Request limit reached!"}
+            quota[0] -= 1
+            return default_responder(query)
+
+        with StubServer(responder=responder) as stub, patch("omdb_api.movie_search.BASE_URL", stub.url):
+            assert main(["--batch", str(source), "--workers", "1", "--output", str(output)]) == 1
+            records = [json.loads(line) for line in output.read_text().splitlines()]
+            assert [r.get("error") for r in records] == [None, None] + ["Request limit reached!"] * 3
+
+            # The quota resets and the rerun only fetches the rejected queries
+            quota[0] = 1000
+            assert main(["--batch", str(source), "--output", str(output)]) == 0
+            assert stub.request_count == 8
+
+        assert len(load_checkpoint(str(output))) == 5
+        assert "Resolved 3, failed 0, skipped 2" in capsys.readouterr().err
+
+    def test_batch_from_stdin(self, capsys):
+        """Test reading queries from stdin and writing NDJSON to stdout."""
+        with StubServer() as stub, patch("omdb_api.movie_search.BASE_URL", stub.url), \
+                patch("sys.stdin", io.StringIO("The Matrix\n")):
+            assert main(["--batch", "-"]) == 0
+
+        record = json.loads(capsys.readouterr().out)
+        assert record == {"query": {"title": "The Matrix"}, "result": record["result"]}
+        assert record["result"]["Title"] == "The Matrix"
+
+    def test_batch_invalid_options(self, tmp_path, capsys):
+        """Test that invalid batch options are reported."""
+        assert main(["--batch", "-", "--workers", "many"]) == 1
+        assert main(["--batch", "-", "--order", "random"]) == 1
+        assert main(["--batch", str(tmp_path / "missing.txt")]) == 1
+        assert capsys.readouterr().err.count("Error:") == 3
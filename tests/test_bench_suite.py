@@ -0,0 +1,73 @@
+"""Tests for the stub server options and the benchmark suite."""
+
+import argparse
+
+import pytest
+import requests
+
+from benchmarks.bench_suite import compare, run
+from benchmarks.stub_server import StubServer, make_responder
+
+
+class TestStubServer:
+    """Tests for the configurable stub server."""
+
+    def test_error_rate(self):
+        """Test that the configured fraction of requests fails with a 503."""
+        with StubServer(error_rate=0.5, seed=1) as stub:
+            statuses = [requests.get(stub.url, params={"i": "tt0000001"}).status_code for _ in range(200)]
+
+        assert stub.error_count == statuses.count(503)
+        assert 60 < statuses.count(503) < 140
+        assert set(statuses) == {200, 503}
+
+    def test_invalid_error_rate(self):
+        """Test that an error rate outside [0, 1] raises ValueError."""
+        with pytest.raises(ValueError, match="error_rate"):
+            StubServer(error_rate=2)
+
+    def test_pages(self):
+        """Test that searches are paginated up to total_results."""
+        responder = make_responder(total_results=25)
+
+        assert len(responder({"s": "Heat", "page": "3"})["Search"]) == 5
+        assert responder({"s": "Heat", "page": "4"})["Response"] == "False"
+        assert responder({"s": "Heat"})["totalResults"] == "25"
+
+    def test_plot_size(self):
+        """Test that records carry a plot of the configured size."""
+        record = make_responder(plot_size=2000)({"i": "tt0133093"})
+
+        assert len(record["Plot"]) == 2000
+        assert record["imdbID"] == "tt0133093"
+
+
+class TestBenchSuite:
+    """Tests for the benchmark suite."""
+
+    def test_run(self):
+        """Test that a small run reports every metric of the selected scenarios."""
+        options = argparse.Namespace(scenario=["single", "bulk", "paginated"], latency=0.0, error_rate=0.1,
+                                     plot_size=100, total_results=30, calls=10, ids=20, workers=4, cli_runs=1)
+        results = run(options)
+
+        assert set(results) == {"single.p50_ms", "single.p99_ms", "bulk.ids_per_s", "paginated.total_s",
+                                "paginated.hits_per_s"}
+        assert results["bulk.ids_per_s"]["better"] == "higher"
+
+    def test_compare(self):
+        """Test that only metrics beyond the tolerance are reported as regressions."""
+        baseline = {
+            "single.p50_ms": {"value": 10.0, "unit": "ms", "better": "lower"},
+            "bulk.ids_per_s": {"value": 1000.0, "unit": "ids/s", "better": "higher"},
+        }
+        results = {
+            "single.p50_ms": {"value": 14.0, "unit": "ms", "better": "lower"},
+            "bulk.ids_per_s": {"value": 400.0, "unit": "ids/s", "better": "higher"},
+            "cli.lookup_ms": {"value": 90.0, "unit": "ms", "better": "lower"},
+        }
+
+        assert compare(results, baseline, tolerance=0.5) == [("bulk.ids_per_s", 1000.0, 400.0)]
+        assert compare(results, baseline, tolerance=0.2) == [
+            ("bulk.ids_per_s", 1000.0, 400.0), ("single.p50_ms", 10.0, 14.0),
+        ]
@@ -0,0 +1,172 @@
+"""Tests for bulk module."""
+
+import itertools
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.bulk import get_many, iter_search, iter_search_pages
+from omdb_api.client import OmdbClient
+
+
+def slow_responder(query):
+    """Answer lower IDs more slowly so completion order differs from input order."""
+    time.sleep(0.05 if query["i"] == "tt0000000" else 0.0)
+    if query["i"] == "tt9999999":
+        return {"Response": "False", "Error": "Incorrect IMDb ID."}
+    return default_responder(query)
+
+
+def paged_responder(query, total=35):
+    """Serve ``total`` search results, ten per page."""
+    page = int(query.get("page", 1))
+    first = (page - 1) * 10
+    if first >= total:
+        return {"Response": "False", "Error": "Movie not found!"}
+    entries = range(first, min(total, first + 10))
+    return {
+        "Search": [{"Title": f"{query['s']} {n}", "imdbID": f"tt{n:07d}"} for n in entries],
+        "totalResults": str(total),
+        "Response": "True",
+    }
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestGetMany:
+    """Tests for get_many function."""
+
+    def test_ordered_results(self):
+        """Test that ordered mode yields results in input order."""
+        ids = [f"tt{n:07d}" for n in range(12)]
+        with StubServer(responder=slow_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            results = list(get_many(ids, max_workers=4, client=client))
+
+        assert [item.index for item in results] == list(range(12))
+        assert [item.result["imdbID"] for item in results] == ids
+        assert all(item.error is None for item in results)
+
+    def test_unordered_results(self):
+        """Test that unordered mode yields every result as it completes."""
+        ids = [f"tt{n:07d}" for n in range(12)]
+        with StubServer(responder=slow_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            results = list(get_many(ids, max_workers=4, ordered=False, client=client))
+
+        assert sorted(item.index for item in results) == list(range(12))
+        assert results[0].movie_id != "tt0000000"
+
+    def test_failures_are_reported_per_item(self):
+        """Test that invalid IDs and upstream errors do not abort the batch."""
+        ids = ["tt0000001", "  ", "tt9999999", "tt0000002"]
+        with StubServer(responder=slow_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            results = list(get_many(ids, max_workers=2, client=client))
+
+        assert isinstance(results[1].error, ValueError)
+        assert results[1].result is None
+        assert results[2].result["Response"] == "False"
+        assert results[3].result["imdbID"] == "tt0000002"
+
+    def test_input_is_consumed_lazily(self):
+        """Test that only a bounded window of IDs is read ahead."""
+        consumed = itertools.count()
+        lock = threading.Lock()
+
+        def ids():
+            for n in itertools.count():
+                with lock:
+                    next(consumed)
+                yield f"tt{n:07d}"
+
+        with StubServer() as stub, OmdbClient(base_url=stub.url) as client:
+            results = get_many(ids(), max_workers=2, client=client)
+            first = [next(results) for _ in range(3)]
+            results.close()
+
+        assert [item.index for item in first] == [0, 1, 2]
+        assert next(consumed) <= 3 + 2 * 2
+
+    def test_invalid_max_workers(self):
+        """Test that ValueError is raised for a non-positive worker count."""
+        with pytest.raises(ValueError, match="max_workers"):
+            list(get_many(["tt0133093"], max_workers=0))
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestIterSearch:
+    """Tests for iter_search function."""
+
+    def test_walks_all_pages_in_order(self):
+        """Test that entries from every page are yielded in page order."""
+        with StubServer(responder=paged_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            entries = list(iter_search("The", client=client, prefetch=2))
+
+            assert [entry["imdbID"] for entry in entries] == [f"tt{n:07d}" for n in range(35)]
+            assert stub.request_count == 4
+
+    def test_max_results_limits_pages(self):
+        """Test that only the pages needed for max_results are fetched."""
+        with StubServer(responder=paged_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            entries = list(iter_search("The", max_results=15, client=client))
+
+            assert len(entries) == 15
+            assert stub.request_count == 2
+
+    def test_stops_when_consumer_stops(self):
+        """Test that closing the generator stops fetching further pages."""
+
+        def responder(query):
+            return paged_responder(query, total=1000)
+
+        with StubServer(responder=responder) as stub, OmdbClient(base_url=stub.url) as client:
+            entries = iter_search("The", client=client, prefetch=2)
+            first = next(entries)
+            entries.close()
+
+            assert first["imdbID"] == "tt0000000"
+            assert stub.request_count <= 3
+
+    def test_no_results(self):
+        """Test that a failed first page yields nothing."""
+
+        def responder(query):
+            return {"Response": "False", "Error": "Movie not found!"}
+
+        with StubServer(responder=responder) as stub, OmdbClient(base_url=stub.url) as client:
+            assert list(iter_search("zzzz", client=client)) == []
+
+    def test_pages(self):
+        """Test that iter_search_pages yields whole pages and surfaces a failed first page."""
+
+        def not_found(query):
+            return {"Response": "False", "Error": "Movie not found!"}
+
+        with StubServer(responder=paged_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            pages = list(iter_search_pages("The", client=client))
+
+        assert [len(page["Search"]) for page in pages] == [10, 10, 10, 5]
+
+        with StubServer(responder=not_found) as stub, OmdbClient(base_url=stub.url) as client:
+            assert list(iter_search_pages("zzzz", client=client)) == [not_found({})]
+
+    def test_filters_are_forwarded(self):
+        """Test that year and media_type are sent with every page."""
+        seen = []
+
+        def responder(query):
+            seen.append(query)
+            return paged_responder(query, total=15)
+
+        with StubServer(responder=responder) as stub, OmdbClient(base_url=stub.url) as client:
+            list(iter_search("The", year=1999, media_type="movie", client=client))
+
+        assert sorted(q["page"] for q in seen) == ["1", "2"]
+        assert all(q["y"] == "1999" and q["type"] == "movie" for q in seen)
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments raise ValueError."""
+        with pytest.raises(ValueError, match="search_query must be a non-empty string"):
+            list(iter_search(""))
+        with pytest.raises(ValueError, match="prefetch"):
+            list(iter_search("The", prefetch=0))
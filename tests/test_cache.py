@@ -0,0 +1,224 @@
+"""Tests for cache module."""
+
+import multiprocessing
+
+import pytest
+
+from omdb_api.cache import SqliteCache, TTLCache, make_cache_key
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function."""
+
+    def test_apikey_is_ignored(self):
+        """Test that the API key does not affect the cache key."""
+        first = make_cache_key({"i": "tt0133093", "r": "json", "apikey": "one"})
+        second = make_cache_key({"apikey": "two", "r": "json", "i": "tt0133093"})
+
+        assert first == second
+        assert ("apikey", "one") not in first
+
+    def test_values_are_normalized(self):
+        """Test that values are compared as strings."""
+        assert make_cache_key({"page": 2}) == make_cache_key({"page": "2"})
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_hit_and_miss(self):
+        """Test that stored values are returned and counted."""
+        cache = TTLCache()
+
+        assert cache.get("key") is None
+        cache.set("key", {"Response": "True"})
+
+        assert cache.get("key") == {"Response": "True"}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_hits_are_copies(self):
+        """Test that modifying a returned value does not change the cached entry."""
+        cache = TTLCache()
+        cache.set("key", {"Title": "The Matrix", "Ratings": [{"Value": "8.7/10"}]})
+
+        first = cache.get("key")
+        first["Title"] = None
+        first["Ratings"].clear()
+        assert cache.get("key") == {"Title": "The Matrix", "Ratings": [{"Value": "8.7/10"}]}
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("key", {"Response": "True"})
+
+        clock.now = 9.9
+        assert cache.get("key") is not None
+        clock.now = 10.0
+        assert cache.get("key") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_expires_in(self):
+        """Test that the remaining lifetime is reported without counting a hit or miss."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("key", {"Response": "True"})
+
+        clock.now = 4
+        assert cache.expires_in("key") == 6
+        assert cache.expires_in("other") is None
+        clock.now = 10
+        assert cache.expires_in("key") is None
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+    def test_negative_results_use_shorter_ttl(self):
+        """Test that "Response": "False" results expire with negative_ttl."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=100, negative_ttl=5, clock=clock)
+        cache.set("found", {"Response": "True"})
+        cache.set("missing", {"Response": "False", "Error": "Movie not found!"})
+
+        clock.now = 6
+        assert cache.get("missing") is None
+        assert cache.get("found") is not None
+
+    def test_zero_negative_ttl_skips_negative_results(self):
+        """Test that negative results are not stored when negative_ttl is 0."""
+        cache = TTLCache(negative_ttl=0)
+        cache.set("missing", {"Response": "False"})
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_delete_and_clear(self):
+        """Test removing entries."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_settings(self):
+        """Test that ValueError is raised for invalid settings."""
+        with pytest.raises(ValueError, match="max_entries"):
+            TTLCache(max_entries=0)
+        with pytest.raises(ValueError, match="ttl"):
+            TTLCache(ttl=0)
+
+
+def _write_entries(directory, worker):
+    cache = SqliteCache(directory)
+    for n in range(50):
+        cache.set(make_cache_key({"i": f"tt{worker}{n:05d}"}), {"Response": "True", "n": n})
+
+
+class TestSqliteCache:
+    """Tests for SqliteCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that values survive a new cache handle on the same directory."""
+        key = make_cache_key({"i": "tt0133093", "r": "json"})
+        SqliteCache(str(tmp_path)).set(key, {"Title": "The Matrix", "Response": "True"})
+
+        cache = SqliteCache(str(tmp_path))
+
+        assert cache.get(key) == {"Title": "The Matrix", "Response": "True"}
+        assert cache.get(make_cache_key({"i": "tt0000000"})) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self, tmp_path):
+        """Test wall-clock expiry and the shorter negative TTL."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path), ttl=100, negative_ttl=5, clock=clock)
+        cache.set("found", {"Response": "True"})
+        cache.set("missing", {"Response": "False"})
+
+        clock.now = 6
+        assert cache.get("missing") is None
+        assert cache.get("found") is not None
+        clock.now = 100
+        assert cache.get("found") is None
+        assert cache.stats()["expirations"] == 2
+
+    def test_expires_in(self, tmp_path):
+        """Test that the remaining lifetime is reported without counting a hit or miss."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path), ttl=100, clock=clock)
+        cache.set("key", {"Response": "True"})
+
+        clock.now = 40
+        assert cache.expires_in("key") == 60
+        assert cache.expires_in("other") is None
+        clock.now = 100
+        assert cache.expires_in("key") is None
+        assert cache.stats()["misses"] == 0
+
+    def test_compaction_enforces_size_cap(self, tmp_path):
+        """Test that compaction drops expired rows, then trims to max_entries."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path), ttl=100, negative_ttl=1, max_entries=3,
+                            compact_interval=1000, clock=clock)
+        cache.set("gone", {"Response": "False"})
+        for n in range(5):
+            clock.now = n
+            cache.set(f"key{n}", {"Response": "True"})
+
+        clock.now = 10
+        assert cache.compact() == 3
+        assert len(cache) == 3
+        assert cache.get("key0") is None
+        assert cache.get("key4") is not None
+        assert cache.stats()["evictions"] == 2
+
+    def test_periodic_compaction(self, tmp_path):
+        """Test that compaction runs every compact_interval writes."""
+        cache = SqliteCache(str(tmp_path), max_entries=2, compact_interval=4)
+        for n in range(4):
+            cache.set(f"key{n}", {"Response": "True"})
+
+        assert len(cache) == 2
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that several processes can write the same cache at once."""
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_write_entries, args=(str(tmp_path), n)) for n in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        assert len(SqliteCache(str(tmp_path))) == 150
+
+    def test_invalid_settings(self, tmp_path):
+        """Test that ValueError is raised for invalid settings."""
+        with pytest.raises(ValueError, match="max_entries"):
+            SqliteCache(str(tmp_path), max_entries=0)
@@ -0,0 +1,134 @@
+"""Tests for catalog module."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from omdb_api.catalog import Catalog, normalize_title
+from omdb_api.client import OmdbClient
+from omdb_api.movie_search import get_movie_by_id_or_title, search_movies
+
+
+def record(imdb_id, title, year="1999", kind="movie", votes="1,000"):
+    """Build a minimal full OMDB record."""
+    return {"Title": title, "Year": year, "imdbID": imdb_id, "Type": kind, "Poster": "N/A",
+            "imdbVotes": votes, "Plot": f"Plot of {title}", "Response": "True"}
+
+
+RECORDS = [
+    record("tt0133093", "The Matrix", votes="2,000,000"),
+    record("tt0234215", "The Matrix Reloaded", year="2003", votes="600,000"),
+    record("tt10838180", "The Matrix Resurrections", year="2021", votes="300,000"),
+    record("tt0106062", "Matrix", year="1993–1997", kind="series", votes="2,000"),
+    record("tt0113277", "Heat", year="1995", votes="700,000"),
+    record("tt0099785", "Heat", year="1986", votes="10,000"),
+]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """A catalog holding RECORDS."""
+    catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.add_many(RECORDS)
+    yield catalog
+    catalog.close()
+
+
+class TestIngest:
+    """Tests for catalog ingestion."""
+
+    def test_normalize_title(self):
+        """Test that case, accents and punctuation are normalized away."""
+        assert normalize_title("  Amélie: Le Fabuleux-Destin! ") == "amelie le fabuleux destin"
+
+    def test_ingest_stream(self, tmp_path):
+        """Test that plain records and --batch lines are ingested and failures skipped."""
+        lines = [
+            json.dumps(RECORDS[0]),
+            json.dumps({"query": {"movie_id": "tt0113277"}, "result": RECORDS[4]}),
+            json.dumps({"query": {"movie_id": "tt9999999"}, "error": "Read timed out."}),
+            json.dumps({"Response": "False", "Error": "Incorrect IMDb ID."}),
+            "",
+            '{"Title": "cut short',
+        ]
+        catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+
+        assert catalog.ingest(io.StringIO("\n".join(lines)), chunk_size=1) == 2
+        assert len(catalog) == 2
+
+    def test_ingest_path_replaces(self, tmp_path):
+        """Test ingesting from a path and that re-ingesting a record replaces its title words."""
+        dump = tmp_path / "dump.ndjson"
+        dump.write_text(json.dumps(record("tt0000001", "Old Name")) + "\n")
+        catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+        catalog.ingest(str(dump))
+
+        catalog.add_many([record("tt0000001", "New Name")])
+
+        assert len(catalog) == 1
+        assert catalog.search("old") is None
+        assert catalog.search("new")["Search"][0]["Title"] == "New Name"
+
+
+class TestQueries:
+    """Tests for local lookups and searches."""
+
+    def test_get_by_id(self, catalog):
+        """Test that ID lookups return the stored record and honour filters."""
+        assert catalog.get(movie_id="tt0133093") == RECORDS[0]
+        assert catalog.get(movie_id="tt0133093", year=2003) is None
+        assert catalog.get(movie_id="tt0133093", media_type="series") is None
+        assert catalog.get(movie_id="tt0000000") is None
+
+    def test_get_by_title(self, catalog):
+        """Test that title lookups are normalized, filtered by year and prefer the most voted match."""
+        assert catalog.get(title="heat")["imdbID"] == "tt0113277"
+        assert catalog.get(title="HEAT", year="1986")["imdbID"] == "tt0099785"
+        assert catalog.get(title="the matrix!")["imdbID"] == "tt0133093"
+        assert catalog.get(title="Matrix", media_type="series", year=1993)["imdbID"] == "tt0106062"
+        assert catalog.get(title="Heat 2") is None
+
+    def test_search(self, catalog):
+        """Test that searches match every word, filter, and keep OMDB's shape."""
+        result = catalog.search("matrix")
+
+        assert result["Response"] == "True"
+        assert result["totalResults"] == "4"
+        assert [hit["imdbID"] for hit in result["Search"]] == ["tt0133093", "tt0234215", "tt10838180", "tt0106062"]
+        assert result["Search"][0] == {"Title": "The Matrix", "Year": "1999", "imdbID": "tt0133093",
+                                       "Type": "movie", "Poster": "N/A"}
+        assert catalog.search("matrix reloaded")["totalResults"] == "1"
+        assert catalog.search("matrix", media_type="series")["Search"][0]["imdbID"] == "tt0106062"
+        assert catalog.search("matrix", year=2021)["Search"][0]["imdbID"] == "tt10838180"
+        assert catalog.search("matrix", page=2) is None
+        assert catalog.search("zzzz") is None
+
+    def test_answer(self, catalog):
+        """Test that OMDB query parameters are routed and counted."""
+        assert catalog.answer({"i": "tt0133093", "apikey": "k"})["Title"] == "The Matrix"
+        assert catalog.answer({"s": "heat", "type": "movie", "page": "1"})["totalResults"] == "2"
+        assert catalog.answer({"t": "Unknown"}) is None
+
+        catalog.answer_searches = False
+        assert catalog.answer({"s": "heat"}) is None
+        assert catalog.stats() == {"hits": 2, "misses": 2, "size": 6}
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestClientIntegration:
+    """Tests for the client's catalog hook."""
+
+    def test_only_misses_reach_the_network(self, catalog):
+        """Test that catalog hits skip the network and misses fall through."""
+        with StubServer() as stub, OmdbClient(catalog=catalog) as client, \
+                patch("omdb_api.movie_search.BASE_URL", stub.url):
+            with patch("omdb_api.movie_search.get_default_client", return_value=client):
+                assert get_movie_by_id_or_title(movie_id="tt0133093") == RECORDS[0]
+                assert search_movies("heat")["totalResults"] == "2"
+                assert stub.request_count == 0
+
+                assert get_movie_by_id_or_title(movie_id="tt7654321")["imdbID"] == "tt7654321"
+                assert stub.request_count == 1
@@ -0,0 +1,100 @@
+"""Tests for client module."""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from benchmarks.stub_server import StubServer
+from omdb_api import client as client_module
+from omdb_api.cache import TTLCache
+from omdb_api.client import OmdbClient, get_default_client, set_default_client
+
+
+class TestOmdbClient:
+    """Tests for OmdbClient."""
+
+    def test_session_is_pooled(self):
+        """Test that the session mounts an adapter with the configured pool size."""
+        client = OmdbClient(pool_connections=3, pool_maxsize=7)
+
+        adapter = client.session.get_adapter("http://www.omdbapi.com/")
+
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+        assert client.session is client.session
+
+    def test_keep_alive_disabled(self):
+        """Test that disabling keep-alive asks the server to close connections."""
+        client = OmdbClient(keep_alive=False)
+
+        assert client.session.headers["Connection"] == "close"
+
+    def test_invalid_pool_size(self):
+        """Test that ValueError is raised for non-positive pool sizes."""
+        with pytest.raises(ValueError, match="must be positive integers"):
+            OmdbClient(pool_maxsize=0)
+
+    @patch("omdb_api.client.requests.Session.get")
+    def test_request_uses_timeout(self, mock_get):
+        """Test that the configured and per-call timeouts are passed through."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"Response": "True"}'
+        mock_get.return_value = mock_response
+        client = OmdbClient(base_url="http://stub/", timeout=5)
+
+        assert client.request({"i": "tt0133093"}) == {"Response": "True"}
+        assert mock_get.call_args[0][0] == "http://stub/"
+        assert mock_get.call_args[1]["timeout"] == 5
+
+        client.request({"i": "tt0133093"}, base_url="http://other/", timeout=1)
+        assert mock_get.call_args[0][0] == "http://other/"
+        assert mock_get.call_args[1]["timeout"] == 1
+
+    def test_connections_are_reused(self):
+        """Test that consecutive requests share one keep-alive connection."""
+        with StubServer() as stub, OmdbClient(base_url=stub.url) as client:
+            for n in range(5):
+                result = client.request({"i": f"tt{n:07d}"})
+                assert result["imdbID"] == f"tt{n:07d}"
+
+            assert stub.request_count == 5
+            assert stub.connection_count == 1
+
+    def test_cache_short_circuits_network(self):
+        """Test that cached responses are served without a request."""
+        cache = TTLCache()
+        with StubServer() as stub, OmdbClient(base_url=stub.url, cache=cache) as client:
+            first = client.request({"i": "tt0133093", "apikey": "one"})
+            second = client.request({"i": "tt0133093", "apikey": "two"})
+
+            assert first == second
+            assert stub.request_count == 1
+            assert cache.stats()["hits"] == 1
+
+    def test_close_releases_session(self):
+        """Test that close drops the session so it is recreated on next use."""
+        client = OmdbClient()
+        session = client.session
+
+        client.close()
+
+        assert client._session is None
+        assert client.session is not session
+
+
+class TestDefaultClient:
+    """Tests for the shared default client."""
+
+    def test_default_client_is_shared(self):
+        """Test that the default client is created once and reused."""
+        assert get_default_client() is get_default_client()
+
+    def test_set_default_client(self):
+        """Test replacing the default client."""
+        custom = OmdbClient(pool_maxsize=2)
+        previous = set_default_client(custom)
+        try:
+            assert get_default_client() is custom
+        finally:
+            set_default_client(previous)
+
+        assert client_module._default_client is previous
@@ -0,0 +1,129 @@
+"""Tests for decoding module."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omdb_api import decoding
+from omdb_api.decoding import SearchStreamParser, decode_response, iter_search_entries
+
+SEARCH = {
+    "Search": [
+        {"Title": f"Amélie {n}", "Year": "2001", "imdbID": f"tt{n:07d}", "Type": "movie", "Poster": "N/A"}
+        for n in range(10)
+    ],
+    "totalResults": "42",
+    "Response": "True",
+}
+
+
+def chunked(data, size):
+    """Split bytes into chunks of ``size`` bytes."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    """Restore the selected backend after each test."""
+    previous = decoding._backend
+    yield
+    decoding._backend = previous
+
+
+class TestBackends:
+    """Tests for backend selection."""
+
+    def test_stdlib_backend(self):
+        """Test that the stdlib backend decodes bytes."""
+        assert decoding.set_backend("json") == "json"
+        assert decoding.loads(b'{"Title": "Heat"}') == {"Title": "Heat"}
+        assert decoding.get_backend() == "json"
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test that the stdlib backend is used when no faster backend is installed."""
+        with patch.dict("sys.modules", {"orjson": None, "ujson": None}):
+            assert decoding.set_backend() == "json"
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="backend must be one of"):
+            decoding.set_backend("yaml")
+
+    def test_missing_backend(self):
+        """Test that a backend that is not installed raises RuntimeError."""
+        with patch.dict("sys.modules", {"ujson": None}):
+            with pytest.raises(RuntimeError, match="ujson is not installed"):
+                decoding.set_backend("ujson")
+
+
+class TestDecodeResponse:
+    """Tests for decode_response function."""
+
+    def test_decodes_raw_bytes(self):
+        """Test that the body bytes are decoded without calling response.json()."""
+        response = MagicMock(content='{"Title": "Léon"}'.encode("utf-8"))
+        assert decode_response(response) == {"Title": "Léon"}
+        response.json.assert_not_called()
+
+    def test_custom_decoder(self):
+        """Test that a custom decoder receives the body bytes."""
+        response = MagicMock(content=b"{}")
+        assert decode_response(response, decoder=lambda body: ("decoded", body)) == ("decoded", b"{}")
+
+    def test_invalid_json(self):
+        """Test that an invalid body raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_response(MagicMock(content=b"<html>"))
+
+
+class TestSearchStreamParser:
+    """Tests for SearchStreamParser."""
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 100000])
+    def test_entries_across_chunks(self, size):
+        """Test that entries are yielded in order whatever the chunk boundaries."""
+        body = json.dumps(SEARCH, ensure_ascii=False).encode("utf-8")
+        entries = iter_search_entries(chunked(body, size))
+
+        assert list(entries) == SEARCH["Search"]
+
+    def test_entries_yielded_early(self):
+        """Test that an entry is returned as soon as its bytes arrive."""
+        body = json.dumps(SEARCH).encode()
+        parser = SearchStreamParser()
+        first = body.index(b"}") + 1
+
+        assert parser.feed(body[:first]) == SEARCH["Search"][:1]
+        assert parser.feed(body[first:]) == SEARCH["Search"][1:]
+        assert parser.close() == {"totalResults": "42", "Response": "True"}
+
+    def test_envelope_before_search(self):
+        """Test that fields placed before the Search array are kept."""
+        body = b'{"Response": "True", "totalResults": "1", "Search": [{"Title": "Heat"}]}'
+        parser = SearchStreamParser()
+
+        assert parser.feed(body) == [{"Title": "Heat"}]
+        assert parser.close() == {"Response": "True", "totalResults": "1"}
+
+    def test_error_response(self):
+        """Test that a response without Search yields nothing and returns the whole response."""
+        parser = SearchStreamParser()
+        assert parser.feed(b'{"Response": "False", "Error": "Movie not found!"}') == []
+        assert parser.close() == {"Response": "False", "Error": "Movie not found!"}
+
+    def test_truncated(self):
+        """Test that a body cut inside the Search array raises ValueError."""
+        body = json.dumps(SEARCH).encode()
+        parser = SearchStreamParser()
+        parser.feed(body[:len(body) // 2])
+
+        with pytest.raises(ValueError, match="ended inside"):
+            parser.close()
+
+    def test_generator_returns_envelope(self):
+        """Test that iter_search_entries returns the envelope when exhausted."""
+        entries = iter_search_entries([b'{"Search": [], "Response": "True"}'])
+        with pytest.raises(StopIteration) as stop:
+            next(entries)
+        assert stop.value.value == {"Response": "True"}
@@ -0,0 +1,161 @@
+"""Tests for enrich module."""
+
+import datetime
+import json
+import pickle
+from array import array
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from omdb_api.bulk import BulkResult
+from omdb_api.enrich import SCHEMA, ColumnBatch, enrich_records, normalize, normalize_chunk
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+
+
+def record(n, **fields):
+    """Return a copy of the example record with a distinct imdbID."""
+    return dict(EXAMPLE, imdbID=f"tt{n:07d}", **fields)
+
+
+class TestNormalize:
+    """Tests for normalize."""
+
+    def test_full_record(self):
+        """Test that every field of a full record is typed."""
+        values = normalize(EXAMPLE)
+
+        assert values["imdb_id"] == "tt1619029"
+        assert values["year"] == 2016
+        assert values["released"] == datetime.date(2016, 12, 2)
+        assert values["runtime_minutes"] == 100
+        assert values["genres"] == ("Biography", "Drama")
+        assert values["actors"] == ("Natalie Portman", "Peter Sarsgaard", "Greta Gerwig")
+        assert values["imdb_votes"] == 85973
+        assert values["imdb_rating"] == 6.6
+        assert values["box_office"] == 13960394
+        assert values["rating_rotten_tomatoes"] == 87.0
+        assert values["rating_metacritic"] == 81.0
+        assert values["rating_imdb"] == pytest.approx(66.0)
+        assert set(values) == {name for name, _, _, _ in SCHEMA}
+
+    def test_missing_values(self):
+        """Test that N/A and absent fields become None or empty tuples."""
+        values = normalize({"imdbID": "tt1", "Title": "X", "Runtime": "N/A", "Rated": "N/A", "Genre": "N/A"})
+
+        assert values["runtime_minutes"] is None
+        assert values["rated"] is None
+        assert values["genres"] == ()
+        assert values["released"] is None
+        assert values["rating_imdb"] is None
+
+
+class TestColumnBatch:
+    """Tests for ColumnBatch."""
+
+    def test_typed_columns(self):
+        """Test that numbers and dates are stored in typed arrays with a validity mask."""
+        batch = normalize_chunk([EXAMPLE, record(2, Runtime="N/A", Genre="Drama")])
+
+        assert len(batch) == 2
+        assert batch["runtime_minutes"].values == array("q", [100, 0])
+        assert batch["runtime_minutes"].valid == bytearray([1, 0])
+        assert batch["imdb_rating"].values.typecode == "d"
+        assert batch["released"].values[0] == (datetime.date(2016, 12, 2) - datetime.date(1970, 1, 1)).days
+        assert batch["genres"].values == ["Biography", "Drama", "Drama"]
+        assert list(batch["genres"].offsets) == [0, 2, 3]
+
+    def test_python_views(self):
+        """Test that columns read back as the values normalize returns."""
+        batch = normalize_chunk([EXAMPLE, record(2, Runtime="N/A")])
+
+        assert batch["runtime_minutes"].to_list() == [100, None]
+        assert batch["runtime_minutes"].to_list(0) == [100, 0]
+        assert batch["genres"][-1] == ("Biography", "Drama")
+        assert next(batch.rows()) == normalize(EXAMPLE)
+        assert batch.to_pydict()["imdb_id"] == ["tt1619029", "tt0000002"]
+
+    def test_pickle(self):
+        """Test that batches survive the trip between processes."""
+        batch = normalize_chunk([EXAMPLE])
+        assert pickle.loads(pickle.dumps(batch)).to_pydict() == batch.to_pydict()
+
+    def test_empty(self):
+        """Test that a new batch has every schema column and no rows."""
+        batch = ColumnBatch()
+        assert len(batch) == 0
+        assert list(batch.columns) == [name for name, _, _, _ in SCHEMA]
+
+
+class TestEnrich:
+    """Tests for enrich_records."""
+
+    def test_batches_in_order(self):
+        """Test that records are normalized into ordered batches of chunk_size."""
+        batches = list(enrich_records((record(n) for n in range(25)), max_workers=2, chunk_size=10))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        ids = [imdb_id for batch in batches for imdb_id in batch["imdb_id"].values]
+        assert ids == [f"tt{n:07d}" for n in range(25)]
+
+    def test_unordered(self):
+        """Test that unordered batches still cover every record."""
+        batches = enrich_records((record(n) for n in range(25)), max_workers=2, chunk_size=4, ordered=False)
+        assert sorted(imdb_id for batch in batches for imdb_id in batch["imdb_id"].values) == \
+            [f"tt{n:07d}" for n in range(25)]
+
+    def test_dedupe_and_skips(self):
+        """Test that duplicates, error responses and failed bulk lookups are dropped."""
+        records = [
+            record(1),
+            record(1),
+            {"Response": "False", "Error": "Movie not found!"},
+            BulkResult(3, "tt0000003", None, ValueError("boom")),
+            BulkResult(4, "tt0000002", record(2), None),
+            None,
+        ]
+        batches = list(enrich_records(records, max_workers=1))
+        assert batches[0]["imdb_id"].values == ["tt0000001", "tt0000002"]
+
+    def test_keep_duplicates(self):
+        """Test that dedupe=False keeps repeated records."""
+        batches = list(enrich_records([record(1), record(1)], max_workers=1, dedupe=False))
+        assert len(batches[0]) == 2
+
+    def test_backpressure(self):
+        """Test that input is only read a bounded window ahead of the consumer."""
+        consumed = []
+
+        def records():
+            for n in range(1000):
+                consumed.append(n)
+                yield record(n)
+
+        batches = enrich_records(records(), max_workers=1, chunk_size=10)
+        next(batches)
+        # Two chunks in flight plus the one being built
+        assert len(consumed) <= 3 * 10 + 1
+        batches.close()
+
+    def test_pool_started_lazily(self):
+        """Test that no worker process starts until the first batch is requested."""
+        with patch("omdb_api.enrich.ProcessPoolExecutor") as pool:
+            batches = enrich_records([record(1)], max_workers=1)
+            assert not pool.called
+        batches.close()
+
+    def test_package_export(self):
+        """Test that the package attribute stays callable after the submodule is imported."""
+        import omdb_api
+        import omdb_api.enrich  # noqa: F401
+
+        assert omdb_api.enrich_records is enrich_records
+
+    def test_invalid_arguments(self):
+        """Test that max_workers and chunk_size are validated eagerly."""
+        with pytest.raises(ValueError, match="max_workers"):
+            enrich_records([], max_workers=0)
+        with pytest.raises(ValueError, match="chunk_size"):
+            enrich_records([], chunk_size=0)
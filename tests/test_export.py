@@ -0,0 +1,170 @@
+"""Tests for export module."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+from omdb_api.bulk import BulkResult  # noqa: E402
+from omdb_api.export import (  # noqa: E402
+    ColumnarExporter, export_records, iter_npz_batches, parse_numeric, resolve_format,
+)
+from omdb_api.models import Movie, parse_float, parse_int, parse_year  # noqa: E402
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+SEARCH = {
+    "Search": [
+        {"Title": "Batman Begins", "Year": "2005", "imdbID": "tt0372784", "Type": "movie", "Poster": "N/A"},
+        {"Title": "Batman: The Animated Series", "Year": "1992–1995", "imdbID": "tt0103359", "Type": "series"},
+    ],
+    "totalResults": "2",
+    "Response": "True",
+}
+
+
+def records(count):
+    """Return ``count`` distinct full records."""
+    return [dict(EXAMPLE, imdbID=f"tt{n:07d}", imdbVotes=f"{n:,}") for n in range(count)]
+
+
+class TestParseNumeric:
+    """Tests for parse_numeric."""
+
+    @pytest.mark.parametrize("kind, parser, values", [
+        ("year", parse_year, ["1999", "2008–2013", "2020–", "N/A", None, "", "19"]),
+        ("int", parse_int, ["1,900,000", "136 min", "$13,960,394", "81", "N/A", None, ""]),
+        ("float", parse_float, ["8.7", "10", "0.5", "7.", "N/A", None, ""]),
+    ])
+    def test_matches_scalar_parsers(self, kind, parser, values):
+        """Test that vectorized parsing agrees with the model parsers."""
+        numbers, valid = parse_numeric(values, kind)
+        assert [number.item() if ok else None for number, ok in zip(numbers, valid)] == \
+            [parser(value) for value in values]
+
+    def test_dtypes(self):
+        """Test that integers are int64 and floats are float64 with NaN for missing."""
+        numbers, valid = parse_numeric(["1", "N/A"], "int")
+        assert numbers.dtype == np.int64 and valid.tolist() == [True, False]
+        numbers, _ = parse_numeric(["1.5", "N/A"], "float")
+        assert numbers.dtype == np.float64 and np.isnan(numbers[1])
+
+    def test_empty_and_unknown(self):
+        """Test empty columns and unknown kinds."""
+        assert len(parse_numeric([], "int")[0]) == 0
+        with pytest.raises(ValueError, match="unknown"):
+            parse_numeric(["1"], "date")
+
+
+class TestResolveFormat:
+    """Tests for resolve_format."""
+
+    def test_from_suffix(self):
+        """Test that the file suffix selects the format."""
+        assert resolve_format("out.parquet") == "parquet"
+        assert resolve_format("out.arrow") == "arrow"
+        assert resolve_format("OUT.NPZ") == "npz"
+
+    def test_fallback_without_pyarrow(self):
+        """Test that unknown suffixes fall back to npz without pyarrow."""
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            assert resolve_format("out.bin") == "npz"
+
+    def test_invalid(self):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="format must be one of"):
+            resolve_format("out.npz", "csv")
+
+
+class TestNpzExport:
+    """Tests for ColumnarExporter writing npz."""
+
+    def test_incremental_batches(self, tmp_path):
+        """Test that records are written in batches of batch_size."""
+        path = tmp_path / "movies.npz"
+        with ColumnarExporter(str(path), batch_size=2) as exporter:
+            exporter.add_many(records(5))
+            assert exporter.batches == 2
+
+        batches = list(iter_npz_batches(str(path)))
+        assert [len(batch["imdbID"]) for batch in batches] == [2, 2, 1]
+        assert batches[1]["imdbVotes"].tolist() == [2, 3]
+        assert batches[0]["Runtime"].tolist() == [100, 100]
+        assert batches[0]["Title"][0] == "Jackie"
+
+    def test_inputs(self, tmp_path):
+        """Test search responses, models, bulk results, and skipped error responses."""
+        path = tmp_path / "movies.npz"
+        with ColumnarExporter(str(path)) as exporter:
+            assert exporter.add(SEARCH) == 2
+            assert exporter.add(Movie(EXAMPLE)) == 1
+            assert exporter.add(BulkResult(0, "tt1", EXAMPLE, None)) == 1
+            assert exporter.add(BulkResult(1, "tt2", None, ValueError())) == 0
+            assert exporter.add({"Response": "False", "Error": "Movie not found!"}) == 0
+
+        batch = next(iter_npz_batches(str(path)))
+        assert batch["Year"].tolist() == [2005, 1992, 2016, 2016]
+        assert batch["imdbRating"].mask.tolist() == [True, True, False, False]
+        assert batch["Poster"][0] == ""
+        assert json.loads(batch["Ratings"][2])[1] == {"Source": "Rotten Tomatoes", "Value": "87%"}
+
+    def test_fields(self, tmp_path):
+        """Test that only the selected fields are exported."""
+        path = tmp_path / "movies.npz"
+        export_records([EXAMPLE], str(path), fields=["imdbID", "Year"])
+        assert set(next(iter_npz_batches(str(path)))) == {"imdbID", "Year"}
+
+    def test_closed(self, tmp_path):
+        """Test that adding to a closed exporter raises RuntimeError."""
+        exporter = ColumnarExporter(str(tmp_path / "movies.npz"))
+        exporter.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            exporter.add(EXAMPLE)
+
+    def test_invalid_batch_size(self, tmp_path):
+        """Test that batch_size must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            ColumnarExporter(str(tmp_path / "movies.npz"), batch_size=0)
+
+    def test_pyarrow_required(self, tmp_path):
+        """Test that Parquet export without pyarrow raises RuntimeError."""
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(RuntimeError, match="pyarrow"):
+                ColumnarExporter(str(tmp_path / "movies.parquet"))
+
+
+class TestArrowExport:
+    """Tests for ColumnarExporter writing Parquet and Arrow IPC."""
+
+    def test_parquet(self, tmp_path):
+        """Test that each batch becomes a row group with typed columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "movies.parquet"
+        assert export_records(records(5) + [dict(EXAMPLE, imdbID="tt9", Year="N/A")], str(path),
+                              batch_size=4) == 6
+
+        table = pq.read_table(str(path))
+        assert pq.ParquetFile(str(path)).num_row_groups == 2
+        assert str(table.schema.field("imdbVotes").type) == "int64"
+        assert str(table.schema.field("imdbRating").type) == "double"
+        assert table.column("Year").to_pylist()[-1] is None
+        assert table.column("imdbVotes").to_pylist()[:5] == [0, 1, 2, 3, 4]
+
+    def test_arrow_ipc(self, tmp_path):
+        """Test that Arrow IPC files hold one record batch per flush."""
+        pa = pytest.importorskip("pyarrow")
+        path = tmp_path / "movies.arrow"
+        export_records(records(3), str(path), batch_size=2)
+
+        reader = pa.ipc.open_file(str(path))
+        assert reader.num_record_batches == 2
+        assert reader.read_all().column("Runtime").to_pylist() == [100, 100, 100]
+
+    def test_empty_export(self, tmp_path):
+        """Test that an export without records is a valid empty file."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "movies.parquet"
+        assert export_records([], str(path)) == 0
+        assert pq.read_table(str(path)).num_rows == 0
@@ -0,0 +1,170 @@
+"""Tests for httpcache module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from omdb_api.cache import SqliteCache
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.httpcache import HttpCache, freshness_lifetime, parse_cache_control
+from omdb_api.instrumentation import Instrumentation
+from omdb_api.movie_search import get_movie_by_id_or_title, search_movies
+from omdb_api.ratelimit import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now=1000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestFreshness:
+    """Tests for header parsing."""
+
+    def test_parse_cache_control(self):
+        """Test that directives are parsed case-insensitively, with and without values."""
+        assert parse_cache_control('Public, MAX-AGE=60, no-cache="Set-Cookie"') == {
+            "public": True, "max-age": "60", "no-cache": "Set-Cookie",
+        }
+        assert parse_cache_control(None) == {}
+
+    def test_max_age_minus_age(self):
+        """Test that max-age is reduced by the Age header and s-maxage wins."""
+        assert freshness_lifetime({"Cache-Control": "max-age=60", "Age": "15"}) == 45
+        assert freshness_lifetime({"Cache-Control": "max-age=60, s-maxage=120"}) == 120
+
+    def test_no_store_and_no_cache(self):
+        """Test that no-store forbids storing and no-cache forces revalidation."""
+        assert freshness_lifetime({"Cache-Control": "no-store, max-age=60"}) is None
+        assert freshness_lifetime({"Cache-Control": "no-cache, max-age=60"}) == 0
+
+    def test_expires(self):
+        """Test that Expires is measured from the Date header."""
+        headers = {"Date": "Wed, 21 Oct 2015 07:28:00 GMT", "Expires": "Wed, 21 Oct 2015 08:28:00 GMT"}
+        assert freshness_lifetime(headers) == 3600
+        assert freshness_lifetime({"Expires": "0"}) == 0
+
+    def test_default(self):
+        """Test that responses without freshness headers use the default."""
+        assert freshness_lifetime({}, default=30) == 30
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestHttpCache:
+    """Tests for HttpCache in the client."""
+
+    def test_fresh_responses_skip_the_network(self):
+        """Test that max-age responses are served locally until they expire."""
+        clock = FakeClock()
+        http_cache = HttpCache(clock=clock)
+        with StubServer(cache_control="max-age=60") as stub, \
+                OmdbClient(base_url=stub.url, http_cache=http_cache) as client:
+            first = client.request({"i": "tt0133093"})
+            assert client.request({"i": "tt0133093"}) == first
+            assert stub.request_count == 1
+
+            clock.now += 61
+            client.request({"i": "tt0133093"})
+            assert stub.request_count == 2
+        assert http_cache.stats()["hits"] == 1
+
+    def test_revalidation(self):
+        """Test that stale entries are revalidated and a 304 reuses the stored body."""
+        clock = FakeClock()
+        http_cache = HttpCache(clock=clock)
+        with StubServer(cache_control="max-age=10", validators=True) as stub, \
+                OmdbClient(base_url=stub.url, http_cache=http_cache) as client:
+            first = client.request({"i": "tt0133093"})
+            clock.now += 11
+            second = client.request({"i": "tt0133093"})
+
+            assert second == first
+            assert stub.not_modified_count == 1
+            assert stub.last_headers["If-None-Match"].startswith('"')
+            # The 304 refreshed the entry
+            client.request({"i": "tt0133093"})
+            assert stub.request_count == 2
+        assert http_cache.stats() == {"hits": 1, "misses": 1, "revalidations": 1, "not_modified": 1,
+                                      "compressed": 0}
+
+    def test_no_cache_revalidates_every_time(self):
+        """Test that no-cache responses with validators are revalidated on every use."""
+        with StubServer(cache_control="no-cache", validators=True) as stub, \
+                OmdbClient(base_url=stub.url, http_cache=HttpCache()) as client:
+            for _ in range(3):
+                client.request({"i": "tt0133093"})
+
+            assert stub.request_count == 3
+            assert stub.not_modified_count == 2
+
+    def test_no_store(self):
+        """Test that no-store responses are never stored."""
+        http_cache = HttpCache()
+        with StubServer(cache_control="no-store", validators=True) as stub, \
+                OmdbClient(base_url=stub.url, http_cache=http_cache) as client:
+            client.request({"i": "tt0133093"})
+            client.request({"i": "tt0133093"})
+
+            assert stub.not_modified_count == 0
+        assert len(http_cache.store) == 0
+
+    def test_gzip(self):
+        """Test that gzip is requested, decoded and counted."""
+        http_cache = HttpCache()
+        with StubServer(compress=True) as stub, OmdbClient(base_url=stub.url, http_cache=http_cache) as client:
+            result = client.request({"i": "tt0133093"})
+
+            assert "gzip" in stub.last_headers["Accept-Encoding"]
+        assert result["imdbID"] == "tt0133093"
+        assert http_cache.compressed == 1
+
+    def test_unexpected_encoding(self):
+        """Test that an encoding that was not offered is rejected."""
+        response = MagicMock(status_code=200, headers={"Content-Encoding": "compress"})
+        with pytest.raises(ValueError, match="unexpected Content-Encoding"):
+            HttpCache().complete(("i", "tt1"), None, response, lambda: {})
+
+    def test_disk_store(self, tmp_path):
+        """Test that entries persist in a SqliteCache store across clients."""
+        clock = FakeClock()
+        with StubServer(cache_control="max-age=60") as stub:
+            for _ in range(2):
+                http_cache = HttpCache(store=SqliteCache(str(tmp_path)), clock=clock)
+                with OmdbClient(base_url=stub.url, http_cache=http_cache) as client:
+                    client.request({"i": "tt0133093"})
+            assert stub.request_count == 1
+
+    def test_fresh_hits_skip_rate_limiter(self):
+        """Test that fresh entries consume no rate limiter tokens and report their source."""
+        limiter = RateLimiter(rate=1000, burst=1000)
+        events = []
+        with StubServer(cache_control="max-age=60") as stub, \
+                OmdbClient(base_url=stub.url, http_cache=HttpCache(), rate_limiter=limiter,
+                           instrumentation=Instrumentation([events.append])) as client:
+            client.request({"i": "tt0133093"})
+            client.request({"i": "tt0133093"})
+
+        assert [event.source for event in events] == ["upstream", "http_cache"]
+        assert limiter.stats()["used_today"] == 1
+
+    def test_lookup_functions(self):
+        """Test that get_movie_by_id_or_title and search_movies go through the HTTP cache."""
+        with StubServer(cache_control="max-age=60") as stub, patch("omdb_api.movie_search.BASE_URL", stub.url):
+            previous = set_default_client(OmdbClient(http_cache=HttpCache()))
+            try:
+                for _ in range(2):
+                    get_movie_by_id_or_title(movie_id="tt0133093")
+                    search_movies("Heat")
+            finally:
+                set_default_client(previous).close()
+            assert stub.request_count == 2
+
+    def test_invalid_default_ttl(self):
+        """Test that a negative default_ttl raises ValueError."""
+        with pytest.raises(ValueError, match="default_ttl"):
+            HttpCache(default_ttl=-1)
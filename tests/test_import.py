@@ -0,0 +1,52 @@
+"""Tests for import-time behaviour of the package."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+import omdb_api
+from benchmarks.bench_import import heavy_imports, import_time_us
+from omdb_api import movie_search
+
+
+class TestLazyImports:
+    """Tests that importing the package stays cheap."""
+
+    def test_no_heavy_imports(self):
+        """Test that importing the package or the CLI module loads no heavy dependency."""
+        assert heavy_imports("omdb_api") == []
+        assert heavy_imports("omdb_api.movie_search") == []
+
+    def test_import_time_budget(self):
+        """Test that importing the package stays well under the import-time budget."""
+        # Generous compared with the benchmark budget so slow CI machines do not flake
+        assert import_time_us("omdb_api") < 50000
+
+    def test_lazy_exports(self):
+        """Test that public names resolve on access and unknown names still fail."""
+        from omdb_api.async_client import AsyncOmdbClient
+        from omdb_api.client import OmdbClient
+
+        assert omdb_api.OmdbClient is OmdbClient
+        assert omdb_api.AsyncOmdbClient is AsyncOmdbClient
+        assert set(omdb_api.__all__) <= set(dir(omdb_api))
+        with pytest.raises(AttributeError):
+            omdb_api.does_not_exist
+
+
+class TestApiKey:
+    """Tests for API key resolution."""
+
+    def test_key_read_on_use(self):
+        """Test that a key exported after import is picked up."""
+        with patch.dict(os.environ, {"OMDB_API_KEY": "late_key"}):
+            assert movie_search.get_api_key() == "late_key"
+        with patch.dict(os.environ, {}, clear=True):
+            assert movie_search.get_api_key() is None
+
+    def test_explicit_key_wins(self):
+        """Test that OMDB_API_KEY set on the module overrides the environment."""
+        with patch.dict(os.environ, {"OMDB_API_KEY": "env_key"}), \
+                patch("omdb_api.movie_search.OMDB_API_KEY", "module_key"):
+            assert movie_search.get_api_key() == "module_key"
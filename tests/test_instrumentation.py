@@ -0,0 +1,269 @@
+"""Tests for instrumentation module."""
+
+import http.server
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.cache import TTLCache
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.instrumentation import (Instrumentation, MetricsCollector, RequestEvent, SpanExporter, endpoint_of,
+                                      prometheus_text)
+from omdb_api.movie_search import get_movie_by_id_or_title, search_movies
+from omdb_api.singleflight import SingleFlight
+
+
+def finished_event(params, total, source="upstream", result=None):
+    """Build a finished event with a fixed total duration."""
+    event = RequestEvent(params)
+    event.source = source
+    event.finish(result)
+    event.total = total
+    return event
+
+
+class TestRequestEvent:
+    """Tests for RequestEvent."""
+
+    def test_endpoint_of(self):
+        """Test that the endpoint is derived from the query parameters."""
+        assert endpoint_of({"i": "tt0133093", "plot": "full"}) == "i"
+        assert endpoint_of({"t": "Heat"}) == "t"
+        assert endpoint_of({"s": "Heat", "page": "2"}) == "s"
+        assert endpoint_of({"r": "json"}) == "other"
+
+    def test_api_key_is_dropped(self):
+        """Test that the API key never reaches hooks."""
+        event = RequestEvent({"i": "tt0133093", "apikey": "secret"})
+        assert event.params == {"i": "tt0133093"}
+
+    def test_outcomes(self):
+        """Test that finish records not-found results and errors."""
+        missing = RequestEvent({"i": "tt9999999"})
+        missing.finish({"Response": "False", "Error": "Incorrect IMDb ID."})
+        failed = RequestEvent({"i": "tt9999999"})
+        failed.finish(error=TimeoutError("slow"))
+
+        assert missing.outcome == "not_found"
+        assert failed.outcome == "error"
+        assert failed.total >= 0
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestClientInstrumentation:
+    """Tests for instrumented clients."""
+
+    def test_upstream_event(self):
+        """Test that an upstream request reports status, size and phase timings."""
+        events = []
+        with StubServer() as stub, \
+                OmdbClient(base_url=stub.url, instrumentation=Instrumentation([events.append])) as client:
+            client.request({"i": "tt0133093", "apikey": "k"})
+
+        event = events[0]
+        assert (event.endpoint, event.source, event.outcome) == ("i", "upstream", "ok")
+        assert event.status == 200 and event.attempts == 1
+        assert event.bytes > 0
+        assert {"ttfb", "download", "parse", "total"} <= set(event.phases())
+
+    def test_download_is_timed(self):
+        """Test that a body arriving after the headers counts as download time, not time to first byte."""
+
+        class SlowBody(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = b'{"Response": "True", "imdbID": "tt0133093"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.flush()
+                time.sleep(0.2)
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowBody)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        events = []
+        try:
+            with OmdbClient(base_url=f"http://127.0.0.1:{server.server_port}/",
+                            instrumentation=Instrumentation([events.append])) as client:
+                assert client.request({"i": "tt0133093", "apikey": "k"})["imdbID"] == "tt0133093"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert events[0].download >= 0.15
+        assert events[0].ttfb < 0.15
+
+    def test_cache_and_coalesced_sources(self):
+        """Test that cache hits and coalesced followers are reported as such."""
+        events = []
+        release = threading.Event()
+
+        def responder(query):
+            release.wait(5)
+            return default_responder(query)
+
+        instrumentation = Instrumentation([events.append])
+        with StubServer(responder=responder) as stub, \
+                OmdbClient(base_url=stub.url, cache=TTLCache(), single_flight=SingleFlight(),
+                           instrumentation=instrumentation) as client:
+            threads = [threading.Thread(target=client.request, args=({"t": "Heat"},)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            while client.single_flight.shared < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in threads:
+                thread.join()
+            client.request({"t": "Heat"})
+
+        sources = sorted(event.source for event in events)
+        assert sources == ["cache", "coalesced", "coalesced", "coalesced", "upstream"]
+
+    def test_error_event(self):
+        """Test that a failed request still emits an event before raising."""
+        events = []
+        client = OmdbClient(base_url="http://127.0.0.1:9/", timeout=0.5,
+                            instrumentation=Instrumentation([events.append]))
+        with client, pytest.raises(Exception):
+            client.request({"i": "tt0133093"})
+
+        assert events[0].outcome == "error"
+        assert events[0].error is not None
+
+    def test_validation_time(self):
+        """Test that module level lookups report validation time."""
+        events = []
+        with StubServer() as stub:
+            previous = set_default_client(OmdbClient(instrumentation=Instrumentation([events.append])))
+            try:
+                with patch("omdb_api.movie_search.BASE_URL", stub.url):
+                    get_movie_by_id_or_title(movie_id="tt0133093")
+                    search_movies("Heat")
+            finally:
+                set_default_client(previous).close()
+
+        assert [event.endpoint for event in events] == ["i", "s"]
+        assert all(event.validate is not None for event in events)
+
+    def test_hook_errors_are_contained(self):
+        """Test that a failing hook does not fail the request."""
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        instrumentation = Instrumentation([broken])
+        with StubServer() as stub, OmdbClient(base_url=stub.url, instrumentation=instrumentation) as client:
+            assert client.request({"i": "tt0133093"})["Response"] == "True"
+        assert instrumentation.hook_errors == 1
+
+    def test_no_hooks(self):
+        """Test that an instrumentation without hooks builds no events."""
+        instrumentation = Instrumentation()
+        with StubServer() as stub, OmdbClient(base_url=stub.url, instrumentation=instrumentation) as client, \
+                patch("omdb_api.client.RequestEvent") as event_class:
+            client.request({"i": "tt0133093"})
+        event_class.assert_not_called()
+
+    def test_add_and_remove_hook(self):
+        """Test that hooks can be registered and unregistered."""
+        instrumentation = Instrumentation()
+        hook = instrumentation.add_hook(lambda event: None)
+        assert instrumentation.hooks == [hook]
+        instrumentation.remove_hook(hook)
+        assert instrumentation.hooks == []
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def test_histograms_per_endpoint(self):
+        """Test that latencies are bucketed per endpoint."""
+        metrics = MetricsCollector(buckets=(0.01, 0.1))
+        metrics(finished_event({"i": "tt1"}, 0.005))
+        metrics(finished_event({"i": "tt2"}, 0.05))
+        metrics(finished_event({"s": "Heat"}, 1.0))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["i"]["buckets"] == [(0.01, 1), (0.1, 2), (float("inf"), 2)]
+        assert snapshot["s"]["count"] == 1
+        assert metrics.count() == 3
+        assert metrics.count("t") == 0
+
+    def test_quantile(self):
+        """Test that quantiles report the upper bound of their bucket."""
+        metrics = MetricsCollector(buckets=(0.01, 0.1))
+        for total in [0.005] * 98 + [0.05, 5.0]:
+            metrics(finished_event({"i": "tt1"}, total))
+
+        assert metrics.quantile("i", 0.5) == 0.01
+        assert metrics.quantile("i", 0.99) == 0.1
+        assert metrics.quantile("i", 1.0) == float("inf")
+        assert metrics.quantile("s", 0.5) is None
+
+    def test_request_counts(self):
+        """Test that requests are counted by source and outcome."""
+        metrics = MetricsCollector()
+        metrics(finished_event({"i": "tt1"}, 0.01, source="cache"))
+        metrics(finished_event({"i": "tt1"}, 0.01, result={"Response": "False"}))
+
+        assert metrics.snapshot()["i"]["requests"] == {("cache", "ok"): 1, ("upstream", "not_found"): 1}
+
+    def test_reset(self):
+        """Test that reset drops every measurement."""
+        metrics = MetricsCollector()
+        metrics(finished_event({"i": "tt1"}, 0.01))
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+
+class TestExporters:
+    """Tests for the Prometheus and span exporters."""
+
+    def test_prometheus_text(self):
+        """Test that metrics render in the Prometheus exposition format."""
+        metrics = MetricsCollector(buckets=(0.01,))
+        metrics(finished_event({"t": "Heat"}, 0.005))
+
+        text = prometheus_text(metrics)
+        assert "# TYPE omdb_request_duration_seconds histogram" in text
+        assert 'omdb_request_duration_seconds_bucket{endpoint="t",le="0.01"} 1' in text
+        assert 'omdb_request_duration_seconds_bucket{endpoint="t",le="+Inf"} 1' in text
+        assert 'omdb_request_duration_seconds_count{endpoint="t"} 1' in text
+        assert 'omdb_requests_total{endpoint="t",source="upstream",outcome="ok"} 1' in text
+        assert text.endswith("\n")
+
+    def test_spans(self):
+        """Test that events become OpenTelemetry-style spans."""
+        spans = []
+        exporter = SpanExporter(spans.append, service_name="worker")
+        event = finished_event({"s": "Heat", "apikey": "secret"}, 0.25)
+        event.status = 200
+        exporter(event)
+
+        span = spans[0]
+        assert span["name"] == "omdb s"
+        assert span["kind"] == "SPAN_KIND_CLIENT"
+        assert len(span["trace_id"]) == 32 and len(span["span_id"]) == 16
+        assert span["end_time_unix_nano"] - span["start_time_unix_nano"] == 250000000
+        assert span["attributes"]["omdb.query.s"] == "Heat"
+        assert "omdb.query.apikey" not in span["attributes"]
+        assert span["attributes"]["http.response.status_code"] == 200
+        assert span["status"] == {"code": "STATUS_CODE_OK"}
+        assert span["resource"] == {"service.name": "worker"}
+
+    def test_error_span(self):
+        """Test that failed requests produce error spans."""
+        spans = []
+        event = RequestEvent({"i": "tt1"})
+        event.finish(error=ValueError("bad"))
+        SpanExporter(spans.append)(event)
+
+        assert spans[0]["status"] == {"code": "STATUS_CODE_ERROR", "message": "ValueError: bad"}
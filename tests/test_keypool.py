@@ -0,0 +1,212 @@
+"""Tests for keypool module."""
+
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.bulk import get_many
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.keypool import KeyPool
+from omdb_api.movie_search import get_api_key, get_movie_by_id_or_title, search_movies
+from omdb_api.ratelimit import QuotaExceededError
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now=1700000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def keyed_responder(rejections):
+    """Answer like OMDB does for the keys in ``rejections`` (key -> error message)."""
+
+    def responder(query):
+        error = rejections.get(query.get("apikey"))
+        if error is not None:
+            return 401, {"Response": "False", "Error": error}
+        return default_responder(query)
+
+    return responder
+
+
+class TestKeyPool:
+    """Tests for KeyPool."""
+
+    def test_balances_by_remaining_quota(self):
+        """Test that keys with more remaining quota are preferred."""
+        pool = KeyPool([("small", 10), ("large", 1000)])
+        assert pool.acquire() == "large"
+
+    def test_balances_by_latency(self):
+        """Test that a slow key is used less than a fast one."""
+        pool = KeyPool(["slow", "fast"])
+        picks = []
+        for _ in range(20):
+            key = pool.acquire()
+            picks.append(key)
+            pool.release(key, 1.0 if key == "slow" else 0.01)
+        assert picks.count("fast") > picks.count("slow")
+
+    def test_spreads_in_flight_requests(self):
+        """Test that concurrent requests go to different keys."""
+        pool = KeyPool(["a", "b", "c"])
+        assert sorted(pool.acquire() for _ in range(3)) == ["a", "b", "c"]
+
+    def test_quota_exhaustion(self):
+        """Test that a key out of quota is skipped until the next UTC day."""
+        clock = FakeClock()
+        pool = KeyPool([("only", 2)], clock=clock)
+        for _ in range(2):
+            pool.release(pool.acquire(), 0.01)
+        with pytest.raises(QuotaExceededError):
+            pool.acquire()
+
+        clock.now += 86400
+        assert pool.acquire() == "only"
+
+    def test_ejection_and_cooldown(self):
+        """Test that rejected keys are ejected and re-admitted after the cooldown."""
+        clock = FakeClock()
+        pool = KeyPool(["a"], cooldown=60, clock=clock)
+
+        assert pool.release(pool.acquire(), 0.01, "Request limit reached!") is True
+        with pytest.raises(QuotaExceededError):
+            pool.acquire()
+        assert pool.stats()["a"]["available"] is False
+
+        clock.now += 61
+        assert pool.acquire() == "a"
+        assert pool.stats()["a"]["ejections"] == 1
+
+    def test_other_errors_do_not_eject(self):
+        """Test that ordinary OMDB errors keep the key in rotation."""
+        pool = KeyPool(["a"])
+        assert pool.release(pool.acquire(), 0.01, "Movie not found!") is False
+        assert pool.stats()["a"]["available"] is True
+
+    def test_stats(self):
+        """Test that per-key counters are reported."""
+        pool = KeyPool([("a", 100)])
+        key = pool.acquire()
+        assert pool.stats()["a"]["in_flight"] == 1
+        pool.release(key)
+
+        assert pool.stats() == {"a": {"used_today": 1, "remaining_today": 99, "in_flight": 0, "latency": None,
+                                      "requests": 1, "failures": 1, "ejections": 0, "available": True}}
+
+    def test_from_env(self):
+        """Test that keys are read from OMDB_API_KEYS."""
+        with patch.dict(os.environ, {"OMDB_API_KEYS": "a, b c"}), patch("dotenv.load_dotenv"):
+            assert len(KeyPool.from_env()) == 3
+
+    def test_from_file(self, tmp_path):
+        """Test that keys and per-key quotas are read from a file."""
+        path = tmp_path / "keys.txt"
+        path.write_text("# pool\nabc\ndef 100000  # patreon\n\n")
+        pool = KeyPool.from_file(str(path), daily_quota=1000)
+
+        assert {key: stats["remaining_today"] for key, stats in pool.stats().items()} == {"abc": 1000,
+                                                                                          "def": 100000}
+
+    def test_empty_pool(self):
+        """Test that a pool without keys raises ValueError."""
+        with pytest.raises(ValueError, match="at least one"):
+            KeyPool([" "])
+
+    def test_get_api_key_falls_back_to_pool(self):
+        """Test that the first pooled key satisfies lookups when OMDB_API_KEY is unset."""
+        with patch.dict(os.environ, {"OMDB_API_KEY": "", "OMDB_API_KEYS": "first,second"}), \
+                patch("omdb_api.movie_search.OMDB_API_KEY", None), \
+                patch("omdb_api.movie_search._dotenv_loaded", True):
+            assert get_api_key() == "first"
+
+
+class TestClientKeyPool:
+    """Tests for OmdbClient with a key pool."""
+
+    def test_requests_use_pooled_keys(self):
+        """Test that every request carries a pooled key instead of its own."""
+        pool = KeyPool(["a", "b"])
+        with StubServer() as stub, OmdbClient(base_url=stub.url, key_pool=pool) as client:
+            for n in range(10):
+                client.request({"i": f"tt{n:07d}", "apikey": "ignored"})
+            assert stub.last_headers is not None
+
+        stats = pool.stats()
+        assert stats["a"]["requests"] + stats["b"]["requests"] == 10
+        assert all(entry["in_flight"] == 0 for entry in stats.values())
+
+    def test_rejected_key_is_replaced(self):
+        """Test that a rejected key is ejected and the request succeeds with another key."""
+        pool = KeyPool([("bad", 10000), ("good", 10)])
+        with StubServer(responder=keyed_responder({"bad": "Invalid API key!"})) as stub, \
+                OmdbClient(base_url=stub.url, key_pool=pool) as client:
+            result = client.request({"i": "tt0133093"})
+
+        assert result["Response"] == "True"
+        assert pool.stats()["bad"]["ejections"] == 1
+        assert stub.request_count == 2
+
+    def test_all_keys_rejected(self):
+        """Test that QuotaExceededError is raised once every key is rejected."""
+        pool = KeyPool(["a", "b"])
+        rejections = {"a": "Request limit reached!", "b": "Request limit reached!"}
+        with StubServer(responder=keyed_responder(rejections)) as stub, \
+                OmdbClient(base_url=stub.url, key_pool=pool) as client:
+            with pytest.raises(QuotaExceededError):
+                client.request({"i": "tt0133093"})
+
+    def test_concurrent_requests(self):
+        """Test that keys are balanced across threads and all released."""
+        pool = KeyPool(["a", "b", "c", "d"])
+        with StubServer(latency=0.01) as stub, OmdbClient(base_url=stub.url, key_pool=pool) as client:
+            threads = [threading.Thread(target=client.request, args=({"i": f"tt{n:07d}"},)) for n in range(40)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        counts = [entry["requests"] for entry in pool.stats().values()]
+        assert sum(counts) == 40
+        assert min(counts) > 0
+        assert all(entry["in_flight"] == 0 for entry in pool.stats().values())
+
+    def test_lookups_without_key_in_environment(self, tmp_path):
+        """Test that the lookup functions only need the client's key pool, with an empty environment."""
+        keys_file = tmp_path / "keys.txt"
+        keys_file.write_text("k1\nk2\n")
+        pool = KeyPool.from_file(str(keys_file))
+        seen = []
+
+        def responder(query):
+            seen.append(query.get("apikey"))
+            return default_responder(query)
+
+        with patch.dict(os.environ, {}, clear=True), \
+                patch("omdb_api.movie_search.OMDB_API_KEY", None), \
+                patch("omdb_api.movie_search._dotenv_loaded", True), \
+                StubServer(responder=responder) as stub, \
+                patch("omdb_api.movie_search.BASE_URL", stub.url):
+            client = OmdbClient(base_url=stub.url, key_pool=pool)
+            set_default_client(client)
+            try:
+                assert get_movie_by_id_or_title(movie_id="tt0111161")["imdbID"] == "tt0111161"
+                assert search_movies("Matrix")["Response"] == "True"
+                assert [item.error for item in get_many(["tt0000001"], client=client)] == [None]
+            finally:
+                set_default_client(None)
+                client.close()
+
+            # Without a key pool the missing key is still reported
+            with pytest.raises(RuntimeError, match="OMDB_API_KEY"):
+                get_movie_by_id_or_title(movie_id="tt0111161")
+
+        assert len(seen) == 3
+        assert set(seen) <= {"k1", "k2"}
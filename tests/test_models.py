@@ -0,0 +1,128 @@
+"""Tests for models module."""
+
+import datetime
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from omdb_api.models import Movie, SearchHit, parse_int, parse_score, parse_year, search_hits
+
+EXAMPLE = json.loads((Path(__file__).parent.parent / "omdb_api" / "result-example.json").read_text())
+
+
+class TestParsers:
+    """Tests for field parsers."""
+
+    def test_parse_int(self):
+        """Test integer parsing of OMDB strings."""
+        assert parse_int("1,900,000") == 1900000
+        assert parse_int("136 min") == 136
+        assert parse_int("$13,960,394") == 13960394
+        assert parse_int("N/A") is None
+        assert parse_int(None) is None
+
+    def test_parse_year(self):
+        """Test year parsing including series ranges."""
+        assert parse_year("1999") == 1999
+        assert parse_year("2008–2013") == 2008
+        assert parse_year("N/A") is None
+
+    def test_parse_score(self):
+        """Test rating normalization to a 0-100 score."""
+        assert parse_score("6.6/10") == pytest.approx(66.0)
+        assert parse_score("87%") == 87.0
+        assert parse_score("81/100") == 81.0
+        assert parse_score("bad") is None
+
+
+class TestMovie:
+    """Tests for Movie."""
+
+    def test_typed_fields(self):
+        """Test that typed values are parsed from the raw strings."""
+        movie = Movie(EXAMPLE)
+
+        assert movie.title == "Jackie"
+        assert movie.year == 2016
+        assert movie.runtime_minutes == 100
+        assert movie.imdb_rating == 6.6
+        assert movie.imdb_votes == 85973
+        assert movie.metascore == 81
+        assert movie.box_office == 13960394
+        assert movie.released == datetime.date(2016, 12, 2)
+        assert movie.genres == ("Biography", "Drama")
+        assert movie.ratings["Rotten Tomatoes"] == 87.0
+        assert movie.total_seasons is None
+
+    def test_not_available(self):
+        """Test that "N/A" values become None or empty."""
+        movie = Movie({"Title": "X", "Year": "N/A", "Runtime": "N/A", "Genre": "N/A", "Website": "N/A"})
+
+        assert movie.year is None
+        assert movie.runtime_minutes is None
+        assert movie.genres == ()
+        assert movie.poster is None
+
+    def test_parsing_is_lazy_and_cached(self):
+        """Test that nothing is parsed until a typed field is read."""
+        movie = Movie(EXAMPLE)
+        assert movie._parsed is None
+
+        assert movie.genres is movie.genres
+        assert movie._parsed is not None
+
+    def test_dict_compatible_access(self):
+        """Test that the record still behaves like the OMDB dict."""
+        movie = Movie(EXAMPLE)
+
+        assert movie["Title"] == "Jackie"
+        assert movie.get("Missing", "default") == "default"
+        assert "imdbID" in movie
+        assert "Season" not in movie
+        assert movie.to_dict() == EXAMPLE
+        assert movie == EXAMPLE
+        assert dict(movie.items()) == EXAMPLE
+        assert len(movie) == len(EXAMPLE)
+        with pytest.raises(KeyError):
+            movie["Missing"]
+
+    def test_unknown_fields_are_kept(self):
+        """Test that fields outside the model survive a round trip."""
+        episode = Movie({"Title": "Pilot", "Season": "1", "Episode": "1", "seriesID": "tt0903747"})
+
+        assert episode["Season"] == "1"
+        assert episode.to_dict()["seriesID"] == "tt0903747"
+
+    def test_uses_slots(self):
+        """Test that records carry no per-instance dict."""
+        assert not hasattr(Movie(EXAMPLE), "__dict__")
+
+    def test_pickle(self):
+        """Test that records can be pickled, e.g. for process pools."""
+        movie = Movie(EXAMPLE)
+
+        assert pickle.loads(pickle.dumps(movie)) == movie
+
+
+class TestSearchHit:
+    """Tests for SearchHit."""
+
+    def test_search_hits(self):
+        """Test wrapping the entries of a search response."""
+        response = {
+            "Search": [{"Title": "Batman Begins", "Year": "2005", "imdbID": "tt0372784", "Type": "movie",
+                        "Poster": "N/A"}],
+            "totalResults": "1",
+            "Response": "True",
+        }
+
+        hits = search_hits(response)
+
+        assert isinstance(hits[0], SearchHit)
+        assert hits[0].year == 2005
+        assert hits[0].imdb_id == "tt0372784"
+        assert hits[0].poster is None
+        assert hits[0]["Poster"] == "N/A"
+        assert search_hits({"Response": "False"}) == []
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
+import json
 import os
 import sys
 
@@ -13,15 +14,11 @@ class TestGetMovieByIdOrTitle:
     """Tests for get_movie_by_id_or_title function."""
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_get_movie_by_title(self, mock_get):
         """Test getting movie by title."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "Title": "The Matrix",
-            "Year": "1999",
-            "Response": "True"
-        }
+        mock_response.content = b'{"Title": "The Matrix", "Year": "1999", "Response": "True"}'
         mock_get.return_value = mock_response
 
         result = get_movie_by_id_or_title(title="The Matrix")
@@ -34,15 +31,11 @@ class TestGetMovieByIdOrTitle:
         assert call_params["apikey"] == "test_key"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_get_movie_by_id(self, mock_get):
         """Test getting movie by IMDb ID."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "Title": "The Matrix",
-            "imdbID": "tt0133093",
-            "Response": "True"
-        }
+        mock_response.content = b'{"Title": "The Matrix", "imdbID": "tt0133093", "Response": "True"}'
         mock_get.return_value = mock_response
 
         result = get_movie_by_id_or_title(movie_id="tt0133093")
@@ -53,11 +46,11 @@ class TestGetMovieByIdOrTitle:
         assert call_params["i"] == "tt0133093"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_get_movie_with_year(self, mock_get):
         """Test getting movie with year parameter."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True"}
+        mock_response.content = b'{"Response": "True"}'
         mock_get.return_value = mock_response
 
         get_movie_by_id_or_title(title="Batman", year=2008)
@@ -66,11 +59,11 @@ class TestGetMovieByIdOrTitle:
         assert call_params["y"] == "2008"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_get_movie_with_plot_full(self, mock_get):
         """Test getting movie with full plot."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True"}
+        mock_response.content = b'{"Response": "True"}'
         mock_get.return_value = mock_response
 
         get_movie_by_id_or_title(title="Inception", plot="full")
@@ -79,11 +72,11 @@ class TestGetMovieByIdOrTitle:
         assert call_params["plot"] == "full"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_get_movie_with_media_type(self, mock_get):
         """Test getting movie with media type filter."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True"}
+        mock_response.content = b'{"Response": "True"}'
         mock_get.return_value = mock_response
 
         get_movie_by_id_or_title(title="Breaking Bad", media_type="series")
@@ -121,11 +114,11 @@ class TestGetMovieByIdOrTitle:
             get_movie_by_id_or_title(title="Test", media_type="invalid")
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_whitespace_trimming(self, mock_get):
         """Test that whitespace is trimmed from inputs."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True"}
+        mock_response.content = b'{"Response": "True"}'
         mock_get.return_value = mock_response
 
         get_movie_by_id_or_title(title="  The Matrix  ", year="  1999  ")
@@ -139,18 +132,18 @@ class TestSearchMovies:
     """Tests for search_movies function."""
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_basic_search(self, mock_get):
         """Test basic movie search."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "Search": [
                 {"Title": "Batman Begins", "Year": "2005"},
                 {"Title": "The Dark Knight", "Year": "2008"}
             ],
             "totalResults": "2",
             "Response": "True"
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         result = search_movies("Batman")
@@ -161,11 +154,11 @@ class TestSearchMovies:
         assert call_params["s"] == "Batman"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_search_with_year(self, mock_get):
         """Test search with year filter."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True", "Search": []}
+        mock_response.content = b'{"Response": "True", "Search": []}'
         mock_get.return_value = mock_response
 
         search_movies("Batman", year=2008)
@@ -174,11 +167,11 @@ class TestSearchMovies:
         assert call_params["y"] == "2008"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_search_with_media_type(self, mock_get):
         """Test search with media type filter."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True", "Search": []}
+        mock_response.content = b'{"Response": "True", "Search": []}'
         mock_get.return_value = mock_response
 
         search_movies("Star Trek", media_type="series")
@@ -187,11 +180,11 @@ class TestSearchMovies:
         assert call_params["type"] == "series"
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_search_with_page(self, mock_get):
         """Test search with pagination."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True", "Search": []}
+        mock_response.content = b'{"Response": "True", "Search": []}'
         mock_get.return_value = mock_response
 
         search_movies("The", page=2)
@@ -241,14 +234,11 @@ class TestMain:
     """Tests for main CLI function."""
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_search_mode(self, mock_get, capsys):
         """Test CLI search mode."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "Title": "The Matrix",
-            "Response": "True"
-        }
+        mock_response.content = b'{"Title": "The Matrix", "Response": "True"}'
         mock_get.return_value = mock_response
 
         exit_code = main(["--search", "The Matrix"])
@@ -258,14 +248,11 @@ class TestMain:
         assert "The Matrix" in captured.out
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_id_mode(self, mock_get, capsys):
         """Test CLI ID mode."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "imdbID": "tt0133093",
-            "Response": "True"
-        }
+        mock_response.content = b'{"imdbID": "tt0133093", "Response": "True"}'
         mock_get.return_value = mock_response
 
         exit_code = main(["--id", "tt0133093"])
@@ -275,14 +262,11 @@ class TestMain:
         assert "tt0133093" in captured.out
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_legacy_mode(self, mock_get, capsys):
         """Test CLI legacy mode (positional arguments)."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "Title": "Inception",
-            "Response": "True"
-        }
+        mock_response.content = b'{"Title": "Inception", "Response": "True"}'
         mock_get.return_value = mock_response
 
         exit_code = main(["Inception", "2010"])
@@ -307,14 +291,111 @@ class TestMain:
         assert "Error:" in captured.err
 
     @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
-    @patch("omdb_api.movie_search.requests.get")
+    @patch("omdb_api.client.requests.Session.get")
     def test_all_options(self, mock_get, capsys):
         """Test CLI with all options."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Response": "True", "Search": []}
+        mock_response.content = b'{"Response": "True", "Search": []}'
         mock_get.return_value = mock_response
 
         exit_code = main(["--search", "Batman", "--year", "2008",
                          "--type", "movie", "--page", "1"])
 
         assert exit_code == 0
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    @patch("omdb_api.client.requests.Session.get")
+    def test_cache_dir(self, mock_get, tmp_path, capsys):
+        """Test that --cache-dir serves repeated lookups from disk."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"imdbID": "tt0133093", "Response": "True"}'
+        mock_get.return_value = mock_response
+
+        assert main(["--id", "tt0133093", "--cache-dir", str(tmp_path)]) == 0
+        assert main(["--id", "tt0133093", "--cache-dir", str(tmp_path)]) == 0
+
+        assert mock_get.call_count == 1
+        assert "tt0133093" in capsys.readouterr().out
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    @patch("omdb_api.client.requests.Session.get")
+    def test_cache_dir_unusable(self, mock_get, tmp_path, capsys):
+        """Test that a --cache-dir that cannot hold the cache is reported as an error."""
+        not_a_directory = tmp_path / "cache"
+        not_a_directory.write_text("")
+        (tmp_path / "corrupt").mkdir()
+        (tmp_path / "corrupt" / "omdb-cache.sqlite3").write_bytes(b"not a database" * 100)
+
+        assert main(["--id", "tt0133093", "--cache-dir", str(not_a_directory)]) == 1
+        assert main(["--id", "tt0133093", "--cache-dir", str(tmp_path / "corrupt")]) == 1
+        assert main(["--batch", "-", "--cache-dir", str(tmp_path / "corrupt")]) == 1
+
+        assert mock_get.call_count == 0
+        captured = capsys.readouterr()
+        assert captured.err.count("Error:") == 3
+        assert captured.out == ""
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    @patch("omdb_api.client.requests.Session.get")
+    def test_format_ndjson_fields(self, mock_get, capsys):
+        """Test that --format ndjson --fields writes one compact projected line."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"Title": "The Matrix", "Year": "1999", "imdbID": "tt0133093", "Response": "True"}'
+        mock_get.return_value = mock_response
+
+        assert main(["--id", "tt0133093", "--format", "ndjson", "--fields", "imdbID,Title"]) == 0
+
+        assert capsys.readouterr().out == '{"imdbID":"tt0133093","Title":"The Matrix"}\n'
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    def test_format_all_pages(self, capsys):
+        """Test that --page all writes one CSV row per hit across every page."""
+        from benchmarks.stub_server import StubServer
+
+        def responder(query):
+            page = int(query.get("page", 1))
+            numbers = range((page - 1) * 10, min(page * 10, 25))
+            hits = [{"Title": f"Batman {n}", "imdbID": f"tt{n:07d}"} for n in numbers]
+            return {"Search": hits, "totalResults": "25", "Response": "True"}
+
+        with StubServer(responder) as stub, patch("omdb_api.movie_search.BASE_URL", stub.url):
+            assert main(["--search", "Batman", "--type", "movie", "--page", "all", "--format", "csv",
+                         "--fields", "imdbID,Title"]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "imdbID,Title"
+        assert lines[1:] == [f"tt{n:07d},Batman {n}" for n in range(25)]
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    @patch("omdb_api.client.requests.Session.get")
+    @pytest.mark.parametrize("argv", [["--search", "zzzz", "--page", "2"],
+                                      ["--id", "tt9999999", "--format", "ndjson"]])
+    def test_fields_not_found(self, mock_get, argv, capsys):
+        """Test that --fields leaves an error response unprojected so its Error is kept."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"Response": "False", "Error": "Movie not found!"}'
+        mock_get.return_value = mock_response
+
+        assert main(argv + ["--fields", "Title,Year"]) == 0
+
+        assert json.loads(capsys.readouterr().out) == {"Response": "False", "Error": "Movie not found!"}
+
+    @patch.dict(os.environ, {"OMDB_API_KEY": "test_key"})
+    @patch("omdb_api.client.requests.Session.get")
+    def test_format_search_not_found(self, mock_get, capsys):
+        """Test that a streamed search without results reports the error on stderr."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"Response": "False", "Error": "Movie not found!"}'
+        mock_get.return_value = mock_response
+
+        assert main(["--search", "zzzz", "--year", "1999", "--format", "ndjson"]) == 1
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Movie not found!" in captured.err
+
+    def test_invalid_format(self, capsys):
+        """Test that unknown formats and --page all with json are rejected."""
+        assert main(["--search", "Batman", "--format", "xml"]) == 1
+        assert main(["--search", "Batman", "--page", "all"]) == 1
+        assert "Error:" in capsys.readouterr().err
@@ -0,0 +1,116 @@
+"""Tests for output module."""
+
+import io
+import json
+
+import pytest
+
+from omdb_api.output import NdjsonWriter, make_writer, parse_fields, project
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestFields:
+    """Tests for field projection."""
+
+    def test_parse_fields(self):
+        """Test that field lists are split and trimmed."""
+        assert parse_fields(" Title, Year ,imdbID,") == ["Title", "Year", "imdbID"]
+
+    def test_parse_fields_empty(self):
+        """Test that an empty field list is rejected."""
+        with pytest.raises(ValueError):
+            parse_fields(" , ")
+
+    def test_project(self):
+        """Test that projection keeps field order and fills missing fields with None."""
+        record = {"Title": "Heat", "Year": "1995", "Type": "movie"}
+
+        assert project(record, ["Year", "Title", "Plot"]) == {"Year": "1995", "Title": "Heat", "Plot": None}
+        assert project(record, None) is record
+
+
+class TestWriters:
+    """Tests for the record writers."""
+
+    def test_json(self):
+        """Test that json output matches the historical indent=2 output."""
+        out = io.StringIO()
+        record = {"Title": "Heat", "Response": "True"}
+
+        with make_writer("json", out) as writer:
+            writer.write(record)
+
+        assert out.getvalue() == json.dumps(record, indent=2) + "\n"
+
+    def test_ndjson(self):
+        """Test that ndjson writes one compact line per record."""
+        out = io.StringIO()
+
+        with make_writer("ndjson", out, fields=["Title"]) as writer:
+            writer.write_many([{"Title": "Heat"}, {"Title": "Amélie"}])
+
+        assert out.getvalue() == '{"Title":"Heat"}\n{"Title":"Amélie"}\n'
+
+    def test_csv(self):
+        """Test that csv takes its header from the first record and encodes nested values."""
+        out = io.StringIO()
+        records = [
+            {"Title": "Crouching Tiger, Hidden Dragon", "Ratings": [{"Source": "IMDb", "Value": "7.9/10"}]},
+            {"Title": "Heat"},
+        ]
+
+        with make_writer("csv", out) as writer:
+            writer.write_many(records)
+
+        assert out.getvalue().splitlines() == [
+            "Title,Ratings",
+            '"Crouching Tiger, Hidden Dragon","[{""Source"":""IMDb"",""Value"":""7.9/10""}]"',
+            "Heat,",
+        ]
+
+    def test_tsv(self):
+        """Test that tsv separates columns with tabs."""
+        out = io.StringIO()
+
+        with make_writer("tsv", out, fields=["imdbID", "Year"]) as writer:
+            writer.write({"Year": "1995", "imdbID": "tt0113277"})
+
+        assert out.getvalue() == "imdbID\tYear\ntt0113277\t1995\n"
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            make_writer("xml", io.StringIO())
+
+    def test_buffered_chunks(self):
+        """Test that records reach the stream in chunks, not one write per record."""
+        out = CountingStream()
+        writer = NdjsonWriter(out, chunk_size=1024)
+
+        writer.write_many({"imdbID": f"tt{n:07d}"} for n in range(1000))
+        assert out.writes < 30
+        writer.close()
+
+        assert len(out.getvalue().splitlines()) == 1000
+
+    def test_flush(self):
+        """Test that flush writes out buffered records immediately."""
+        out = io.StringIO()
+        writer = NdjsonWriter(out)
+
+        writer.write({"Title": "Heat"})
+        assert out.getvalue() == ""
+        writer.flush()
+
+        assert out.getvalue() == '{"Title":"Heat"}\n'
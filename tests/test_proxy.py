@@ -0,0 +1,178 @@
+"""Tests for proxy module."""
+
+import json
+import os
+import socket
+import threading
+import urllib.request
+from urllib.error import HTTPError
+from unittest.mock import patch
+
+import pytest
+
+import omdb_api.movie_search as movie_search
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.instrumentation import MetricsCollector
+from omdb_api.keypool import KeyPool
+from omdb_api.proxy import ProxyServer, build_client, main, proxy_params
+
+
+def recording_responder(queries):
+    """Answer like the default stub, appending every upstream query to ``queries``."""
+
+    def responder(query):
+        queries.append(query)
+        return default_responder(query)
+
+    return responder
+
+
+def get(url):
+    """Return ``(status, decoded JSON)`` for a GET request."""
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.fixture
+def worker_client():
+    """Point the lookup functions at a fresh shared client, restoring the defaults afterwards."""
+    client = OmdbClient()
+    set_default_client(client)
+    yield client
+    set_default_client(None)
+    client.close()
+
+
+class TestProxyParams:
+    """Tests for proxy_params."""
+
+    def test_forwarded_params(self):
+        """Test that only OMDB query parameters are forwarded, without the worker's key."""
+        params = proxy_params({"i": "tt0133093", "plot": "full", "apikey": "worker", "callback": "x"})
+        assert params == {"i": "tt0133093", "plot": "full", "r": "json"}
+
+    def test_missing_query(self):
+        """Test that a query without i, t or s is rejected."""
+        with pytest.raises(ValueError):
+            proxy_params({"y": "1999"})
+
+    def test_xml_rejected(self):
+        """Test that non-JSON formats are rejected."""
+        with pytest.raises(ValueError, match="JSON"):
+            proxy_params({"t": "Matrix", "r": "xml"})
+
+
+class TestProxyServer:
+    """Tests for ProxyServer."""
+
+    def test_lookup_functions_through_proxy(self, worker_client):
+        """Test that movie_search pointed at the proxy gets upstream answers with the proxy's key."""
+        queries = []
+        with StubServer(responder=recording_responder(queries)) as stub, \
+                ProxyServer(build_client(upstream=stub.url), api_key="secret", port=0) as proxy, \
+                patch.object(movie_search, "BASE_URL", proxy.url), \
+                patch.object(movie_search, "OMDB_API_KEY", "placeholder"):
+            movie = movie_search.get_movie_by_id_or_title(movie_id="tt0133093")
+            results = movie_search.search_movies("Matrix", page=2)
+
+        assert movie["imdbID"] == "tt0133093"
+        assert results["Response"] == "True"
+        assert [query["apikey"] for query in queries] == ["secret", "secret"]
+        assert queries[1]["page"] == "2"
+
+    def test_shared_cache(self):
+        """Test that repeated queries from different workers are served from the proxy cache."""
+        with StubServer() as stub, ProxyServer(build_client(upstream=stub.url), api_key="k", port=0) as proxy:
+            for _ in range(3):
+                assert get(proxy.url + "?i=tt0133093&apikey=a")[0] == 200
+            get(proxy.url + "?i=tt0133093&r=json")
+        assert stub.request_count == 1
+
+    def test_coalescing(self):
+        """Test that concurrent identical queries send one upstream request."""
+        with StubServer(latency=0.2) as stub, \
+                ProxyServer(build_client(upstream=stub.url), api_key="k", port=0) as proxy:
+            threads = [threading.Thread(target=get, args=(proxy.url + "?t=Matrix",)) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert proxy.client.single_flight.shared > 0
+        assert stub.request_count == 1
+
+    def test_bad_request(self):
+        """Test that invalid queries get an OMDB-shaped 400 without reaching upstream."""
+        with StubServer() as stub, ProxyServer(build_client(upstream=stub.url), api_key="k", port=0) as proxy:
+            status, payload = get(proxy.url + "?y=1999")
+        assert status == 400
+        assert payload["Response"] == "False"
+        assert stub.request_count == 0
+
+    def test_quota_exhausted(self):
+        """Test that an exhausted key pool answers 429."""
+        pool = KeyPool([("only", 1)])
+        with StubServer() as stub, ProxyServer(build_client(upstream=stub.url, key_pool=pool), port=0) as proxy:
+            assert get(proxy.url + "?i=tt0000001")[0] == 200
+            status, payload = get(proxy.url + "?i=tt0000002")
+        assert status == 429
+        assert payload["Error"] == "Request limit reached!"
+
+    def test_upstream_failure(self):
+        """Test that upstream errors answer 502."""
+        with StubServer(error_rate=1.0) as stub, \
+                ProxyServer(OmdbClient(base_url=stub.url), api_key="k", port=0) as proxy:
+            status, payload = get(proxy.url + "?i=tt0000001")
+        assert status == 502
+        assert "HTTPError" in payload["Error"]
+        assert proxy.errors == 1
+
+    def test_metrics_and_health(self):
+        """Test the /metrics and /healthz endpoints."""
+        metrics = MetricsCollector()
+        with StubServer() as stub, \
+                ProxyServer(build_client(upstream=stub.url, metrics=metrics), api_key="k", port=0,
+                            metrics=metrics) as proxy:
+            get(proxy.url + "?i=tt0000001")
+            get(proxy.url + "?i=tt0000001")
+            with urllib.request.urlopen(proxy.url + "metrics") as response:
+                text = response.read().decode()
+            with urllib.request.urlopen(proxy.url + "healthz") as response:
+                assert response.read() == b"ok\n"
+
+        assert "omdb_proxy_requests_total 2" in text
+        assert "omdb_proxy_cache_hits_total 1" in text
+        assert "omdb_requests_total" in text
+
+    def test_requires_key(self):
+        """Test that a proxy without a key or key pool is rejected."""
+        with pytest.raises(ValueError, match="api_key"):
+            ProxyServer(OmdbClient())
+
+
+class TestMain:
+    """Tests for the omdb-proxy entry point."""
+
+    def test_no_keys(self, capsys):
+        """Test that main fails cleanly when no API key is configured."""
+        with patch.dict(os.environ, {"OMDB_API_KEYS": "", "OMDB_API_KEY": ""}), patch("dotenv.load_dotenv"):
+            assert main([]) == 1
+        captured = capsys.readouterr()
+        assert "at least one API key" in captured.err
+        assert captured.out == ""
+
+    def test_startup_errors(self, tmp_path, capsys):
+        """Test that an unusable cache directory or a busy port is reported without a traceback."""
+        not_a_directory = tmp_path / "cache"
+        not_a_directory.write_text("")
+        with socket.socket() as busy, patch.dict(os.environ, {"OMDB_API_KEYS": "k"}), patch("dotenv.load_dotenv"):
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            assert main(["--cache-dir", str(not_a_directory)]) == 1
+            assert main(["--host", "127.0.0.1", "--port", str(busy.getsockname()[1])]) == 1
+        captured = capsys.readouterr()
+        assert captured.err.count("Error:") == 2
+        assert captured.out == ""
@@ -0,0 +1,144 @@
+"""Tests for ratelimit module."""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from omdb_api.client import OmdbClient
+from omdb_api.ratelimit import QuotaExceededError, RateLimiter
+
+
+class FakeTime:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _take_tokens(path, count):
+    limiter = RateLimiter(rate=1000, burst=1000, daily_quota=100, state_path=path)
+    taken = 0
+    for _ in range(count):
+        try:
+            limiter.acquire()
+            taken += 1
+        except QuotaExceededError:
+            pass
+    return taken
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_burst_then_throttle(self):
+        """Test that a full bucket serves a burst, then callers wait for refills."""
+        fake = FakeTime()
+        limiter = RateLimiter(rate=2, burst=3, clock=fake, sleep=fake.sleep)
+
+        for _ in range(3):
+            limiter.acquire()
+        assert fake.slept == []
+
+        limiter.acquire()
+        limiter.acquire()
+        assert fake.slept == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_reservations_queue_in_order(self):
+        """Test that concurrent reservations are spaced by the refill interval."""
+        fake = FakeTime()
+        limiter = RateLimiter(rate=10, burst=1, clock=fake, sleep=fake.sleep)
+
+        waits = [limiter._reserve() for _ in range(4)]
+
+        assert waits == [0.0, pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+    def test_daily_quota(self):
+        """Test that the quota raises once spent and resets the next UTC day."""
+        fake = FakeTime(now=1_700_006_400.0)  # 2023-11-15 00:00:00 UTC
+        limiter = RateLimiter(rate=100, daily_quota=2, clock=fake, sleep=fake.sleep)
+        limiter.acquire()
+        limiter.acquire()
+
+        with pytest.raises(QuotaExceededError, match="Daily quota of 2 requests reached"):
+            limiter.acquire()
+        assert limiter.stats()["remaining_today"] == 0
+
+        fake.now += 86400
+        limiter.acquire()
+        assert limiter.stats()["used_today"] == 1
+
+    def test_acquire_async(self):
+        """Test that the async path waits without blocking the loop."""
+        limiter = RateLimiter(rate=50, burst=1)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.035
+
+    def test_acquire_async_shared_state_off_loop(self, tmp_path):
+        """Test that the shared-state transaction does not run on the event loop thread."""
+        limiter = RateLimiter(rate=1000, daily_quota=2, state_path=str(tmp_path / "limiter.sqlite3"))
+        reserve = limiter._reserve
+        threads = []
+
+        def recording_reserve():
+            threads.append(threading.get_ident())
+            return reserve()
+
+        limiter._reserve = recording_reserve
+
+        async def run():
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+            with pytest.raises(QuotaExceededError):
+                await limiter.acquire_async()
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert len(threads) == 3
+        assert loop_thread not in threads
+        assert limiter.stats()["used_today"] == 2
+
+    def test_shared_state_across_processes(self, tmp_path):
+        """Test that processes sharing a state file share one quota."""
+        path = str(tmp_path / "limiter.sqlite3")
+        RateLimiter(rate=1000, state_path=path)
+        context = multiprocessing.get_context("spawn")
+
+        with context.Pool(3) as pool:
+            taken = pool.starmap(_take_tokens, [(path, 50)] * 3)
+
+        assert sum(taken) == 100
+
+    def test_client_waits_on_limiter(self):
+        """Test that every upstream request waits for a token."""
+        fake = FakeTime()
+        limiter = RateLimiter(rate=1, burst=1, clock=fake, sleep=fake.sleep)
+        with StubServer() as stub, OmdbClient(base_url=stub.url, rate_limiter=limiter) as client:
+            client.request({"i": "tt0000001"})
+            client.request({"i": "tt0000002"})
+
+        assert fake.slept == [pytest.approx(1.0)]
+        assert limiter.stats()["used_today"] == 2
+
+    def test_invalid_settings(self):
+        """Test that ValueError is raised for invalid settings."""
+        with pytest.raises(ValueError, match="rate"):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError, match="burst"):
+            RateLimiter(rate=1, burst=0)
@@ -0,0 +1,151 @@
+"""Tests for refresh module."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+import omdb_api.movie_search as movie_search
+from benchmarks.stub_server import StubServer
+from omdb_api.cache import TTLCache, make_cache_key
+from omdb_api.client import OmdbClient, set_default_client
+from omdb_api.ratelimit import RateLimiter
+from omdb_api.refresh import RefreshScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def api_key():
+    """Provide an API key for the lookup parameter builders."""
+    with patch.dict(os.environ, {"OMDB_API_KEY": "test_key"}):
+        yield
+
+
+@pytest.fixture
+def stub():
+    """Run a stub upstream for the duration of a test."""
+    with StubServer() as server:
+        yield server
+
+
+def movie_key(movie_id):
+    """Return the cache key of a short-plot ID lookup."""
+    return make_cache_key({"i": movie_id, "r": "json", "plot": "short"})
+
+
+class TestWarm:
+    """Tests for RefreshScheduler.warm."""
+
+    def test_warm_ids_and_titles(self, stub):
+        """Test that IDs and titles are fetched once into the cache."""
+        client = OmdbClient(base_url=stub.url, cache=TTLCache())
+        scheduler = RefreshScheduler(client)
+
+        assert scheduler.warm(["tt0133093", "The Matrix", {"title": "Heat", "year": "1995"}]) == (3, 0)
+        assert stub.request_count == 3
+        assert client.cache.expires_in(movie_key("tt0133093")) is not None
+
+        # Cached entries are not fetched again
+        assert scheduler.warm(["tt0133093"]) == (1, 0)
+        assert stub.request_count == 3
+        assert scheduler.stats()["warmed"] == 4
+
+    def test_warm_failures_are_counted(self):
+        """Test that invalid queries and unreachable upstreams count as failures."""
+        client = OmdbClient(base_url="http://127.0.0.1:1/", cache=TTLCache(), timeout=0.5)
+        assert RefreshScheduler(client).warm(["tt0133093", {"year": "1999"}]) == (0, 2)
+
+    def test_warm_respects_rate_limit(self, stub):
+        """Test that warm-up lookups take rate limiter tokens."""
+        limiter = RateLimiter(1000, burst=100)
+        client = OmdbClient(base_url=stub.url, cache=TTLCache(), rate_limiter=limiter)
+        RefreshScheduler(client).warm([f"tt{n:07d}" for n in range(20)], max_workers=4)
+        assert limiter.stats()["used_today"] == 20
+
+    def test_requires_cache(self):
+        """Test that a client without a cache is rejected."""
+        with pytest.raises(ValueError, match="cache"):
+            RefreshScheduler(OmdbClient())
+
+
+class TestRefresh:
+    """Tests for background refresh of hot entries."""
+
+    def test_hot_entries_refreshed_before_expiry(self, stub):
+        """Test that only hot entries close to expiry are refetched."""
+        clock = FakeClock()
+        client = OmdbClient(base_url=stub.url, cache=TTLCache(ttl=100, clock=clock))
+        scheduler = RefreshScheduler(client, refresh_ahead=10, min_hits=1)
+        client.refresher = scheduler
+        for _ in range(3):
+            client.request({"i": "tt0000001", "r": "json", "apikey": "k"})
+        client.request({"i": "tt0000002", "r": "json", "apikey": "k"})
+        assert stub.request_count == 2
+
+        # Nothing is close to expiry yet
+        assert scheduler.run_once() == 0
+        clock.now = 95
+        assert scheduler.run_once() == 1
+        assert stub.request_count == 3
+        assert client.cache.expires_in(make_cache_key({"i": "tt0000001", "r": "json"})) == 100
+
+    def test_most_hits_first(self):
+        """Test that due queries are ordered by access frequency."""
+        client = OmdbClient(cache=TTLCache())
+        scheduler = RefreshScheduler(client, min_hits=1)
+        for movie_id, hits in (("tt1", 1), ("tt2", 5), ("tt3", 3)):
+            params = {"i": movie_id, "r": "json"}
+            for _ in range(hits):
+                scheduler.record(make_cache_key(params), params)
+        assert [params["i"] for params, _ in scheduler.due()] == ["tt2", "tt3", "tt1"]
+
+    def test_counts_decay(self):
+        """Test that hit counts decay every cycle and cold queries are forgotten."""
+        scheduler = RefreshScheduler(OmdbClient(cache=TTLCache()), min_hits=2, decay=0.5)
+        scheduler._refresh = lambda item: None
+        params = {"i": "tt1", "r": "json"}
+        for _ in range(4):
+            scheduler.record(make_cache_key(params), params)
+        assert len(scheduler.due()) == 1
+        scheduler.run_once()
+        assert len(scheduler.due()) == 1
+        scheduler.run_once()
+        assert scheduler.due() == []
+        for _ in range(4):
+            scheduler.run_once()
+        assert scheduler.stats()["tracked"] == 0
+
+    def test_refresh_errors_counted(self):
+        """Test that failed refreshes are counted without raising."""
+        client = OmdbClient(base_url="http://127.0.0.1:1/", cache=TTLCache(), timeout=0.5)
+        scheduler = RefreshScheduler(client, min_hits=1)
+        params = {"i": "tt1", "r": "json"}
+        scheduler.record(make_cache_key(params), params)
+        assert scheduler.run_once() == 0
+        assert scheduler.stats()["errors"] == 1
+
+    def test_under_lookup_functions(self, stub):
+        """Test that a started scheduler on the shared client sees get_movie_by_id_or_title lookups."""
+        client = OmdbClient(cache=TTLCache())
+        set_default_client(client)
+        try:
+            with patch.object(movie_search, "BASE_URL", stub.url), \
+                    RefreshScheduler(interval=60, min_hits=1, refresh_ahead=3600) as scheduler:
+                assert client.refresher is scheduler
+                scheduler.warm(["tt0133093"])
+                movie_search.get_movie_by_id_or_title(movie_id="tt0133093")
+                assert stub.request_count == 1
+                assert scheduler.run_once() == 1
+            assert stub.request_count == 2
+            assert client.refresher is None
+        finally:
+            set_default_client(None)
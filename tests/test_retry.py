@@ -0,0 +1,218 @@
+"""Tests for retry module."""
+
+import socket
+
+import pytest
+import requests
+
+from benchmarks.stub_server import StubServer, default_responder
+from omdb_api.client import OmdbClient
+from omdb_api.keypool import KeyPool
+from omdb_api.ratelimit import QuotaExceededError, RateLimiter
+from omdb_api.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def flaky_responder(failures, status=503, headers=None):
+    """Fail the first ``failures`` requests with ``status``, then answer normally."""
+    calls = []
+
+    def responder(query):
+        calls.append(query)
+        if len(calls) <= failures:
+            return status, {"Response": "False", "Error": "Service unavailable"}, headers or {}
+        return default_responder(query)
+
+    return responder
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_exponential_backoff(self):
+        """Test that delays double and are capped without jitter."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.backoff(n) for n in range(4)] == [0.5, 1.0, 2.0, 3]
+
+    def test_full_jitter(self):
+        """Test that jitter scales the delay by a random fraction."""
+        policy = RetryPolicy(backoff_factor=1, random=lambda: 0.25)
+
+        assert policy.backoff(2) == 1.0
+
+    def test_retry_after(self):
+        """Test that a numeric Retry-After raises the delay."""
+        policy = RetryPolicy(backoff_factor=0.1, jitter=False)
+
+        assert policy.backoff(0, retry_after="2") == 2.0
+        assert policy.backoff(0, retry_after="Wed, 21 Oct 2015 07:28:00 GMT") == 0.1
+
+    def test_invalid_settings(self):
+        """Test that ValueError is raised for invalid settings."""
+        with pytest.raises(ValueError, match="max_retries"):
+            RetryPolicy(max_retries=-1)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.stats() == {"state": "open", "consecutive_failures": 2, "opened": 1, "rejected": 1}
+
+    def test_success_resets_failures(self):
+        """Test that a success clears the failure streak."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+    def test_half_open_trial(self):
+        """Test that one trial is allowed after reset_timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.stats()["opened"] == 2
+
+        clock.now = 20
+        assert breaker.before_call() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.before_call() is False
+
+    def test_release_trial(self):
+        """Test that a released trial lets the next call through as the trial."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.before_call() is True
+        breaker.release_trial()
+        assert breaker.before_call() is True
+        assert breaker.state == "half_open"
+
+
+class TestClientRetries:
+    """Tests for retries and circuit breaking in OmdbClient."""
+
+    def test_retries_server_errors(self):
+        """Test that 5xx responses are retried until one succeeds."""
+        policy = RetryPolicy(max_retries=3, backoff_factor=0)
+        with StubServer(responder=flaky_responder(2)) as stub, \
+                OmdbClient(base_url=stub.url, retry=policy) as client:
+            result = client.request({"i": "tt0133093"})
+
+            assert result["imdbID"] == "tt0133093"
+            assert stub.request_count == 3
+        assert policy.stats() == {"retries": 2, "exhausted": 0}
+
+    def test_retries_exhausted(self):
+        """Test that the last retryable response raises HTTPError."""
+        policy = RetryPolicy(max_retries=1, backoff_factor=0)
+        with StubServer(responder=flaky_responder(5, status=429)) as stub, \
+                OmdbClient(base_url=stub.url, retry=policy) as client:
+            with pytest.raises(requests.HTTPError, match="429"):
+                client.request({"i": "tt0133093"})
+
+            assert stub.request_count == 2
+        assert policy.stats() == {"retries": 1, "exhausted": 1}
+
+    def test_client_errors_are_not_retried(self):
+        """Test that non-retryable statuses return the body after one attempt."""
+        policy = RetryPolicy(backoff_factor=0)
+        responder = flaky_responder(1, status=401)
+        with StubServer(responder=responder) as stub, OmdbClient(base_url=stub.url, retry=policy) as client:
+            result = client.request({"i": "tt0133093"})
+
+            assert result["Response"] == "False"
+            assert stub.request_count == 1
+
+    def test_connection_errors_are_retried(self):
+        """Test that connection failures are retried and then re-raised."""
+        policy = RetryPolicy(max_retries=2, backoff_factor=0)
+        client = OmdbClient(base_url=f"http://127.0.0.1:{unused_port()}/", retry=policy)
+
+        with pytest.raises(requests.ConnectionError):
+            client.request({"i": "tt0133093"})
+        assert policy.stats() == {"retries": 2, "exhausted": 1}
+
+    def test_breaker_fails_fast(self):
+        """Test that an open breaker stops retries and later calls."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        policy = RetryPolicy(max_retries=5, backoff_factor=0)
+        with StubServer(responder=flaky_responder(100, status=500)) as stub, \
+                OmdbClient(base_url=stub.url, retry=policy, circuit_breaker=breaker) as client:
+            with pytest.raises(CircuitOpenError):
+                client.request({"i": "tt0133093"})
+            with pytest.raises(CircuitOpenError):
+                client.request({"i": "tt0133093"})
+
+            assert stub.request_count == 2
+        assert breaker.stats()["rejected"] == 2
+
+    def test_half_open_trial_quota_exceeded(self):
+        """Test that a half-open call stopped by the daily quota does not wedge the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        with StubServer() as stub, \
+                OmdbClient(base_url=stub.url, circuit_breaker=breaker,
+                           rate_limiter=RateLimiter(1000, daily_quota=0)) as client:
+            with pytest.raises(QuotaExceededError):
+                client.request({"i": "tt0133093"})
+            assert breaker.state == "half_open"
+
+            client.rate_limiter = None
+            client.key_pool = KeyPool([("only", 0)])
+            with pytest.raises(QuotaExceededError):
+                client.request({"i": "tt0133093"})
+
+            client.key_pool = None
+            assert client.request({"i": "tt0133093"})["imdbID"] == "tt0133093"
+        assert breaker.state == "closed"
+
+    def test_half_open_trial_unexpected_error(self):
+        """Test that a half-open trial failing before reaching upstream is released."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        with OmdbClient(base_url="notaurl", circuit_breaker=breaker) as client:
+            with pytest.raises(requests.RequestException):
+                client.request({"i": "tt0133093"})
+        assert breaker.before_call() is True
+
+    def test_default_timeout(self):
+        """Test that requests time out by default instead of hanging."""
+        assert OmdbClient().timeout is not None
@@ -0,0 +1,189 @@
+"""Tests for series module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from omdb_api.cache import TTLCache
+from omdb_api.catalog import Catalog
+from omdb_api.client import OmdbClient
+from omdb_api.movie_search import _build_movie_params
+from omdb_api.series import get_series_tree, iter_episodes
+
+EPISODES_PER_SEASON = {1: 3, 2: 0, 3: 2}
+
+
+def series_responder(query):
+    """Serve a three-season series whose second season OMDB cannot find."""
+    imdb_id = query["i"]
+    if imdb_id == "tt9999999":
+        return {"Response": "False", "Error": "Incorrect IMDb ID."}
+    if imdb_id.startswith("tt1"):
+        # Episode record, e.g. tt1003002 is season 3 episode 2
+        season, episode = int(imdb_id[4:6]), int(imdb_id[6:])
+        return {"Title": f"Episode {season}x{episode}", "Season": str(season), "Episode": str(episode),
+                "imdbID": imdb_id, "Plot": query.get("plot"), "Type": "episode", "Response": "True"}
+    if "Season" not in query:
+        return {"Title": "Stub Series", "imdbID": imdb_id, "Type": "series", "totalSeasons": "3",
+                "Response": "True"}
+    season = int(query["Season"])
+    if not EPISODES_PER_SEASON.get(season):
+        return {"Response": "False", "Error": "Series or season not found!"}
+    return {
+        "Title": "Stub Series",
+        "Season": str(season),
+        "totalSeasons": "3",
+        "Episodes": [
+            {"Title": f"Episode {season}x{n}", "Episode": str(n), "imdbID": f"tt1{season:03d}{n:03d}"}
+            for n in range(1, EPISODES_PER_SEASON[season] + 1)
+        ],
+        "Response": "True",
+    }
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestGetSeriesTree:
+    """Tests for get_series_tree function."""
+
+    def test_all_seasons(self):
+        """Test that every season listed in totalSeasons is fetched, in order."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            tree = get_series_tree("tt0000001", client=client)
+            requests_made = stub.request_count
+
+        assert tree["Title"] == "Stub Series"
+        assert [season["Season"] for season in tree["Seasons"]] == ["1", "2", "3"]
+        assert [episode["Episode"] for episode in tree["Seasons"][0]["Episodes"]] == ["1", "2", "3"]
+        assert tree["Seasons"][1] == {"Season": "2", "Error": "Series or season not found!"}
+        assert requests_made == 4
+
+    def test_selected_seasons(self):
+        """Test that only the requested seasons are fetched."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            tree = get_series_tree("tt0000001", seasons=[3], client=client)
+
+        assert [season["Season"] for season in tree["Seasons"]] == ["3"]
+
+    def test_episode_details(self):
+        """Test that episodes=True replaces season entries with full episode records."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            tree = get_series_tree("tt0000001", plot="full", episodes=True, max_workers=2, client=client)
+
+        episodes = tree["Seasons"][2]["Episodes"]
+        assert [episode["imdbID"] for episode in episodes] == ["tt1003001", "tt1003002"]
+        assert episodes[0]["Plot"] == "full"
+        assert "Episodes" not in tree["Seasons"][1]
+
+    def test_missing_series(self):
+        """Test that the OMDB error response is returned for an unknown series."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            tree = get_series_tree("tt9999999", client=client)
+
+        assert tree == {"Response": "False", "Error": "Incorrect IMDb ID."}
+
+    def test_reuses_cache(self):
+        """Test that a second tree is served from the client's cache."""
+        with StubServer(responder=series_responder) as stub, \
+                OmdbClient(base_url=stub.url, cache=TTLCache()) as client:
+            first = get_series_tree("tt0000001", episodes=True, client=client)
+            requests_made = stub.request_count
+            second = get_series_tree("tt0000001", episodes=True, client=client)
+
+            assert stub.request_count == requests_made
+        assert second == first
+
+    def test_with_catalog(self, tmp_path):
+        """Test that a catalog holding the series record does not answer its season lookups."""
+        catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+        catalog.add_many([{"Title": "Stub Series", "Year": "2001–2003", "imdbID": "tt0000001", "Type": "series",
+                           "totalSeasons": "3", "imdbVotes": "1,000", "Response": "True"}])
+        with StubServer(responder=series_responder) as stub, \
+                OmdbClient(base_url=stub.url, catalog=catalog) as client:
+            tree = get_series_tree("tt0000001", client=client)
+
+            assert stub.request_count == 3
+        catalog.close()
+        assert tree["Title"] == "Stub Series"
+        assert [len(season.get("Episodes", [])) for season in tree["Seasons"]] == [3, 0, 2]
+
+    def test_invalid_seasons(self):
+        """Test that invalid season numbers raise ValueError."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            with pytest.raises(ValueError, match="seasons must be"):
+                get_series_tree("tt0000001", seasons=[0], client=client)
+
+    def test_invalid_max_workers(self):
+        """Test that a non-positive max_workers raises ValueError."""
+        with pytest.raises(ValueError, match="max_workers"):
+            get_series_tree("tt0000001", max_workers=0)
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestIterEpisodes:
+    """Tests for iter_episodes function."""
+
+    def test_compact_entries(self):
+        """Test that compact entries are yielded in order with their season number."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            episodes = list(iter_episodes("tt0000001", client=client))
+
+        assert [(episode["Season"], episode["Episode"]) for episode in episodes] == [
+            ("1", "1"), ("1", "2"), ("1", "3"), ("3", "1"), ("3", "2"),
+        ]
+
+    def test_details(self):
+        """Test that details=True yields full episode records."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            episodes = list(iter_episodes("tt0000001", details=True, client=client))
+
+        assert [episode["Type"] for episode in episodes] == ["episode"] * 5
+
+    def test_unidentified_entries_are_errors(self):
+        """Test that an entry without imdbID or Episode is reported instead of requesting the season again."""
+
+        def responder(query):
+            response = series_responder(query)
+            if query.get("Season") == "3":
+                response["Episodes"].append({"Title": "Special", "imdbID": "N/A"})
+            return response
+
+        with StubServer(responder=responder) as stub, OmdbClient(base_url=stub.url) as client:
+            episodes = list(iter_episodes("tt0000001", seasons=[3], details=True, client=client))
+            requests_made = stub.request_count
+
+        assert [episode.get("imdbID") for episode in episodes] == ["tt1003001", "tt1003002", "N/A"]
+        assert episodes[-1] == {"Season": "3", "Title": "Special", "imdbID": "N/A", "Response": "False",
+                                "Error": "Episode has no IMDb ID or episode number!"}
+        assert requests_made == 4
+
+    def test_lazy(self):
+        """Test that nothing is requested before iteration starts."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            episodes = iter_episodes("tt0000001", client=client)
+            assert stub.request_count == 0
+            assert next(episodes)["Episode"] == "1"
+            episodes.close()
+
+    def test_missing_series(self):
+        """Test that an unknown series raises ValueError once iterated."""
+        with StubServer(responder=series_responder) as stub, OmdbClient(base_url=stub.url) as client:
+            with pytest.raises(ValueError, match="Series not found"):
+                list(iter_episodes("tt9999999", client=client))
+
+
+class TestSeasonParams:
+    """Tests for season and episode lookup parameters."""
+
+    @patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+    def test_season_and_episode(self):
+        """Test that season and episode are added to the query."""
+        params = _build_movie_params(movie_id="tt0000001", season=2, episode="5")
+        assert params["Season"] == "2"
+        assert params["Episode"] == "5"
+
+    @patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+    def test_episode_requires_season(self):
+        """Test that an episode without a season raises ValueError."""
+        with pytest.raises(ValueError, match="episode requires season"):
+            _build_movie_params(movie_id="tt0000001", episode=1)
@@ -0,0 +1,181 @@
+"""Tests for singleflight module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from omdb_api.client import OmdbClient
+from omdb_api.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_threads(count, target):
+    """Start ``count`` threads behind a barrier and return their results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(n):
+        barrier.wait()
+        try:
+            results[n] = target()
+        except Exception as e:
+            results[n] = e
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that concurrent callers with the same key share one call."""
+        group = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"Response": "True"}
+
+        results = run_threads(10, lambda: group.do("key", fetch))
+
+        assert len(calls) == 1
+        assert all(result == {"Response": "True"} for result in results)
+        assert group.stats() == {"calls": 1, "shared": 9}
+
+    def test_followers_get_copies(self):
+        """Test that a follower modifying its result does not affect the others."""
+        group = SingleFlight()
+
+        def fetch():
+            time.sleep(0.1)
+            return {"Ratings": [{"Source": "IMDb"}]}
+
+        def call():
+            result = group.do("key", fetch)
+            result["Ratings"].append({"Source": "mine"})
+            return result
+
+        results = run_threads(5, call)
+
+        assert all(len(result["Ratings"]) == 2 for result in results)
+        assert len({id(result) for result in results}) == 5
+
+    def test_errors_are_shared(self):
+        """Test that followers receive the leader's exception."""
+        group = SingleFlight()
+
+        def fetch():
+            time.sleep(0.1)
+            raise RuntimeError("upstream down")
+
+        results = run_threads(5, lambda: group.do("key", fetch))
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert group.stats()["calls"] == 1
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call does not serve later callers."""
+        group = SingleFlight()
+
+        assert group.do("key", lambda: 1) == 1
+        assert group.do("key", lambda: 2) == 2
+        assert group.stats() == {"calls": 2, "shared": 0}
+
+    def test_client_coalesces_identical_requests(self):
+        """Test that a herd of identical client requests hits upstream once."""
+        with StubServer(latency=0.1) as stub, \
+                OmdbClient(base_url=stub.url, single_flight=SingleFlight()) as client:
+            results = run_threads(20, lambda: client.request({"t": "The Matrix", "apikey": "k"}))
+
+            assert all(result["Title"] == "The Matrix" for result in results)
+            assert stub.request_count == 1
+
+
+class TestAsyncSingleFlight:
+    """Tests for AsyncSingleFlight."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that concurrent coroutines with the same key share one call."""
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"Response": "True"}
+
+        async def run():
+            return await asyncio.gather(*(group.do("key", fetch) for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(result == {"Response": "True"} for result in results)
+        assert len({id(result) for result in results}) == 10
+        assert group.stats() == {"calls": 1, "shared": 9}
+
+    def test_errors_are_shared(self):
+        """Test that followers receive the leader's exception."""
+        group = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("upstream down")
+
+        async def run():
+            return await asyncio.gather(*(group.do("key", fetch) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_cancelled_follower_does_not_cancel_leader(self):
+        """Test that cancelling a follower leaves the shared call running."""
+        group = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.ensure_future(group.do("key", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(group.do("key", fetch))
+            await asyncio.sleep(0)
+            follower.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await follower
+            return await leader
+
+        assert asyncio.run(run()) == "done"
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the leader leaves the shared call running for the followers."""
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.ensure_future(group.do("key", fetch))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(group.do("key", fetch)) for _ in range(3)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await asyncio.gather(*followers)
+
+        assert asyncio.run(run()) == ["done"] * 3
+        assert len(calls) == 1
@@ -0,0 +1,107 @@
+"""Tests for title_index module."""
+
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubServer
+from omdb_api.catalog import Catalog
+from omdb_api.client import OmdbClient
+from omdb_api.title_index import TitleIndex
+
+
+def entry(imdb_id, title, year="1999", kind="movie", votes=None):
+    """Build a search entry, with votes when given."""
+    hit = {"Title": title, "Year": year, "imdbID": imdb_id, "Type": kind, "Poster": "N/A"}
+    if votes is not None:
+        hit["imdbVotes"] = votes
+    return hit
+
+
+ENTRIES = [
+    entry("tt0133093", "The Matrix", votes="2,000,000"),
+    entry("tt0234215", "The Matrix Reloaded", year="2003", votes="600,000"),
+    entry("tt0242653", "The Matrix Revolutions", year="2003", votes="500,000"),
+    entry("tt0106062", "Matrix", year="1993–1997", kind="series"),
+    entry("tt0113277", "Heat", year="1995", votes="700,000"),
+    entry("tt0372784", "Batman Begins", year="2005", votes="1,500,000"),
+]
+
+
+def titles(result):
+    """Return the titles of a search response, in order."""
+    return [hit["Title"] for hit in result["Search"]] if result else []
+
+
+class TestTitleIndex:
+    """Tests for TitleIndex searches."""
+
+    def setup_method(self):
+        self.index = TitleIndex()
+        self.index.add_many(ENTRIES)
+
+    def test_exact_words(self):
+        """Test that every query word must match and the response keeps OMDB's shape."""
+        result = self.index.search("matrix reloaded")
+
+        expected = {key: value for key, value in ENTRIES[1].items() if key != "imdbVotes"}
+        assert result == {"Search": [expected], "totalResults": "1", "Response": "True"}
+
+    def test_ranking(self):
+        """Test that fully covered and popular titles rank first."""
+        assert titles(self.index.search("the matrix"))[0] == "The Matrix"
+        assert titles(self.index.search("matrix"))[:2] == ["The Matrix", "The Matrix Reloaded"]
+        assert titles(self.index.search("matrix", year=1993)) == ["Matrix"]
+
+    def test_prefix(self):
+        """Test that the last query word matches as a prefix."""
+        assert titles(self.index.search("matrix rel")) == ["The Matrix Reloaded"]
+        assert set(titles(self.index.search("matrix re"))) == {"The Matrix Reloaded", "The Matrix Revolutions"}
+
+    def test_fuzzy(self):
+        """Test that misspelled words match titles within a small edit distance."""
+        assert titles(self.index.search("matirx relodaed")) == ["The Matrix Reloaded"]
+        assert titles(self.index.search("batmn begns")) == ["Batman Begins"]
+        assert self.index.search("zzzzzz") is None
+
+    def test_filters(self):
+        """Test that year and media_type filter like search_movies."""
+        assert titles(self.index.search("matrix", year=2003)) == ["The Matrix Reloaded", "The Matrix Revolutions"]
+        assert titles(self.index.search("matrix", media_type="series")) == ["Matrix"]
+        assert self.index.search("matrix", media_type="game") is None
+
+    def test_pages(self):
+        """Test that results are paginated and totalResults counts every match."""
+        first = self.index.search("matrix", limit=2)
+        second = self.index.search("matrix", page=2, limit=2)
+
+        assert first["totalResults"] == second["totalResults"] == "4"
+        assert len(titles(first) + titles(second)) == 4
+        assert self.index.search("matrix", page=3, limit=2) is None
+
+    def test_replace_and_add_response(self):
+        """Test that re-adding an imdbID replaces it and responses are indexed."""
+        self.index.add(entry("tt0113277", "Heat Wave", year="1995"))
+        added = self.index.add_response({"Search": [entry("tt0000001", "Wave Runner")], "Response": "True"})
+
+        assert added == 1
+        assert len(self.index) == 7
+        assert titles(self.index.search("heat")) == ["Heat Wave"]
+        assert self.index.add_response({"Response": "False", "Error": "Movie not found!"}) == 0
+
+
+@patch("omdb_api.movie_search.OMDB_API_KEY", "test_key")
+class TestIntegration:
+    """Tests for building from a catalog and answering client searches."""
+
+    def test_catalog_entries_and_client(self, tmp_path):
+        """Test that an index built from a catalog answers client searches locally."""
+        catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+        catalog.add_many([dict(hit, Response="True") for hit in ENTRIES])
+        index = TitleIndex()
+        assert index.add_many(catalog.entries()) == len(ENTRIES)
+
+        with StubServer() as stub, OmdbClient(base_url=stub.url, catalog=index) as client:
+            result = client.request({"s": "batmn", "r": "json", "apikey": "k"})
+            client.request({"i": "tt0133093", "r": "json", "apikey": "k"})
+
+            assert titles(result) == ["Batman Begins"]
+            assert stub.request_count == 1